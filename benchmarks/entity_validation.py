@@ -0,0 +1,74 @@
+"""Compare validating a page of entities one model call at a time with validating the whole list at once.
+
+Run with ``make validation-benchmark`` or ``python -m benchmarks.entity_validation [count] [runs]``.
+"""
+
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from src.client.entities import ENTITIES
+from src.models.entities import EntityResult
+
+
+def make_entities(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "identifier": f"service-{i}",
+            "title": f"Service {i}",
+            "icon": "Service",
+            "blueprint": "service",
+            "team": ["platform"],
+            "properties": {"tier": "gold", "replicas": i % 5, "public": i % 2 == 0, "tags": ["pci", "eu"]},
+            "relations": {"domain": "billing", "dependencies": [f"service-{i - 1}"]},
+            "createdAt": "2024-01-01T00:00:00.000Z",
+            "createdBy": "user@example.com",
+            "updatedAt": "2024-01-02T00:00:00.000Z",
+            "updatedBy": "user@example.com",
+        }
+        for i in range(count)
+    ]
+
+
+def median_ms(validate: Callable[[], Any], runs: int) -> float:
+    validate()
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        validate()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+    entities = make_entities(count)
+    body = json.dumps(entities).encode()
+
+    # The client validates the parsed responses it keeps as dicts, parsing and validating the bytes is shown for reference
+    cases = {
+        "parsed response": {
+            "one model call per entity": lambda: [EntityResult(**entity) for entity in entities],
+            "list adapter": lambda: ENTITIES.validate_python(entities),
+        },
+        "response bytes, parsing included": {
+            "one model call per entity": lambda: [EntityResult(**entity) for entity in json.loads(body)],
+            "list adapter": lambda: ENTITIES.validate_python(json.loads(body)),
+            "list adapter from JSON": lambda: ENTITIES.validate_json(body),
+        },
+    }
+    print(f"Validating {count} entities, median of {runs} runs")
+    for case, validators in cases.items():
+        print(f"\n{case}")
+        baseline = median_ms(validators["one model call per entity"], runs)
+        for name, validate in validators.items():
+            elapsed = baseline if name == "one model call per entity" else median_ms(validate, runs)
+            print(f"  {name:<28} {elapsed:>8.1f} ms {baseline / elapsed:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
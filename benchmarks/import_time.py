@@ -0,0 +1,52 @@
+"""Measure how long importing the server's packages takes, each in a fresh interpreter.
+
+Run with ``make import-benchmark`` or ``python -m benchmarks.import_time [runs]``.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+MODULES = ["src.models", "src.client", "src.tools", "src.server"]
+MEASURE = """
+import time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+from pydantic import BaseModel
+def subclasses(cls):
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from subclasses(sub)
+models = [model for model in subclasses(BaseModel) if model.__module__.startswith("src.")]
+built = sum(model.__pydantic_complete__ for model in models)
+print(elapsed, built, len(models))
+"""
+
+
+def measure(module: str) -> tuple[float, int, int]:
+    # Without credentials the server doesn't fetch the actions while it's imported
+    env = {key: value for key, value in os.environ.items() if key not in ("PORT_CLIENT_ID", "PORT_CLIENT_SECRET")}
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE.format(module=module)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return float(output[-3]), int(output[-2]), int(output[-1])
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"{'module':<12} {'median ms':>10} {'min ms':>8} {'models built':>14}")
+    for module in MODULES:
+        results = [measure(module) for _ in range(runs)]
+        times = [elapsed * 1000 for elapsed, _, _ in results]
+        _, built, total = results[-1]
+        print(f"{module:<12} {statistics.median(times):>10.0f} {min(times):>8.0f} {f'{built}/{total}':>14}")
+
+
+if __name__ == "__main__":
+    main()
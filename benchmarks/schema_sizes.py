@@ -0,0 +1,28 @@
+"""Report the size of each tool's input and output schema, fully inlined and compact.
+
+Run with ``make schema-report`` or ``python -m benchmarks.schema_sizes``.
+"""
+
+from src.client.client import PortClient
+from src.models.tools import ToolMap
+from src.utils.schema import schema_sizes
+
+
+def main() -> None:
+    # Without credentials no actions are fetched, only the static tools are reported
+    tools = ToolMap(port_client=PortClient(), catalog_mode=True).get_tools()
+    rows = []
+    for tool in tools:
+        for kind, model in (("input", tool.input_schema), ("output", tool.output_schema)):
+            rows.append((tool.name, kind, *schema_sizes(model)))
+
+    print(f"{'tool':<28} {'schema':<7} {'inlined':>9} {'compact':>9} {'saved':>7}")
+    for name, kind, inlined, compact in rows:
+        print(f"{name:<28} {kind:<7} {inlined:>9} {compact:>9} {1 - compact / inlined:>7.0%}")
+    inlined_total = sum(row[2] for row in rows)
+    compact_total = sum(row[3] for row in rows)
+    print(f"{'total':<36} {inlined_total:>9} {compact_total:>9} {1 - compact_total / inlined_total:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,17 @@
 This module provides an MCP server for interacting with Port.io.
 """
 
-__version__ = "0.2.7"
+from typing import Any
 
-from .server import main
+__version__ = "0.2.7"
 
 __all__ = ["main"]
+
+
+def __getattr__(name: str) -> Any:
+    # The server and the MCP SDK are imported when the server starts, not with every submodule
+    if name == "main":
+        from .server import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
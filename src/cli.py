@@ -4,7 +4,6 @@ Command-line interface for the Port.io MCP Server.
 
 import argparse
 
-from src import main
 from src.config.server_config import McpServerConfig, init_server_config
 
 
@@ -16,6 +15,41 @@ def parse_args():
     parser.add_argument("--region", default="EU", help="Port.io API region (EU or US)")
     parser.add_argument("--log-level", default="ERROR", help="Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)")
     parser.add_argument("--api-validation-enabled", default="False", help="Enable API validation")
+    parser.add_argument(
+        "--shared-cache-enabled", default="False", help="Share tokens and metadata with other server processes on this host"
+    )
+    parser.add_argument("--shared-cache-ttl", default=300, type=int, help="Time to live in seconds for shared metadata")
+    parser.add_argument("--cache-dir", default=None, help="Directory for on-disk caches")
+    parser.add_argument("--snapshot-enabled", default="False", help="Persist the tool catalog for warm starts")
+    parser.add_argument("--snapshot-interval", default=600, type=int, help="Seconds between periodic catalog snapshots")
+    parser.add_argument("--http-pool-size", default=10, type=int, help="Maximum connections kept open to the Port API")
+    parser.add_argument(
+        "--http-keepalive-expiry", default=60, type=int, help="Seconds an idle connection to the Port API is reused"
+    )
+    parser.add_argument(
+        "--http-prewarm-connections", default=0, type=int, help="Connections to the Port API to open at startup"
+    )
+    parser.add_argument(
+        "--batch-max-concurrency", default=5, type=int, help="Calls of one batch tool call that run at the same time"
+    )
+    parser.add_argument(
+        "--response-max-bytes",
+        default=200_000,
+        type=int,
+        help="Size in bytes tool responses are shaped to fit in, 0 disables shaping",
+    )
+    parser.add_argument(
+        "--result-store-max-bytes",
+        default=50_000_000,
+        type=int,
+        help="Size in bytes of the truncated lists kept to page through",
+    )
+    parser.add_argument(
+        "--result-store-ttl", default=900, type=int, help="Seconds a truncated list is kept after it was last read"
+    )
+    parser.add_argument(
+        "--tool-catalog-mode", default="False", help="List the action tools only once they're found with search_tools"
+    )
 
     return parser.parse_args()
 
@@ -34,8 +68,25 @@ def cli_main():
             region=args.region,
             log_level=args.log_level,
             api_validation_enabled=args.api_validation_enabled.lower() == "true",
+            shared_cache_enabled=args.shared_cache_enabled.lower() == "true",
+            shared_cache_ttl=args.shared_cache_ttl,
+            cache_dir=args.cache_dir,
+            snapshot_enabled=args.snapshot_enabled.lower() == "true",
+            snapshot_interval=args.snapshot_interval,
+            http_pool_size=args.http_pool_size,
+            http_keepalive_expiry=args.http_keepalive_expiry,
+            http_prewarm_connections=args.http_prewarm_connections,
+            batch_max_concurrency=args.batch_max_concurrency,
+            response_max_bytes=args.response_max_bytes,
+            result_store_max_bytes=args.result_store_max_bytes,
+            result_store_ttl=args.result_store_ttl,
+            tool_catalog_mode=args.tool_catalog_mode.lower() == "true",
         ).model_dump()
     )
+    # The configuration above is applied in place, so the modules holding it see it. The server is imported
+    # after it because importing it builds the client and the tool map from the configuration
+    from src import main
+
     # Call the main function with command-line arguments
     main()
 
@@ -0,0 +1,122 @@
+"""Shared polling of action run statuses."""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from src.models.action_run import ActionRun
+from src.utils import logger
+
+ActionRunUpdate = ActionRun | Exception
+
+
+@dataclass
+class WatchedRun:
+    run_id: str
+    poll_interval: float
+    max_poll_interval: float
+    interval: float
+    next_poll_at: float = 0
+    latest: ActionRun | None = None
+    subscribers: list[asyncio.Queue[ActionRunUpdate]] = field(default_factory=list)
+
+
+class ActionRunPoller:
+    """Polls every watched action run on one schedule and fans the updates out to all subscribers.
+
+    However many tool calls wait on the same run, it's requested once per poll. Each run backs off
+    exponentially while its status doesn't change. The runs API has no lookup of several runs by id,
+    so due runs are fetched together with bounded concurrency instead of in one batched request.
+    """
+
+    def __init__(self, fetch_run: Callable[[str], Awaitable[ActionRun]], max_concurrency: int = 10):
+        self._fetch_run = fetch_run
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._runs: dict[str, WatchedRun] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @asynccontextmanager
+    async def subscribe(
+        self,
+        run_id: str,
+        poll_interval: float = 1,
+        max_poll_interval: float = 30,
+        current_interval: float | None = None,
+    ) -> AsyncIterator[asyncio.Queue[ActionRunUpdate]]:
+        """Watch a run, the queue receives the run on every status change or the error that stopped polling it.
+
+        The intervals only apply when the run isn't watched yet, otherwise the subscriber joins the
+        existing schedule. ``current_interval`` continues a backoff from a previous watch.
+        """
+        queue: asyncio.Queue[ActionRunUpdate] = asyncio.Queue()
+        run = self._runs.get(run_id)
+        if run is None:
+            run = WatchedRun(run_id, poll_interval, max_poll_interval, interval=current_interval or poll_interval)
+            self._runs[run_id] = run
+            self._wakeup.set()
+        elif run.latest is not None:
+            # Late subscribers start from the latest known status instead of waiting for the next change
+            queue.put_nowait(run.latest)
+        run.subscribers.append(queue)
+        self._ensure_running()
+        try:
+            yield queue
+        finally:
+            run.subscribers.remove(queue)
+            if not run.subscribers and self._runs.get(run_id) is run:
+                del self._runs[run_id]
+
+    def latest(self, run_id: str) -> ActionRun | None:
+        run = self._runs.get(run_id)
+        return run.latest if run else None
+
+    def interval(self, run_id: str) -> float | None:
+        run = self._runs.get(run_id)
+        return run.interval if run else None
+
+    @property
+    def watched_run_ids(self) -> list[str]:
+        return list(self._runs)
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._poll_loop())
+
+    async def _poll_loop(self) -> None:
+        while self._runs:
+            now = time.monotonic()
+            due = [run for run in self._runs.values() if run.next_poll_at <= now]
+            if due:
+                await asyncio.gather(*(self._poll(run) for run in due))
+                continue
+            next_poll_at = min(run.next_poll_at for run in self._runs.values())
+            self._wakeup.clear()
+            # New subscriptions wake the loop up, so their first poll isn't delayed
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), next_poll_at - now)
+        logger.debug("No action runs left to watch, stopping the poller")
+
+    async def _poll(self, run: WatchedRun) -> None:
+        try:
+            async with self._semaphore:
+                action_run = await self._fetch_run(run.run_id)
+        except Exception as e:
+            logger.warning(f"Failed to poll action run {run.run_id}: {e}")
+            self._runs.pop(run.run_id, None)
+            for queue in run.subscribers:
+                queue.put_nowait(e)
+            return
+
+        if run.latest is None or action_run.status != run.latest.status:
+            if run.latest is not None:
+                run.interval = run.poll_interval
+            for queue in run.subscribers:
+                queue.put_nowait(action_run)
+        else:
+            run.interval = min(run.interval * 2, run.max_poll_interval)
+        run.latest = action_run
+        run.next_poll_at = time.monotonic() + run.interval
@@ -3,27 +3,46 @@ from typing import Any
 
 from pyport import PortClient
 
+from src.client.metadata import MetadataStore
 from src.config import config
 from src.models.actions import Action
-from src.utils import logger
+from src.models.actions.action import ActionSummary
+from src.models.common import list_adapter
+from src.utils import SharedCache, logger
+from src.utils.shared_cache import fetch_cached
+
+ACTIONS = list_adapter(Action)
 
 
 class PortActionClient:
-    def __init__(self, client: PortClient):
+    def __init__(self, client: PortClient, cache: SharedCache | None = None, metadata: MetadataStore | None = None):
         self._client = client
+        self._cache = cache
+        self._metadata = metadata or MetadataStore()
+
+    def _invalidate_cache(self, action_identifier: str | None) -> None:
+        self._metadata.clear_actions()
+        if self._cache:
+            self._cache.delete_prefix("actions:")
+            self._cache.delete(f"action:{action_identifier}")
+
+    def _get_json(self, endpoint: str) -> Any:
+        return self._client.make_request("GET", endpoint).json()
 
     async def _get_user_permissions(self) -> list[str]:
         """Get user permissions from auth endpoint"""
         logger.info("Getting user permissions")
 
-        response = self._client.make_request("GET", "auth/permissions?action_version=v2")
-        result = response.json()
+        result = fetch_cached(
+            self._cache, "permissions", lambda: self._get_json("auth/permissions?action_version=v2")
+        )
         if result.get("ok"):
             permissions = result.get("permissions", [])
             logger.debug(f"listed permissions: {permissions}")
             if not isinstance(permissions, list):
                 logger.warning("Permissions response is not a list")
                 return []
+            self._metadata.set_permissions(permissions)
             return permissions
         else:
             logger.warning("Failed to get user permissions")
@@ -36,11 +55,20 @@ class PortActionClient:
 
         return execute_action_permission in permissions or team_execute_permission in permissions
 
+    async def get_action_summaries(self, trigger_type: str = "self-service") -> list[ActionSummary]:
+        """Summaries of the actions the user may run, from the metadata index unless it's out of date."""
+        summaries = self._metadata.action_summaries(trigger_type)
+        if summaries is None:
+            await self.get_all_actions(trigger_type)
+            summaries = self._metadata.action_summaries(trigger_type) or []
+        return [ActionSummary.construct(**summary) for summary in summaries]
+
     async def get_all_actions(self, trigger_type: str = "self-service") -> list[Action]:
         logger.info("Getting all actions")
 
-        response = self._client.make_request("GET", f"actions?trigger_type={trigger_type}")
-        result = response.json().get("actions", [])
+        result = fetch_cached(
+            self._cache, f"actions:{trigger_type}", lambda: self._get_json(f"actions?trigger_type={trigger_type}")
+        ).get("actions", [])
 
         user_permissions = await self._get_user_permissions()
 
@@ -51,10 +79,11 @@ class PortActionClient:
                 filtered_actions.append(action_data)
             else:
                 logger.debug(f"User lacks permission for action: {action_identifier}")
+        self._metadata.set_actions(trigger_type, filtered_actions)
 
         if config.api_validation_enabled:
             logger.debug("Validating actions")
-            return [Action(**action) for action in filtered_actions]
+            return ACTIONS.validate_python(filtered_actions)
         else:
             logger.debug("Skipping API validation for actions")
             return [Action.construct(**action) for action in filtered_actions]
@@ -62,8 +91,9 @@ class PortActionClient:
     async def get_action(self, action_identifier: str) -> Action:
         logger.info(f"Getting action: {action_identifier}")
 
-        response = self._client.make_request("GET", f"actions/{action_identifier}")
-        result = response.json().get("action")
+        result = fetch_cached(
+            self._cache, f"action:{action_identifier}", lambda: self._get_json(f"actions/{action_identifier}")
+        ).get("action")
 
         if config.api_validation_enabled:
             logger.debug("Validating action")
@@ -85,6 +115,7 @@ class PortActionClient:
             message = f"Failed to create action: {result}"
             logger.warning(message)
         logger.info("Action created in Port")
+        self._invalidate_cache(action_data.get("identifier"))
 
         result = result.get("action", {})
 
@@ -112,6 +143,7 @@ class PortActionClient:
             message = f"Failed to update action: {result}"
             logger.warning(message)
         logger.info(f"Action '{action_identifier}' updated in Port")
+        self._invalidate_cache(action_identifier)
 
         result = result.get("action", {})
         if config.api_validation_enabled:
@@ -133,5 +165,6 @@ class PortActionClient:
             message = f"Failed to delete action: {result}"
             logger.warning(message)
         logger.info(f"Action '{action_identifier}' deleted from Port")
+        self._invalidate_cache(action_identifier)
 
         return True
\ No newline at end of file
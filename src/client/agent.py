@@ -1,19 +1,89 @@
+import json
 import re
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
 from pyport import PortClient
+from pyport.exceptions import PortApiError
 
 from src.config import config
-from src.models.agent.port_agent_response import PortAgentResponse, PortAgentTriggerResponse
+from src.models.agent.port_agent_response import (
+    PortAgentResponse,
+    PortAgentStreamChunk,
+    PortAgentTriggerResponse,
+)
 from src.utils import logger
 from src.utils.errors import PortError
 
+# Status codes the invoke endpoint answers a streaming request with when it doesn't support streaming
+STREAM_UNSUPPORTED_STATUS_CODES = {400, 404, 405, 406, 415, 501}
+STREAM_TEXT_FIELDS = ["content", "text", "delta", "message"]
+
+
+def parse_sse(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Group the lines of a server-sent events stream into (event, data) pairs."""
+    event = "message"
+    data: list[str] = []
+    for line in lines:
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = "message", []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if field == "event":
+            event = value
+        elif field == "data":
+            data.append(value)
+    if data:
+        yield event, "\n".join(data)
+
+
+def _parse_stream_data(data: str) -> Any:
+    try:
+        return json.loads(data)
+    except ValueError:
+        return data
+
+
+def _stream_identifier(payload: dict[str, Any]) -> str | None:
+    invocation = payload.get("invocation")
+    if isinstance(invocation, dict) and invocation.get("identifier"):
+        return str(invocation["identifier"])
+    identifier = payload.get("invocationIdentifier") or payload.get("identifier")
+    return str(identifier) if identifier else None
+
+
+def _stream_text(payload: Any) -> str:
+    if isinstance(payload, str):
+        return payload
+    if isinstance(payload, dict):
+        for field in STREAM_TEXT_FIELDS:
+            if isinstance(payload.get(field), str):
+                return str(payload[field])
+    return ""
+
+
+def _action_url(message: str) -> str | None:
+    # Generate action URL from port URLs in message if present
+    # Necesarry to continue the interaction with the agent
+    # Present them is the response for the agent to take action
+    if not message:
+        return None
+    urls = re.findall(r'https://app\.getport\.io/self-serve[^\s<>"]*', message)
+    return urls[0] if urls else None
+
 
 class PortAgentClient:
     _client: PortClient
 
     def __init__(self, client: PortClient):
         self._client = client
+        # Unknown until the first streaming invocation, skip the attempt once the API turned it down
+        self._streaming_supported: bool | None = None
 
     async def trigger_agent(self, prompt: str) -> PortAgentTriggerResponse:
         endpoint = "agent/invoke"
@@ -21,8 +91,9 @@ class PortAgentClient:
 
         response = self._client.make_request(method="POST", endpoint=endpoint, json=data)
 
-        response_data: dict[str, Any] = response.json()
+        return self._parse_trigger_response(response.json())
 
+    def _parse_trigger_response(self, response_data: dict[str, Any]) -> PortAgentTriggerResponse:
         if not response_data.get("ok") or not response_data.get("invocation", {}).get("identifier"):
             logger.error("Response missing required invocation identifier")
             logger.error(f"Response data: {response_data}")
@@ -35,6 +106,97 @@ class PortAgentClient:
             logger.error(f"Response data: {response_data}")
             raise PortError(f"Invalid response format: {response_data}") from e
 
+    async def stream_agent(
+        self, prompt: str, on_chunk: Callable[[PortAgentStreamChunk], None]
+    ) -> PortAgentResponse | PortAgentTriggerResponse:
+        """Invoke the agent and pass its output to ``on_chunk`` as it's generated.
+
+        Returns the final response when the stream carried the whole answer. When the API doesn't
+        stream, returns the trigger response instead and the invocation has to be polled.
+        """
+        if self._streaming_supported is False:
+            return await self.trigger_agent(prompt)
+
+        try:
+            response = self._client.make_request(
+                method="POST",
+                endpoint="agent/invoke",
+                params={"stream": "true"},
+                json={"prompt": prompt},
+                headers={"Accept": "text/event-stream"},
+                stream=True,
+            )
+        except PortApiError as e:
+            if e.status_code not in STREAM_UNSUPPORTED_STATUS_CODES:
+                raise
+            logger.info(f"Streaming agent invocations isn't supported ({e.status_code}), falling back to polling")
+            self._streaming_supported = False
+            return await self.trigger_agent(prompt)
+
+        with response:
+            if "text/event-stream" not in response.headers.get("Content-Type", ""):
+                logger.info("The agent invocation wasn't streamed, falling back to polling")
+                self._streaming_supported = False
+                return self._parse_trigger_response(response.json())
+            self._streaming_supported = True
+            # Server-sent events are always UTF-8, requests would decode them as Latin-1
+            response.encoding = "utf-8"
+            # Without a chunk size, lines are read as they arrive instead of once 512 bytes are buffered
+            lines = response.iter_lines(chunk_size=None, decode_unicode=True)
+            return self._consume_stream(parse_sse(lines), on_chunk)
+
+    def _consume_stream(
+        self, events: Iterable[tuple[str, str]], on_chunk: Callable[[PortAgentStreamChunk], None]
+    ) -> PortAgentResponse:
+        identifier: str | None = None
+        selected_agent: str | None = None
+        status: str | None = None
+        output: list[str] = []
+        announced = False
+
+        for event, data in events:
+            payload = _parse_stream_data(data)
+            if isinstance(payload, dict):
+                identifier = identifier or _stream_identifier(payload)
+                selected_agent = payload.get("selectedAgent") or selected_agent
+
+            if event == "error":
+                message = payload.get("message", data) if isinstance(payload, dict) else payload
+                logger.error(f"Agent invocation {identifier} failed: {message}")
+                raise PortError(f"Agent invocation failed: {message}")
+            if event == "done":
+                status = payload.get("status", "Completed") if isinstance(payload, dict) else "Completed"
+                break
+
+            text = _stream_text(payload)
+            if text:
+                output.append(text)
+            if text or (identifier and not announced):
+                on_chunk(PortAgentStreamChunk(identifier=identifier, text=text))
+                announced = announced or identifier is not None
+
+        if identifier is None and status is None:
+            raise PortError("The agent stream ended before the invocation identifier was received")
+        if status is None:
+            # The stream was cut off, the invocation is still running and its status can be polled
+            logger.warning(f"Agent stream for invocation {identifier} ended without finishing")
+            status = "in_progress"
+
+        message = "".join(output)
+        return self._agent_response(
+            identifier=identifier or "",
+            status=status,
+            output=message,
+            error=None if status.lower() != "error" else message,
+            action_url=_action_url(message),
+            selected_agent=selected_agent,
+        )
+
+    def _agent_response(self, raw_output: Any = None, **fields: Any) -> PortAgentResponse:
+        if config.api_validation_enabled:
+            return PortAgentResponse(raw_output=raw_output, **fields)
+        return PortAgentResponse.construct(**fields)
+
     async def get_invocation_status(self, identifier: str) -> PortAgentResponse:
         endpoint = f"agent/invoke/{identifier}"
 
@@ -50,34 +212,15 @@ class PortAgentClient:
             message = result.get("message", "")
             selected_agent = result.get("selectedAgent", "")
 
-            # Generate action URL from port URLs in message if present
-            # Necesarry to continue the interaction with the agent
-            # Present them is the response for the agent to take action
-            action_url = None
-            if message:
-                urls = re.findall(r'https://app\.getport\.io/self-serve[^\s<>"]*', message)
-                if urls:
-                    action_url = urls[0]
-
-            if config.api_validation_enabled:
-                return PortAgentResponse(
-                    identifier=identifier,
-                    status=status,
-                    output=message,
-                    error=None if status.lower() != "error" else message,
-                    action_url=action_url,
-                    selected_agent=selected_agent,
-                    raw_output=response_data,
-                )
-            else:
-                return PortAgentResponse.construct(
-                    identifier=identifier,
-                    status=status,
-                    output=message,
-                    error=None if status.lower() != "error" else message,
-                    action_url=action_url,
-                    selected_agent=selected_agent,
-                )
+            return self._agent_response(
+                identifier=identifier,
+                status=status,
+                output=message,
+                error=None if status.lower() != "error" else message,
+                action_url=_action_url(message),
+                selected_agent=selected_agent,
+                raw_output=response_data,
+            )
 
         # If we don't have a result field, raise an error
         logger.error(f"Invalid response format: {response_data}")
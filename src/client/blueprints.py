@@ -3,37 +3,65 @@ from typing import Any
 
 from pyport import PortClient
 
+from src.client.metadata import MetadataStore
 from src.config import config
-from src.models.blueprints import Blueprint
-from src.utils import logger
+from src.models.blueprints import Blueprint, BlueprintSummary
+from src.models.common import list_adapter
+from src.utils import SharedCache, logger
 from src.utils.errors import PortError
+from src.utils.shared_cache import fetch_cached
+
+BLUEPRINTS = list_adapter(Blueprint)
 
 
 class PortBlueprintClient:
     """Client for interacting with Port Blueprint APIs."""
 
-    def __init__(self, client: PortClient):
+    def __init__(self, client: PortClient, cache: SharedCache | None = None, metadata: MetadataStore | None = None):
         self._client = client
+        self._cache = cache
+        self._metadata = metadata or MetadataStore()
+
+    def _invalidate_cache(self, blueprint_identifier: str | None) -> None:
+        if self._cache:
+            self._cache.delete("blueprints", f"blueprint:{blueprint_identifier}")
 
     async def get_blueprints(self) -> list[Blueprint]:
         logger.info("Getting blueprints from Port")
 
-        blueprints = self._client.blueprints.get_blueprints()
+        blueprints = fetch_cached(self._cache, "blueprints", self._client.blueprints.get_blueprints)
+        self._metadata.set_blueprints(blueprints)
 
         logger.info("Got blueprints from Port")
 
         logger.debug(f"Response for get blueprints: {blueprints}")
         if config.api_validation_enabled:
             logger.debug("Validating blueprints")
-            return [Blueprint(**bp) for bp in blueprints]
+            return BLUEPRINTS.validate_python(blueprints)
         else:
             logger.debug("Skipping API validation for blueprints")
             return [Blueprint.construct(**bp) for bp in blueprints]
 
+    async def get_blueprint_summaries(self) -> list[BlueprintSummary]:
+        """Summaries of all blueprints, from the metadata index unless it's out of date."""
+        summaries = self._metadata.blueprint_summaries()
+        if summaries is None:
+            logger.info("Getting blueprints from Port to index their summaries")
+            self._metadata.set_blueprints(
+                fetch_cached(self._cache, "blueprints", self._client.blueprints.get_blueprints)
+            )
+            summaries = self._metadata.blueprint_summaries() or []
+        return [BlueprintSummary.construct(**summary) for summary in summaries]
+
     async def get_blueprint(self, blueprint_identifier: str) -> Blueprint:
         logger.info(f"Getting blueprint '{blueprint_identifier}' from Port")
 
-        bp_data = self._client.blueprints.get_blueprint(blueprint_identifier)
+        bp_data = fetch_cached(
+            self._cache,
+            f"blueprint:{blueprint_identifier}",
+            lambda: self._client.blueprints.get_blueprint(blueprint_identifier),
+        )
+        self._metadata.set_blueprint(bp_data)
 
         logger.debug(f"Response for get blueprint: {bp_data}")
 
@@ -59,8 +87,10 @@ class PortBlueprintClient:
             logger.warning(message)
             raise PortError(message)
         logger.info("Blueprint created in Port")
+        self._invalidate_cache(blueprint_data.get("identifier"))
 
         result = result.get("blueprint", {})
+        self._metadata.set_blueprint(result)
 
         if config.api_validation_enabled:
             logger.debug("Validating blueprint")
@@ -84,8 +114,10 @@ class PortBlueprintClient:
             logger.warning(message)
             raise PortError(message)
         logger.info("Blueprint updated in Port")
+        self._invalidate_cache(blueprint_data.get("identifier"))
 
         result = result.get("blueprint", {})
+        self._metadata.set_blueprint(result)
         if config.api_validation_enabled:
             logger.debug("Validating blueprint")
             blueprint = Blueprint(**result)
@@ -105,5 +137,7 @@ class PortBlueprintClient:
             logger.warning(message)
             raise PortError(message)
         logger.info("Blueprint deleted in Port")
+        self._invalidate_cache(blueprint_identifier)
+        self._metadata.remove_blueprint(blueprint_identifier)
 
         return True
@@ -1,5 +1,5 @@
 from collections.abc import Awaitable, Callable
-from typing import Any, TypeVar
+from typing import Any, NoReturn, TypeVar
 
 import pyport
 import requests  # type: ignore[import-untyped]
@@ -9,20 +9,26 @@ from src.client.actions import PortActionClient
 from src.client.agent import PortAgentClient
 from src.client.blueprints import PortBlueprintClient
 from src.client.entities import PortEntityClient
+from src.client.entity_validation import EntityValidators
+from src.client.metadata import MetadataStore
 from src.client.permissions import PortPermissionsClient
 from src.client.scorecards import PortScorecardClient
+from src.client.session import configure_session, prewarm_in_background, relay_to_event_loop, run_cancellable
+from src.client.token_manager import TokenManager
 from src.config import config
 from src.models.action_run.action_run import ActionRun
-from src.models.actions.action import Action
-from src.models.agent import PortAgentResponse
+from src.models.actions.action import Action, ActionSummary
+from src.models.agent import PortAgentResponse, PortAgentStreamChunk
 from src.models.agent.port_agent_response import PortAgentTriggerResponse
-from src.models.blueprints import Blueprint
-from src.models.entities import EntityResult
+from src.models.blueprints import Blueprint, BlueprintSummary
+from src.models.entities import BulkEntityResult, EntityAggregation, EntityResult, EntitySort
 from src.models.scorecards import Scorecard
-from src.utils import PortError, logger
+from src.utils import PortError, SharedCache, logger
 from src.utils.user_agent import get_user_agent
 
 T = TypeVar("T")
+
+
 class PortClient:
     """Client for interacting with the Port API."""
 
@@ -32,6 +38,10 @@ class PortClient:
         client_secret: str | None = None,
         region: str = "EU",
         base_url: str = config.port_api_base,
+        shared_cache: SharedCache | None = None,
+        pool_size: int = 10,
+        keepalive_expiry: float = 60,
+        prewarm_connections: int = 0,
     ):
         if not client_id or not client_secret:
             logger.warning("PortClient initialized without credentials")
@@ -40,23 +50,44 @@ class PortClient:
         self.client_id = client_id
         self.client_secret = client_secret
         self.region = region
+        self.shared_cache = shared_cache
+        self.metadata = MetadataStore()
+        self.entity_validators = EntityValidators(self.metadata)
         if client_id and client_secret:
-            self._client = pyport.PortClient(
-                client_id=client_id,
-                client_secret=client_secret,
-                us_region=(region == "US"),
+            self._client = self._create_pyport_client(client_id, client_secret, region)
+            self.token_manager = TokenManager(
+                self._client._auth_manager._get_access_token, self._set_token, shared_cache
             )
-            
+            self.token_manager.start()
+            self._setup_session(pool_size, keepalive_expiry, prewarm_connections)
+
             self._setup_custom_headers()
-            
+
             self.agent = PortAgentClient(self._client)
-            self.blueprints = PortBlueprintClient(self._client)
+            self.blueprints = PortBlueprintClient(self._client, shared_cache, self.metadata)
             self.entities = PortEntityClient(self._client)
-            self.scorecards = PortScorecardClient(self._client)
-            self.actions = PortActionClient(self._client)
+            self.scorecards = PortScorecardClient(self._client, self.metadata)
+            self.actions = PortActionClient(self._client, shared_cache, self.metadata)
             self.action_runs = PortActionRunClient(self._client)
             self.permissions = PortPermissionsClient(self._client)
 
+    def _create_pyport_client(self, client_id: str, client_secret: str, region: str) -> pyport.PortClient:
+        # pyport would block on fetching a token and refresh it on a fixed interval, the token manager
+        # fetches it concurrently with the rest of the startup and refreshes it just before it expires
+        return pyport.PortClient(
+            client_id=client_id, client_secret=client_secret, us_region=(region == "US"), skip_auth=True
+        )
+
+    def _set_token(self, token: str) -> None:
+        self._client._auth_manager.token = token
+        self._client._update_session_token(token)
+
+    def _setup_session(self, pool_size: int, keepalive_expiry: float, prewarm_connections: int) -> None:
+        """Size the connection pool and open connections to the Port API ahead of the first request."""
+        configure_session(self._client._session, pool_size, keepalive_expiry)
+        if prewarm_connections:
+            prewarm_in_background(self._client._session, self._client.api_url, prewarm_connections)
+
     def _setup_custom_headers(self):
         """Setup custom headers for all HTTP requests."""
         user_agent = get_user_agent()
@@ -70,6 +101,8 @@ class PortClient:
                 kwargs['headers'] = {}
             
             kwargs['headers']['User-Agent'] = user_agent
+            # Waits for the token only when it's missing or expired, the token manager keeps it fresh
+            self.token_manager.get_token()
             
             return original_make_request(*args, **kwargs)
         
@@ -87,13 +120,19 @@ class PortClient:
         if self._client is None:
             raise PortError("PortClient is not properly initialized - missing credentials")
         try:
-            return await request()
+            return await run_cancellable(request)
         except requests.exceptions.HTTPError as e:
             raise self.handle_http_error(e) from e
 
     async def trigger_agent(self, prompt: str) -> PortAgentTriggerResponse:
         return await self.wrap_request(lambda: self.agent.trigger_agent(prompt))
 
+    async def stream_agent(
+        self, prompt: str, on_chunk: Callable[[PortAgentStreamChunk], Awaitable[None]]
+    ) -> PortAgentResponse | PortAgentTriggerResponse:
+        relay = relay_to_event_loop(on_chunk)
+        return await self.wrap_request(lambda: self.agent.stream_agent(prompt, relay))
+
     async def get_invocation_status(self, identifier: str) -> PortAgentResponse:
         return await self.wrap_request(lambda: self.agent.get_invocation_status(identifier))
 
@@ -103,6 +142,9 @@ class PortClient:
     async def get_blueprints(self) -> list[Blueprint]:
         return await self.wrap_request(lambda: self.blueprints.get_blueprints())
 
+    async def get_blueprint_summaries(self) -> list[BlueprintSummary]:
+        return await self.wrap_request(lambda: self.blueprints.get_blueprint_summaries())
+
     async def create_blueprint(self, blueprint_data: dict[str, Any]) -> Blueprint:
         return await self.wrap_request(lambda: self.blueprints.create_blueprint(blueprint_data))
 
@@ -127,25 +169,79 @@ class PortClient:
         blueprint_identifier: str, 
         query: dict[str, Any] | None = None,
         include: list[str] | None = None,
-        limit: int = 200
+        limit: int = 200,
+        sort: EntitySort | None = None,
     ) -> list[EntityResult]:
         return await self.wrap_request(lambda: self.entities.search_entities(
             blueprint_identifier=blueprint_identifier,
             query=query,
             include=include,
-            limit=limit
+            limit=limit,
+            sort=sort,
         ))
 
+    async def get_entities_by_ids(
+        self, blueprint_identifier: str, entity_identifiers: list[str], include: list[str] | None = None
+    ) -> dict[str, EntityResult]:
+        return await self.wrap_request(
+            lambda: self.entities.get_entities_by_ids(blueprint_identifier, entity_identifiers, include)
+        )
+
+    async def validate_entity(
+        self, blueprint_identifier: str, entity_data: dict[str, Any], partial: bool = False
+    ) -> None:
+        """Check an entity against its blueprint's schema before it's sent, raises PortError listing the problems.
+
+        The blueprint is fetched when it isn't known, or again before rejecting the entity when it sets fields the
+        blueprint doesn't define, or the blueprint was restored from a snapshot or fetched too long ago, as it may
+        have changed since. When it can't be fetched, the entity is sent and Port validates it. Other errors are
+        raised without any request.
+        """
+        validator = self.entity_validators.get(blueprint_identifier)
+        if validator is not None:
+            errors = validator.errors(entity_data, partial)
+            if not errors:
+                return
+            if not validator.has_unknown_fields(entity_data) and self.metadata.blueprint_is_fresh(blueprint_identifier):
+                self._raise_entity_errors(blueprint_identifier, errors)
+        try:
+            await self.get_blueprint(blueprint_identifier)
+        except Exception as e:
+            logger.debug(f"Skipping validation of entity for blueprint '{blueprint_identifier}': {e}")
+            return
+        validator = self.entity_validators.get(blueprint_identifier)
+        errors = validator.errors(entity_data, partial) if validator else []
+        if errors:
+            self._raise_entity_errors(blueprint_identifier, errors)
+
+    @staticmethod
+    def _raise_entity_errors(blueprint_identifier: str, errors: list[str]) -> NoReturn:
+        message = f"Entity doesn't match the schema of blueprint '{blueprint_identifier}': " + "; ".join(errors)
+        logger.warning(message)
+        raise PortError(message)
+
     async def create_entity(
         self, blueprint_identifier: str, entity_data: dict[str, Any], query: dict[str, Any]
     ) -> EntityResult:
+        # Merged upserts only change the given fields of an existing entity
+        await self.validate_entity(
+            blueprint_identifier, entity_data, partial=bool(query.get("upsert") and query.get("merge"))
+        )
         return await self.wrap_request(
             lambda: self.entities.create_entity(blueprint_identifier, entity_data, query)
         )
 
+    async def bulk_upsert_entities(
+        self, blueprint_identifier: str, entities: list[dict[str, Any]], query: dict[str, Any]
+    ) -> list[BulkEntityResult]:
+        return await self.wrap_request(
+            lambda: self.entities.bulk_upsert_entities(blueprint_identifier, entities, query)
+        )
+
     async def update_entity(
         self, blueprint_identifier: str, entity_identifier: str, entity_data: dict[str, Any]
     ) -> EntityResult:
+        await self.validate_entity(blueprint_identifier, entity_data)
         return await self.wrap_request(
             lambda: self.entities.update_entity(
                 blueprint_identifier, entity_identifier, entity_data
@@ -161,6 +257,35 @@ class PortClient:
             )
         )
 
+    async def find_entity_identifiers(self, blueprint_identifier: str, query: dict[str, Any]) -> list[str]:
+        return await self.wrap_request(lambda: self.entities.find_entity_identifiers(blueprint_identifier, query))
+
+    async def aggregate_entities(
+        self,
+        blueprint_identifier: str,
+        query: dict[str, Any],
+        group_by: str | None = None,
+        metrics: list[str] | None = None,
+        max_groups: int = 50,
+    ) -> EntityAggregation:
+        return await self.wrap_request(
+            lambda: self.entities.aggregate_entities(blueprint_identifier, query, group_by, metrics, max_groups)
+        )
+
+    async def bulk_delete_entities(
+        self,
+        blueprint_identifier: str,
+        entity_identifiers: list[str],
+        delete_dependents: bool = False,
+        on_progress: Callable[[int], Awaitable[None]] | None = None,
+    ) -> list[BulkEntityResult]:
+        relay = relay_to_event_loop(on_progress) if on_progress else None
+        return await self.wrap_request(
+            lambda: self.entities.bulk_delete_entities(
+                blueprint_identifier, entity_identifiers, delete_dependents, relay
+            )
+        )
+
     async def get_scorecard(self, blueprint_id: str, scorecard_id: str) -> Scorecard:
         return await self.wrap_request(
             lambda: self.scorecards.get_scorecard(blueprint_id, scorecard_id)
@@ -191,6 +316,9 @@ class PortClient:
     async def get_all_actions(self, trigger_type: str = "self-service") -> list[Action]:
         return await self.wrap_request(lambda: self.actions.get_all_actions(trigger_type))
 
+    async def get_action_summaries(self, trigger_type: str = "self-service") -> list[ActionSummary]:
+        return await self.wrap_request(lambda: self.actions.get_action_summaries(trigger_type))
+
     async def get_action(self, action_identifier: str) -> Action:
         return await self.wrap_request(lambda: self.actions.get_action(action_identifier))
     
@@ -1,11 +1,48 @@
+import heapq
+import threading
+from collections.abc import Callable, Iterator
+from itertools import chain, islice
 from typing import Any, cast
 
 from pyport import PortClient
+from pyport.exceptions import PortApiError
 
+from src.client.entity_aggregation import EntityAggregator
+from src.client.entity_fields import entity_value, include_paths
+from src.client.session import map_concurrently
 from src.config import config
-from src.models.entities import EntityResult
+from src.models.common import list_adapter
+from src.models.entities import BulkEntityResult, EntityAggregation, EntityResult, EntitySort
 from src.utils import PortError, logger
 
+# Port's bulk endpoint accepts up to 20 entities per request
+BULK_UPSERT_CHUNK_SIZE = 20
+BULK_DELETE_CHUNK_SIZE = 100
+BULK_MAX_CONCURRENCY = 5
+# Status codes the bulk endpoints are answered with where they aren't available
+BULK_UNSUPPORTED_STATUS_CODES = {404, 405}
+SEARCH_PAGE_SIZE = 500
+# Identifiers per search request, keeps the request body well within the API's limits
+GET_BY_IDS_CHUNK_SIZE = 100
+# Validates the entities of a response in one call instead of one model call per entity
+ENTITIES = list_adapter(EntityResult)
+
+
+def _sort_key(value: Any) -> tuple[int, float | str]:
+    # Numbers sort numerically, anything else by its text, so mixed values don't fail the comparison
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return 0, value
+    return 1, str(value)
+
+
+def _upsert_query_string(query: dict[str, Any]) -> str:
+    return (
+        f"upsert={query.get('upsert', False)}&"
+        f"validation_only={query.get('validation_only', False)}&"
+        f"create_missing_related_entities={query.get('create_missing_related_entities', False)}&"
+        f"merge={query.get('merge', False)}"
+    ).lower()
+
 
 class PortEntityClient:
     """Client for interacting with Port Entity APIs."""
@@ -14,6 +51,9 @@ class PortEntityClient:
 
     def __init__(self, client: PortClient):
         self._client = client
+        # Unknown until the first bulk request, individual requests are sent once it turned out missing
+        self._bulk_supported: bool | None = None
+        self._bulk_delete_supported: bool | None = None
 
     async def get_entities(self, blueprint_identifier: str) -> list[EntityResult]:
         logger.info(f"Getting entities for blueprint '{blueprint_identifier}' from Port")
@@ -24,7 +64,7 @@ class PortEntityClient:
         logger.debug(f"Response for get entities: {entities_data}")
         if config.api_validation_enabled:
             logger.debug("Validating entities")
-            return [EntityResult(**entity_data) for entity_data in entities_data]
+            return ENTITIES.validate_python(entities_data)
         else:
             logger.debug("Skipping API validation for entities")
             return [EntityResult.construct(**entity_data) for entity_data in entities_data]
@@ -34,43 +74,189 @@ class PortEntityClient:
         blueprint_identifier: str, 
         query: dict[str, Any] | None = None,
         include: list[str] | None = None,
-        limit: int = 200
+        limit: int = 200,
+        sort: EntitySort | None = None,
     ) -> list[EntityResult]:
         logger.info(f"Searching entities for blueprint '{blueprint_identifier}' from Port")
-        
-        # Build request body according to API spec
-        request_body: dict[str, Any] = {}
-        
-        if query:
-            request_body["query"] = query
-            
+
+        if sort:
+            entities_data = self._search_sorted(blueprint_identifier, query, include, limit, sort)
+        elif limit > SEARCH_PAGE_SIZE:
+            pages = self.iter_search_pages(blueprint_identifier, query, include)
+            entities_data = list(islice(chain.from_iterable(pages), limit))
+        else:
+            # Build request body according to API spec
+            request_body: dict[str, Any] = {}
+
+            if query:
+                request_body["query"] = query
+
+            if include:
+                request_body["include"] = include
+
+            if limit:
+                request_body["limit"] = limit
+
+            logger.debug(f"Search request body: {request_body}")
+
+            entities_data = self._search(blueprint_identifier, request_body)
+
+        logger.info(f"Got {len(entities_data)} entities for blueprint '{blueprint_identifier}' from Port")
+        if config.api_validation_enabled:
+            logger.debug("Validating entities")
+            return ENTITIES.validate_python(entities_data)
+        else:
+            logger.debug("Skipping API validation for entities")
+            return [EntityResult.construct(**entity_data) for entity_data in entities_data]
+
+    def _search_sorted(
+        self,
+        blueprint_identifier: str,
+        query: dict[str, Any] | None,
+        include: list[str] | None,
+        limit: int,
+        sort: EntitySort,
+    ) -> list[dict[str, Any]]:
+        """Return the first ``limit`` entities in sort order.
+
+        The search API doesn't sort, so all matching entities are paged in, but only the first ``limit``
+        seen so far are kept, memory doesn't grow with the number of matches.
+        """
         if include:
-            request_body["include"] = include
-            
-        if limit:
-            request_body["limit"] = limit
-            
-        logger.debug(f"Search request body: {request_body}")
+            include = [*include, *(path for path in include_paths(sort.property) if path not in include)]
+        entities = chain.from_iterable(self.iter_search_pages(blueprint_identifier, query, include))
 
+        # Entities without a value come last in either order
+        if sort.order == "asc":
+            return heapq.nsmallest(
+                limit, entities, key=lambda entity: self._sort_value(entity, sort.property, missing=True)
+            )
+        return heapq.nlargest(limit, entities, key=lambda entity: self._sort_value(entity, sort.property, missing=False))
+
+    @staticmethod
+    def _sort_value(entity: dict[str, Any], field: str, missing: bool) -> tuple[bool, tuple[int, float | str]]:
+        value = entity_value(entity, field)
+        if value is None:
+            return missing, (0, 0)
+        return not missing, _sort_key(value)
+
+    def _search(self, blueprint_identifier: str, request_body: dict[str, Any]) -> list[dict[str, Any]]:
+        entities_data: list[dict[str, Any]] = self._search_page(blueprint_identifier, request_body).get("entities", [])
+        return entities_data
+
+    def _search_page(self, blueprint_identifier: str, request_body: dict[str, Any]) -> dict[str, Any]:
         endpoint = f"blueprints/{blueprint_identifier}/entities/search"
 
         response = self._client.make_request(method="POST", endpoint=endpoint, json=request_body)
-        response_data = response.json()
+        response_data: dict[str, Any] = response.json()
 
         if not response_data.get("ok"):
             message = f"Failed to search entities: {response_data}"
             logger.warning(message)
             raise PortError(message)
-        
-        entities_data = response_data.get("entities", [])
 
-        logger.info(f"Got {len(entities_data)} entities for blueprint '{blueprint_identifier}' from Port")
+        return response_data
+
+    async def get_entities_by_ids(
+        self,
+        blueprint_identifier: str,
+        entity_identifiers: list[str],
+        include: list[str] | None = None,
+        max_concurrency: int = BULK_MAX_CONCURRENCY,
+    ) -> dict[str, EntityResult]:
+        """Get many entities of one blueprint with an ``$identifier in`` search per chunk of identifiers.
+
+        Returns the entities found keyed by identifier, identifiers without an entity are left out.
+        """
+        logger.info(f"Getting {len(entity_identifiers)} entities of blueprint '{blueprint_identifier}' from Port")
+
+        def search_chunk(chunk: list[str]) -> list[dict[str, Any]]:
+            request_body: dict[str, Any] = {
+                "query": {
+                    "combinator": "and",
+                    "rules": [
+                        {"property": "$blueprint", "operator": "=", "value": blueprint_identifier},
+                        {"property": "$identifier", "operator": "in", "value": chunk},
+                    ],
+                },
+                "limit": len(chunk),
+            }
+            if include:
+                request_body["include"] = include
+            return self._search(blueprint_identifier, request_body)
+
+        chunks = [
+            entity_identifiers[offset : offset + GET_BY_IDS_CHUNK_SIZE]
+            for offset in range(0, len(entity_identifiers), GET_BY_IDS_CHUNK_SIZE)
+        ]
+        entities_data = [entity for chunk in map_concurrently(search_chunk, chunks, max_concurrency) for entity in chunk]
+
+        logger.info(f"Got {len(entities_data)} entities of blueprint '{blueprint_identifier}' from Port")
         if config.api_validation_enabled:
             logger.debug("Validating entities")
-            return [EntityResult(**entity_data) for entity_data in entities_data]
+            entities = ENTITIES.validate_python(entities_data)
+            return {entity_data["identifier"]: entity for entity_data, entity in zip(entities_data, entities, strict=True)}
         else:
             logger.debug("Skipping API validation for entities")
-            return [EntityResult.construct(**entity_data) for entity_data in entities_data]
+            return {entity_data["identifier"]: EntityResult.construct(**entity_data) for entity_data in entities_data}
+
+    def iter_search_pages(
+        self,
+        blueprint_identifier: str,
+        query: dict[str, Any] | None,
+        include: list[str] | None = None,
+        page_size: int = SEARCH_PAGE_SIZE,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield the entities matching a search query one page at a time, following the search cursor."""
+        cursor: str | None = None
+        while True:
+            request_body: dict[str, Any] = {"limit": page_size}
+            if query:
+                request_body["query"] = query
+            if include:
+                request_body["include"] = include
+            if cursor:
+                request_body["from"] = cursor
+            response_data = self._search_page(blueprint_identifier, request_body)
+            yield response_data.get("entities", [])
+            cursor = response_data.get("next")
+            if not cursor:
+                return
+
+    async def find_entity_identifiers(
+        self, blueprint_identifier: str, query: dict[str, Any], page_size: int = SEARCH_PAGE_SIZE
+    ) -> list[str]:
+        """Return the identifiers of all entities matching a search query, fetched page by page."""
+        logger.info(f"Finding entities of blueprint '{blueprint_identifier}' matching {query}")
+        identifiers = [
+            entity["identifier"]
+            for page in self.iter_search_pages(blueprint_identifier, query, ["$identifier"], page_size)
+            for entity in page
+        ]
+        logger.info(f"Found {len(identifiers)} entities of blueprint '{blueprint_identifier}'")
+        return identifiers
+
+    async def aggregate_entities(
+        self,
+        blueprint_identifier: str,
+        query: dict[str, Any],
+        group_by: str | None = None,
+        metrics: list[str] | None = None,
+        max_groups: int = 50,
+    ) -> EntityAggregation:
+        """Count the entities matching a query, optionally per group, with stats of numeric properties.
+
+        Port has no ad-hoc aggregation endpoint, so pages of entities are aggregated as they arrive and
+        dropped. Only the fields the aggregation needs are fetched and memory doesn't grow with the
+        number of entities.
+        """
+        logger.info(f"Aggregating entities of blueprint '{blueprint_identifier}' grouped by {group_by}")
+        aggregator = EntityAggregator(group_by, metrics or [])
+        for page in self.iter_search_pages(blueprint_identifier, query, aggregator.include):
+            for entity in page:
+                aggregator.add(entity)
+        logger.info(f"Aggregated {aggregator.total} entities of blueprint '{blueprint_identifier}'")
+        return aggregator.result(max_groups)
 
     async def get_entity(self, blueprint_identifier: str, entity_identifier: str) -> EntityResult:
         logger.info(f"Getting entity '{entity_identifier}' from blueprint '{blueprint_identifier}' from Port")
@@ -91,12 +277,7 @@ class PortEntityClient:
         logger.debug(f"Input from tool to create entity: {entity_data}")
 
         url = f"blueprints/{blueprint_identifier}/entities"
-        query_str = (
-            f"upsert={query.get('upsert', False)}&"
-            f"validation_only={query.get('validation_only', False)}&"
-            f"create_missing_related_entities={query.get('create_missing_related_entities', False)}&"
-            f"merge={query.get('merge', False)}"
-        ).lower()
+        query_str = _upsert_query_string(query)
 
         response = self._client.make_request("POST", f"{url}?{query_str}", json=entity_data)
         created_data = response.json()
@@ -118,6 +299,102 @@ class PortEntityClient:
             logger.debug("Skipping API validation for entity")
             return EntityResult.construct(**entity)
 
+    async def bulk_upsert_entities(
+        self,
+        blueprint_identifier: str,
+        entities: list[dict[str, Any]],
+        query: dict[str, Any],
+        max_concurrency: int = BULK_MAX_CONCURRENCY,
+    ) -> list[BulkEntityResult]:
+        """Upsert many entities of one blueprint, returning the outcome of each in the order given.
+
+        Entities are sent in chunks to Port's bulk endpoint, or one by one where it isn't available,
+        with up to ``max_concurrency`` requests in flight. A failed entity or chunk doesn't stop the rest.
+        """
+        logger.info(f"Upserting {len(entities)} entities for blueprint '{blueprint_identifier}' in Port")
+        chunks = [
+            (offset, entities[offset : offset + BULK_UPSERT_CHUNK_SIZE])
+            for offset in range(0, len(entities), BULK_UPSERT_CHUNK_SIZE)
+        ]
+        chunk_results = map_concurrently(
+            lambda chunk: self._upsert_chunk(blueprint_identifier, chunk[0], chunk[1], query),
+            chunks,
+            max_concurrency,
+        )
+        results = [result for chunk_result in chunk_results for result in chunk_result]
+        failed = sum(not result.ok for result in results)
+        logger.info(
+            f"Upserted {len(results) - failed}/{len(results)} entities for blueprint '{blueprint_identifier}' in Port"
+        )
+        return results
+
+    def _upsert_chunk(
+        self, blueprint_identifier: str, offset: int, chunk: list[dict[str, Any]], query: dict[str, Any]
+    ) -> list[BulkEntityResult]:
+        query_str = _upsert_query_string(query)
+        if self._bulk_supported is not False:
+            try:
+                response = self._client.make_request(
+                    "POST", f"blueprints/{blueprint_identifier}/entities/bulk?{query_str}", json={"entities": chunk}
+                )
+                self._bulk_supported = True
+                return self._parse_bulk_response(response.json(), offset, chunk)
+            except PortApiError as e:
+                if self._bulk_supported or e.status_code not in BULK_UNSUPPORTED_STATUS_CODES:
+                    logger.warning(f"Failed to upsert entities {offset}-{offset + len(chunk) - 1}: {e}")
+                    return self._failed_chunk(offset, chunk, str(e))
+                logger.info("Bulk entity endpoint isn't available, upserting entities one by one")
+                self._bulk_supported = False
+
+        return [self._upsert_one(blueprint_identifier, offset + i, entity, query_str) for i, entity in enumerate(chunk)]
+
+    def _upsert_one(
+        self, blueprint_identifier: str, index: int, entity: dict[str, Any], query_str: str
+    ) -> BulkEntityResult:
+        identifier = entity.get("identifier")
+        try:
+            response = self._client.make_request(
+                "POST", f"blueprints/{blueprint_identifier}/entities?{query_str}", json=entity
+            )
+            created_data = response.json()
+        except PortApiError as e:
+            return BulkEntityResult(index=index, identifier=identifier, ok=False, error=str(e))
+        if not created_data.get("ok"):
+            return BulkEntityResult(index=index, identifier=identifier, ok=False, error=str(created_data))
+        return BulkEntityResult(index=index, identifier=created_data.get("entity", {}).get("identifier", identifier), ok=True)
+
+    def _parse_bulk_response(
+        self, response_data: dict[str, Any], offset: int, chunk: list[dict[str, Any]]
+    ) -> list[BulkEntityResult]:
+        positions = {entity.get("identifier"): i for i, entity in enumerate(chunk)}
+        results: dict[int, BulkEntityResult] = {}
+        for entity in response_data.get("entities", []):
+            index = entity.get("index", positions.get(entity.get("identifier")))
+            if index is not None:
+                results[index] = BulkEntityResult(index=offset + index, identifier=entity.get("identifier"), ok=True)
+        for error in response_data.get("errors", []):
+            index = error.get("index", positions.get(error.get("identifier")))
+            if index is not None:
+                message = error.get("message") or error.get("error") or str(error)
+                results[index] = BulkEntityResult(
+                    index=offset + index, identifier=error.get("identifier"), ok=False, error=message
+                )
+        # Entities the response doesn't mention are reported as failed instead of silently dropped
+        return [
+            results.get(i)
+            or BulkEntityResult(
+                index=offset + i, identifier=entity.get("identifier"), ok=False, error="Missing from the bulk response"
+            )
+            for i, entity in enumerate(chunk)
+        ]
+
+    @staticmethod
+    def _failed_chunk(offset: int, chunk: list[dict[str, Any]], error: str) -> list[BulkEntityResult]:
+        return [
+            BulkEntityResult(index=offset + i, identifier=entity.get("identifier"), ok=False, error=error)
+            for i, entity in enumerate(chunk)
+        ]
+
     async def update_entity(self, blueprint_identifier: str, entity_identifier: str, entity_data: dict[str, Any]) -> EntityResult:
         logger.info(f"Updating entity '{entity_identifier}' in blueprint '{blueprint_identifier}' in Port")
         logger.debug(f"Input from tool to update entity: {entity_data}")
@@ -154,3 +431,96 @@ class PortEntityClient:
             raise PortError(message)
         logger.info(f"Deleted entity '{entity_identifier}' from blueprint '{blueprint_identifier}' in Port")
         return cast(bool, response_json.get("ok"))
+
+    async def bulk_delete_entities(
+        self,
+        blueprint_identifier: str,
+        entity_identifiers: list[str],
+        delete_dependents: bool = False,
+        on_progress: Callable[[int], None] | None = None,
+        max_concurrency: int = BULK_MAX_CONCURRENCY,
+    ) -> list[BulkEntityResult]:
+        """Delete many entities of one blueprint, returning the outcome of each in the order given.
+
+        Identifiers are sent in chunks to Port's bulk delete endpoint, or deleted one by one where it
+        isn't available. ``on_progress`` is called with the number of entities handled after every chunk.
+        """
+        logger.info(f"Deleting {len(entity_identifiers)} entities from blueprint '{blueprint_identifier}' in Port")
+        chunks = [
+            (offset, entity_identifiers[offset : offset + BULK_DELETE_CHUNK_SIZE])
+            for offset in range(0, len(entity_identifiers), BULK_DELETE_CHUNK_SIZE)
+        ]
+        lock = threading.Lock()
+        handled = 0
+
+        def delete_chunk(chunk: tuple[int, list[str]]) -> list[BulkEntityResult]:
+            nonlocal handled
+            results = self._delete_chunk(blueprint_identifier, chunk[0], chunk[1], delete_dependents)
+            if on_progress is not None:
+                # Reported under the lock, so progress never goes backwards
+                with lock:
+                    handled += len(results)
+                    on_progress(handled)
+            return results
+
+        chunk_results = map_concurrently(delete_chunk, chunks, max_concurrency)
+        results = [result for chunk_result in chunk_results for result in chunk_result]
+        failed = sum(not result.ok for result in results)
+        logger.info(
+            f"Deleted {len(results) - failed}/{len(results)} entities from blueprint '{blueprint_identifier}' in Port"
+        )
+        return results
+
+    def _delete_chunk(
+        self, blueprint_identifier: str, offset: int, chunk: list[str], delete_dependents: bool
+    ) -> list[BulkEntityResult]:
+        query_str = f"delete_dependents={delete_dependents}".lower()
+        if self._bulk_delete_supported is not False:
+            try:
+                response = self._client.make_request(
+                    "DELETE", f"blueprints/{blueprint_identifier}/bulk/entities?{query_str}", json={"entities": chunk}
+                )
+                self._bulk_delete_supported = True
+                return self._parse_bulk_delete_response(response.json(), offset, chunk)
+            except PortApiError as e:
+                if self._bulk_delete_supported or e.status_code not in BULK_UNSUPPORTED_STATUS_CODES:
+                    logger.warning(f"Failed to delete entities {offset}-{offset + len(chunk) - 1}: {e}")
+                    return self._failed_chunk(offset, [{"identifier": identifier} for identifier in chunk], str(e))
+                logger.info("Bulk delete endpoint isn't available, deleting entities one by one")
+                self._bulk_delete_supported = False
+
+        return [
+            self._delete_one(blueprint_identifier, offset + i, identifier, query_str)
+            for i, identifier in enumerate(chunk)
+        ]
+
+    def _delete_one(self, blueprint_identifier: str, index: int, identifier: str, query_str: str) -> BulkEntityResult:
+        try:
+            response = self._client.make_request(
+                "DELETE", f"blueprints/{blueprint_identifier}/entities/{identifier}?{query_str}"
+            )
+            response_json = response.json()
+        except PortApiError as e:
+            return BulkEntityResult(index=index, identifier=identifier, ok=False, error=str(e))
+        if not response_json.get("ok"):
+            return BulkEntityResult(index=index, identifier=identifier, ok=False, error=str(response_json))
+        return BulkEntityResult(index=index, identifier=identifier, ok=True)
+
+    def _parse_bulk_delete_response(
+        self, response_data: dict[str, Any], offset: int, chunk: list[str]
+    ) -> list[BulkEntityResult]:
+        if not response_data.get("ok"):
+            return self._failed_chunk(offset, [{"identifier": identifier} for identifier in chunk], str(response_data))
+        # Identifiers the response doesn't list as failed were deleted
+        errors: dict[str, str] = {}
+        for error in response_data.get("failedEntities", response_data.get("errors", [])):
+            if isinstance(error, dict):
+                errors[error.get("identifier", "")] = error.get("message") or error.get("error") or str(error)
+            else:
+                errors[str(error)] = "Failed to delete entity"
+        return [
+            BulkEntityResult(index=offset + i, identifier=identifier, ok=False, error=errors[identifier])
+            if identifier in errors
+            else BulkEntityResult(index=offset + i, identifier=identifier, ok=True)
+            for i, identifier in enumerate(chunk)
+        ]
@@ -0,0 +1,96 @@
+"""Aggregation of entities as they're paged in from search."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.client.entity_fields import entity_value, include_paths
+from src.models.entities import EntityAggregation, EntityGroup, MetricStats
+
+
+@dataclass
+class MetricAccumulator:
+    count: int = 0
+    total: float = 0
+    min: float | None = None
+    max: float | None = None
+
+    def add(self, value: Any) -> None:
+        # bool is an int, but averaging flags isn't what a numeric metric means
+        if isinstance(value, bool) or not isinstance(value, int | float):
+            return
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def stats(self) -> MetricStats:
+        if not self.count:
+            return MetricStats(count=0)
+        return MetricStats(count=self.count, min=self.min, max=self.max, avg=self.total / self.count)
+
+
+@dataclass
+class GroupAccumulator:
+    count: int = 0
+    metrics: dict[str, MetricAccumulator] = field(default_factory=dict)
+
+
+class EntityAggregator:
+    """Keeps running counts and stats, so entities can be dropped as soon as they're added."""
+
+    def __init__(self, group_by: str | None, metrics: list[str]):
+        self.group_by = group_by
+        self.metrics = metrics
+        self.total = 0
+        self._overall = {metric: MetricAccumulator() for metric in metrics}
+        self._groups: dict[str | None, GroupAccumulator] = {}
+
+    @property
+    def include(self) -> list[str]:
+        """The fields to fetch, only the metrics and the group-by field are needed."""
+        include = ["$identifier", *(f"properties.{metric}" for metric in self.metrics)]
+        if self.group_by:
+            include += include_paths(self.group_by)
+        return include
+
+    def add(self, entity: dict[str, Any]) -> None:
+        self.total += 1
+        properties = entity.get("properties") or {}
+        for metric, accumulator in self._overall.items():
+            accumulator.add(properties.get(metric))
+        if self.group_by is None:
+            return
+        for value in self._group_values(entity, self.group_by):
+            group = self._groups.get(value)
+            if group is None:
+                group = self._groups[value] = GroupAccumulator(
+                    metrics={metric: MetricAccumulator() for metric in self.metrics}
+                )
+            group.count += 1
+            for metric, accumulator in group.metrics.items():
+                accumulator.add(properties.get(metric))
+
+    @staticmethod
+    def _group_values(entity: dict[str, Any], group_by: str) -> list[str | None]:
+        value = entity_value(entity, group_by)
+        # Entities with several values, like many relations or teams, count in each of their groups
+        values = value if isinstance(value, list) else [value]
+        return [None if item is None else str(item) for item in values] or [None]
+
+    def result(self, max_groups: int) -> EntityAggregation:
+        fields: dict[str, Any] = {"total": self.total}
+        if self.metrics:
+            fields["metrics"] = {metric: accumulator.stats() for metric, accumulator in self._overall.items()}
+        if self.group_by is not None:
+            largest = sorted(self._groups.items(), key=lambda item: item[1].count, reverse=True)
+            fields["groups"] = [
+                EntityGroup.construct(
+                    value=value,
+                    count=group.count,
+                    metrics={metric: accumulator.stats() for metric, accumulator in group.metrics.items()} or None,
+                )
+                for value, group in largest[:max_groups]
+            ]
+            if len(largest) > max_groups:
+                fields["other_groups"] = len(largest) - max_groups
+        return EntityAggregation.construct(**fields)
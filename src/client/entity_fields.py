@@ -0,0 +1,31 @@
+"""Lookup of entity fields by the names search rules and includes refer to them with."""
+
+from typing import Any
+
+# Meta fields and the key they're returned under
+META_FIELDS = {
+    "$identifier": "identifier",
+    "$title": "title",
+    "$team": "team",
+    "$blueprint": "blueprint",
+    "$createdAt": "createdAt",
+    "$createdBy": "createdBy",
+    "$updatedAt": "updatedAt",
+    "$updatedBy": "updatedBy",
+}
+
+
+def include_paths(field: str) -> list[str]:
+    """The include paths returning a field, a non-meta field may be a property or a relation so both are included."""
+    if field in META_FIELDS:
+        return [field]
+    return [f"properties.{field}", f"relations.{field}"]
+
+
+def entity_value(entity: dict[str, Any], field: str) -> Any:
+    """The value of a meta field, property or relation of a search result."""
+    if field in META_FIELDS:
+        return entity.get(META_FIELDS[field])
+    properties = entity.get("properties") or {}
+    relations = entity.get("relations") or {}
+    return properties.get(field, relations.get(field))
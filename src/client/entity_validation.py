@@ -0,0 +1,101 @@
+"""Validation of entity writes against the blueprint schemas in the metadata store."""
+
+from typing import Annotated, Any
+
+from pydantic import AfterValidator, ValidationError
+from pydantic_core import PydanticCustomError
+
+from src.client.metadata import MetadataStore
+from src.models.common.base_pydantic import BaseModel
+from src.models.common.property_schema import properties_model, property_annotation
+
+
+def _single_relation(value: Any) -> Any:
+    # Relation values may also be a search query whose matches are related
+    if not isinstance(value, str | dict):
+        raise PydanticCustomError("relation_type", "Input should be an entity identifier or a search query")
+    return value
+
+
+def _many_relation(value: Any) -> Any:
+    if not isinstance(value, dict) and not (isinstance(value, list) and all(isinstance(item, str) for item in value)):
+        raise PydanticCustomError("relation_type", "Input should be a list of entity identifiers or a search query")
+    return value
+
+
+SINGLE_RELATION = Annotated[Any, AfterValidator(_single_relation)]
+MANY_RELATION = Annotated[Any, AfterValidator(_many_relation)]
+
+
+def _errors(model: type[BaseModel], values: Any, location: str, blueprint: str, partial: bool) -> list[str]:
+    try:
+        model.model_validate(values)
+    except ValidationError as error:
+        messages = []
+        for detail in error.errors():
+            if partial and detail["type"] == "missing":
+                continue
+            field = ".".join(str(part) for part in (location, *detail["loc"]))
+            extra = detail["type"] == "extra_forbidden"
+            message = f"not defined in blueprint '{blueprint}'" if extra else detail["msg"]
+            messages.append(f"{field}: {message}")
+        return messages
+    return []
+
+
+class EntityValidator:
+    """Checks the properties and relations of an entity against the schema of its blueprint."""
+
+    def __init__(self, blueprint: dict[str, Any]):
+        self.blueprint = blueprint["identifier"]
+        schema = blueprint.get("schema") or {}
+        properties = schema.get("properties") or {}
+        self.properties = properties_model(
+            f"{self.blueprint}Properties",
+            {identifier: property_annotation(definition) for identifier, definition in properties.items()},
+            schema.get("required") or [],
+        )
+        relations = blueprint.get("relations") or {}
+        self.fields = {"properties": set(properties), "relations": set(relations)}
+        self.relations = properties_model(
+            f"{self.blueprint}Relations",
+            {
+                identifier: MANY_RELATION if relation.get("many") else SINGLE_RELATION
+                for identifier, relation in relations.items()
+            },
+            [identifier for identifier, relation in relations.items() if relation.get("required")],
+        )
+
+    def errors(self, entity: dict[str, Any], partial: bool = False) -> list[str]:
+        """What is wrong with the entity, ``partial`` entities only change some fields so they may miss required ones."""
+        properties = _errors(self.properties, entity.get("properties") or {}, "properties", self.blueprint, partial)
+        relations = _errors(self.relations, entity.get("relations") or {}, "relations", self.blueprint, partial)
+        return properties + relations
+
+    def has_unknown_fields(self, entity: dict[str, Any]) -> bool:
+        """Whether the entity sets properties or relations the blueprint doesn't define, they may have been added since."""
+        return any(set(entity.get(location) or {}) - fields for location, fields in self.fields.items())
+
+
+class EntityValidators:
+    """Validators of the blueprints in the metadata store, compiled on first use.
+
+    A validator is compiled again once the store holds a different version of its blueprint.
+    """
+
+    def __init__(self, metadata: MetadataStore):
+        self._metadata = metadata
+        self._validators: dict[str, tuple[dict[str, Any], EntityValidator]] = {}
+
+    def get(self, blueprint_identifier: str) -> EntityValidator | None:
+        """The blueprint's validator, None when the blueprint isn't in the store."""
+        blueprint = self._metadata.blueprints.get(blueprint_identifier)
+        if blueprint is None:
+            self._validators.pop(blueprint_identifier, None)
+            return None
+        compiled = self._validators.get(blueprint_identifier)
+        if compiled is not None and compiled[0] is blueprint:
+            return compiled[1]
+        validator = EntityValidator(blueprint)
+        self._validators[blueprint_identifier] = (blueprint, validator)
+        return validator
@@ -0,0 +1,110 @@
+"""In-memory view of the organization metadata fetched from Port."""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+# Seconds the summary indexes answer from without fetching the blueprints or actions again
+SUMMARY_INDEX_TTL = 300
+# Seconds a stored blueprint is trusted to reject an entity without fetching it again
+BLUEPRINT_VALIDATION_TTL = 300
+# Blueprint fields holding property definitions, all of them can be searched and included by name
+PROPERTY_FIELDS = ["mirrorProperties", "calculationProperties", "aggregationProperties"]
+
+
+def summarize_blueprint(blueprint: dict[str, Any]) -> dict[str, Any]:
+    properties = list((blueprint.get("schema") or {}).get("properties") or {})
+    for property_field in PROPERTY_FIELDS:
+        properties += list(blueprint.get(property_field) or {})
+    return {
+        "identifier": blueprint["identifier"],
+        "title": blueprint.get("title"),
+        "description": blueprint.get("description"),
+        "properties": properties,
+        "relations": list(blueprint.get("relations") or {}),
+    }
+
+
+def summarize_action(action: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "identifier": action["identifier"],
+        "title": action.get("title"),
+        "blueprint": (action.get("trigger") or {}).get("blueprintIdentifier"),
+    }
+
+
+@dataclass
+class MetadataStore:
+    """Latest blueprints, scorecards and user permissions seen by the server.
+
+    Sub-clients record every response they receive, so the store reflects the most recent
+    data without extra requests and can be persisted in the warm-start snapshot.
+    Summaries of the blueprints and actions are indexed once per full fetch and kept up to
+    date with single blueprint changes, for questions that don't need the full definitions.
+    """
+
+    blueprints: dict[str, dict[str, Any]] = field(default_factory=dict)
+    scorecards: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    permissions: list[str] = field(default_factory=list)
+    # When all blueprints were last fetched, unset while only some of them are known
+    blueprints_fetched_at: float | None = None
+    _blueprint_summaries: dict[str, dict[str, Any]] | None = field(default=None, repr=False)
+    # When each blueprint was last fetched, blueprints restored from a snapshot have no entry
+    _blueprint_fetched_at: dict[str, float] = field(default_factory=dict, repr=False)
+    # Summaries of the actions the user may run and when they were fetched, per trigger type
+    _action_summaries: dict[str, tuple[float, list[dict[str, Any]]]] = field(default_factory=dict, repr=False)
+
+    def set_blueprints(self, blueprints: list[dict[str, Any]]) -> None:
+        self.blueprints = {bp["identifier"]: bp for bp in blueprints if bp.get("identifier")}
+        self.blueprints_fetched_at = time.monotonic()
+        self._blueprint_fetched_at = dict.fromkeys(self.blueprints, self.blueprints_fetched_at)
+        self._blueprint_summaries = None
+
+    def set_blueprint(self, blueprint: dict[str, Any]) -> None:
+        if blueprint.get("identifier"):
+            self.blueprints[blueprint["identifier"]] = blueprint
+            self._blueprint_fetched_at[blueprint["identifier"]] = time.monotonic()
+            if self._blueprint_summaries is not None:
+                self._blueprint_summaries[blueprint["identifier"]] = summarize_blueprint(blueprint)
+
+    def remove_blueprint(self, blueprint_identifier: str) -> None:
+        self.blueprints.pop(blueprint_identifier, None)
+        self.scorecards.pop(blueprint_identifier, None)
+        self._blueprint_fetched_at.pop(blueprint_identifier, None)
+        if self._blueprint_summaries is not None:
+            self._blueprint_summaries.pop(blueprint_identifier, None)
+
+    def blueprint_is_fresh(self, blueprint_identifier: str, max_age: float = BLUEPRINT_VALIDATION_TTL) -> bool:
+        """Whether the blueprint was fetched within ``max_age`` seconds, never for one restored from a snapshot."""
+        fetched_at = self._blueprint_fetched_at.get(blueprint_identifier)
+        return fetched_at is not None and time.monotonic() - fetched_at <= max_age
+
+    def blueprint_summaries(self, max_age: float = SUMMARY_INDEX_TTL) -> list[dict[str, Any]] | None:
+        """Summaries of all blueprints, None when they weren't all fetched within ``max_age`` seconds."""
+        if self.blueprints_fetched_at is None or time.monotonic() - self.blueprints_fetched_at > max_age:
+            return None
+        if self._blueprint_summaries is None:
+            self._blueprint_summaries = {
+                identifier: summarize_blueprint(blueprint) for identifier, blueprint in self.blueprints.items()
+            }
+        return list(self._blueprint_summaries.values())
+
+    def set_actions(self, trigger_type: str, actions: list[dict[str, Any]]) -> None:
+        summaries = [summarize_action(action) for action in actions if action.get("identifier")]
+        self._action_summaries[trigger_type] = (time.monotonic(), summaries)
+
+    def clear_actions(self) -> None:
+        self._action_summaries.clear()
+
+    def action_summaries(self, trigger_type: str, max_age: float = SUMMARY_INDEX_TTL) -> list[dict[str, Any]] | None:
+        """Summaries of the actions the user may run, None when they weren't fetched within ``max_age`` seconds."""
+        fetched_at, summaries = self._action_summaries.get(trigger_type, (None, None))
+        if fetched_at is None or time.monotonic() - fetched_at > max_age:
+            return None
+        return summaries
+
+    def set_scorecards(self, blueprint_identifier: str, scorecards: list[dict[str, Any]]) -> None:
+        self.scorecards[blueprint_identifier] = scorecards
+
+    def set_permissions(self, permissions: list[str]) -> None:
+        self.permissions = permissions
@@ -3,17 +3,22 @@ from typing import Any
 
 from pyport import PortClient
 
+from src.client.metadata import MetadataStore
 from src.config import config
+from src.models.common import list_adapter
 from src.models.scorecards import Scorecard
 from src.utils import logger
 from src.utils.errors import PortError
 
+SCORECARDS = list_adapter(Scorecard)
+
 
 class PortScorecardClient:
     """Client for interacting with Port Scorecard APIs."""
 
-    def __init__(self, client: PortClient):
+    def __init__(self, client: PortClient, metadata: MetadataStore | None = None):
         self._client = client
+        self._metadata = metadata or MetadataStore()
 
     async def get_scorecards(self, blueprint_identifier: str) -> list[Scorecard]:
         logger.info(f"Getting all scorecards for blueprint '{blueprint_identifier}' from Port")
@@ -21,12 +26,13 @@ class PortScorecardClient:
         response = self._client.scorecards.get_scorecards(blueprint_identifier)
 
         scorecards_data = response.get("scorecards", [])
+        self._metadata.set_scorecards(blueprint_identifier, scorecards_data)
         logger.info(f"Got {len(scorecards_data)} scorecards for blueprint '{blueprint_identifier}' from Port")
         logger.debug(f"Response for get scorecards: {response}")
 
         if config.api_validation_enabled:
             logger.debug("Validating scorecards")
-            return [Scorecard(**scorecard_data) for scorecard_data in scorecards_data]
+            return SCORECARDS.validate_python(scorecards_data)
         else:
             logger.debug("Skipping API validation for scorecards")
             return [Scorecard.construct(**scorecard_data) for scorecard_data in scorecards_data]
@@ -61,6 +67,7 @@ class PortScorecardClient:
             raise PortError(message)
 
         logger.info(f"Created scorecard for blueprint '{blueprint_id}'")
+        self._metadata.scorecards.pop(blueprint_id, None)
 
         data = created_data.get("scorecard", {})
 
@@ -84,6 +91,7 @@ class PortScorecardClient:
             raise PortError(message)
 
         logger.info(f"Deleted scorecard '{scorecard_id}' from blueprint '{blueprint_id}'")
+        self._metadata.scorecards.pop(blueprint_id, None)
         logger.debug(f"Response for delete scorecard: {deleted_data}")
         return True
 
@@ -113,6 +121,7 @@ class PortScorecardClient:
             raise PortError(message)
 
         logger.info(f"Updated scorecard '{scorecard_id}' in blueprint '{blueprint_id}'")
+        self._metadata.scorecards.pop(blueprint_id, None)
 
         data = updated_data.get("scorecard", {})
 
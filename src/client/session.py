@@ -0,0 +1,220 @@
+"""Connection pooling and cancellation for the HTTP session pyport sends its requests with."""
+
+import asyncio
+import contextlib
+import contextvars
+import socket
+import threading
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import TypeVar
+
+import anyio
+import requests  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from src.utils import PortRequestCancelledError, logger
+
+T = TypeVar("T")
+C = TypeVar("C")
+
+# Let the OS detect dead connections while they sit idle in the pool
+KEEPALIVE_SOCKET_OPTIONS = [
+    *HTTPConnection.default_socket_options,
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class RequestScope:
+    """The connections used by one call to Port, so the call can be aborted from another thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connections: set[HTTPConnection] = set()
+        self.cancelled = threading.Event()
+
+    def check(self) -> None:
+        if self.cancelled.is_set():
+            raise PortRequestCancelledError("The request to Port was cancelled")
+
+    def track(self, connection: HTTPConnection) -> None:
+        with self._lock:
+            self._connections.add(connection)
+
+    def untrack(self, connection: HTTPConnection) -> None:
+        with self._lock:
+            self._connections.discard(connection)
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+        with self._lock:
+            connections = list(self._connections)
+        for connection in connections:
+            # Shutting the socket down wakes up the thread blocked on reading the response
+            sock = getattr(connection, "sock", None)
+            if sock is not None:
+                with contextlib.suppress(OSError):
+                    sock.shutdown(socket.SHUT_RDWR)
+
+
+current_request_scope: ContextVar[RequestScope | None] = ContextVar("current_request_scope", default=None)
+
+
+class _ScopedPoolMixin:
+    """Registers the connections handed out by the pool with the request scope of the calling thread."""
+
+    def _get_conn(self, timeout=None):
+        connection = super()._get_conn(timeout)  # type: ignore[misc]
+        scope = current_request_scope.get()
+        if scope is not None:
+            scope.track(connection)
+        return connection
+
+    def _put_conn(self, conn):
+        scope = current_request_scope.get()
+        if scope is not None and conn is not None:
+            scope.untrack(conn)
+        super()._put_conn(conn)  # type: ignore[misc]
+
+
+class ScopedHTTPConnectionPool(_ScopedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class ScopedHTTPSConnectionPool(_ScopedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+async def run_cancellable(request: Callable[[], Awaitable[T]]) -> T:
+    """Run a call to Port in a worker thread and abort its HTTP requests if the caller is cancelled.
+
+    The clients call pyport synchronously, running them on the event loop would block it and
+    keep cancellation from being delivered until the call returns.
+    """
+    scope = RequestScope()
+
+    def run() -> T:
+        current_request_scope.set(scope)
+        return asyncio.run(request())  # type: ignore[arg-type]
+
+    try:
+        return await anyio.to_thread.run_sync(run, abandon_on_cancel=True)
+    except anyio.get_cancelled_exc_class():
+        logger.info("Aborting cancelled request to Port")
+        scope.cancel()
+        raise
+
+
+def relay_to_event_loop(callback: Callable[[C], Awaitable[None]]) -> Callable[[C], None]:
+    """Let a request running in worker threads hand items to an async callback on the current event loop.
+
+    Must be called on the event loop. Each call waits for the callback to finish, so a fast producer
+    can't queue up more than one item per thread.
+    """
+    loop = asyncio.get_running_loop()
+
+    def relay(item: C) -> None:
+        asyncio.run_coroutine_threadsafe(callback(item), loop).result()  # type: ignore[arg-type]
+
+    return relay
+
+
+def map_concurrently(fn: Callable[[C], T], items: Sequence[C], max_concurrency: int) -> list[T]:
+    """Call ``fn`` for every item from up to ``max_concurrency`` threads and return the results in order.
+
+    The threads share the request scope of the caller, so cancelling the call aborts all of their requests.
+    """
+    if len(items) <= 1 or max_concurrency <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items))) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, fn, item) for item in items]
+        return [future.result() for future in futures]
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTP adapter with a sized connection pool that drops connections left idle for too long.
+
+    Load balancers close idle connections on their side, reusing such a connection fails
+    the request and costs a retry. Dropping the pool after ``keepalive_expiry`` seconds without
+    requests opens fresh connections instead.
+    """
+
+    def __init__(self, pool_size: int, keepalive_expiry: float):
+        self.keepalive_expiry = keepalive_expiry
+        self._last_used = time.monotonic()
+        self._lock = threading.Lock()
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = KEEPALIVE_SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": ScopedHTTPConnectionPool,
+            "https": ScopedHTTPSConnectionPool,
+        }
+
+    def send(self, request, *args, **kwargs):
+        # Also stops pyport from retrying a request whose tool call was cancelled
+        scope = current_request_scope.get()
+        if scope is not None:
+            scope.check()
+        self._expire_idle_connections()
+        return super().send(request, *args, **kwargs)
+
+    def _expire_idle_connections(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            idle_for = now - self._last_used
+            self._last_used = now
+        if self.keepalive_expiry and idle_for > self.keepalive_expiry:
+            logger.debug(f"Connections idle for {idle_for:.0f}s, opening new ones")
+            self.poolmanager.clear()
+
+    def prewarm(self, url: str, count: int, verify: bool | str = True, proxies: dict[str, str] | None = None) -> int:
+        """Open up to ``count`` connections to ``url`` in parallel and keep them in the pool."""
+        # Resolve the pool the same way sending a request does, so the requests reuse these connections
+        request = requests.Request("GET", url).prepare()
+        pool = self.get_connection_with_tls_context(request, verify, proxies)
+        count = min(count, self._pool_maxsize)
+        connections = [pool._get_conn() for _ in range(count)]
+
+        def connect(connection) -> bool:
+            try:
+                connection.connect()
+                return True
+            except Exception as e:
+                logger.debug(f"Failed to prewarm a connection to {url}: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            opened = sum(executor.map(connect, connections))
+        for connection in connections:
+            pool._put_conn(connection)
+        with self._lock:
+            self._last_used = time.monotonic()
+        return opened
+
+
+def configure_session(session: requests.Session, pool_size: int, keepalive_expiry: float) -> KeepAliveHTTPAdapter:
+    adapter = KeepAliveHTTPAdapter(pool_size, keepalive_expiry)
+    session.mount("https://", adapter)
+    return adapter
+
+
+def prewarm_in_background(session: requests.Session, url: str, count: int) -> threading.Thread:
+    """Open connections to the Port API in the background, so the first requests skip DNS, TCP and TLS setup."""
+
+    def prewarm() -> None:
+        started = time.monotonic()
+        adapter = session.get_adapter(url)
+        settings = session.merge_environment_settings(url, {}, None, None, None)
+        opened = adapter.prewarm(url, count, settings["verify"], settings["proxies"])
+        logger.info(f"Prewarmed {opened}/{count} connections to {url} in {time.monotonic() - started:.2f}s")
+
+    thread = threading.Thread(target=prewarm, name="port-connection-prewarm", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,125 @@
+"""Access token lifecycle for the Port API."""
+
+import base64
+import json
+import threading
+import time
+from collections.abc import Callable
+
+from src.utils import SharedCache, logger
+
+# Refresh this many seconds before the token expires, so requests never wait for a new token
+TOKEN_REFRESH_MARGIN = 120
+# Used when the token expiry can't be read, matches pyport's own refresh interval
+TOKEN_REFRESH_INTERVAL = 900
+TOKEN_RETRY_MIN_DELAY = 5
+TOKEN_RETRY_MAX_DELAY = 60
+
+
+def get_token_expiry(token: str) -> float | None:
+    """Read the ``exp`` claim of a JWT access token without verifying its signature."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenManager:
+    """Owns the access token: prefetches it, refreshes it before expiry and shares it.
+
+    Fetches are single-flight, callers that need a token while one is being fetched wait for
+    that fetch instead of sending their own request.
+    """
+
+    def __init__(
+        self,
+        fetch_token: Callable[[], str],
+        on_token: Callable[[str], None],
+        shared_cache: SharedCache | None = None,
+    ):
+        self._fetch_token = fetch_token
+        self._on_token = on_token
+        self._shared_cache = shared_cache
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._refresh_thread: threading.Thread | None = None
+        self.token: str | None = None
+        self.expires_at: float | None = None
+
+    def start(self) -> None:
+        """Fetch the first token and keep it fresh from a background thread."""
+        if self._refresh_thread is not None:
+            return
+        self._refresh_thread = threading.Thread(target=self._refresh_loop, name="port-token-refresh", daemon=True)
+        self._refresh_thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def get_token(self) -> str:
+        """Return a valid token, fetching one only if no fetch is already in flight."""
+        token = self.token
+        if token is not None and not self._expires_soon(self.expires_at, margin=0):
+            return token
+        with self._lock:
+            # Another caller may have fetched a token while we were waiting for the lock
+            if self.token is None or self._expires_soon(self.expires_at, margin=0):
+                self._refresh()
+            return self.token  # type: ignore[return-value]
+
+    def _refresh(self) -> None:
+        """Replace the current token, must be called with the lock held."""
+        token = self._get_shared_token()
+        if token is None:
+            logger.debug("Fetching a new access token")
+            token = self._fetch_token()
+            self._share_token(token)
+        self.token = token
+        self.expires_at = get_token_expiry(token)
+        self._on_token(token)
+
+    def _refresh_loop(self) -> None:
+        retry_delay = TOKEN_RETRY_MIN_DELAY
+        while not self._stopped.is_set():
+            try:
+                with self._lock:
+                    if self.token is None or self.expires_at is None or self._expires_soon(self.expires_at):
+                        self._refresh()
+                        logger.info("Access token refreshed")
+                retry_delay = TOKEN_RETRY_MIN_DELAY
+                self._stopped.wait(self._seconds_until_refresh())
+            except Exception as e:
+                # The current token may still be valid for a while, keep retrying until it isn't
+                logger.warning(f"Failed to refresh the access token, retrying in {retry_delay}s: {e}")
+                self._stopped.wait(retry_delay)
+                retry_delay = min(retry_delay * 2, TOKEN_RETRY_MAX_DELAY)
+
+    def _seconds_until_refresh(self) -> float:
+        if self.expires_at is None:
+            return TOKEN_REFRESH_INTERVAL
+        return max(self.expires_at - TOKEN_REFRESH_MARGIN - time.time(), 0)
+
+    @staticmethod
+    def _expires_soon(expires_at: float | None, margin: float = TOKEN_REFRESH_MARGIN) -> bool:
+        return expires_at is not None and expires_at - margin <= time.time()
+
+    def _get_shared_token(self) -> str | None:
+        if self._shared_cache is None:
+            return None
+        token: str | None = self._shared_cache.get("access_token")
+        if token is None or self._expires_soon(get_token_expiry(token)):
+            return None
+        logger.info("Using access token from the shared cache")
+        return token
+
+    def _share_token(self, token: str) -> None:
+        if self._shared_cache is None:
+            return
+        expires_at = get_token_expiry(token)
+        if expires_at is None:
+            logger.debug("Access token has no readable expiry, not sharing it")
+            return
+        # Other processes only pick up tokens they don't have to refresh right away
+        self._shared_cache.set("access_token", token, expires_at - time.time() - TOKEN_REFRESH_MARGIN)
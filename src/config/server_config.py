@@ -1,18 +1,29 @@
 import json
 import os
+import sys
+from pathlib import Path
 from typing import Any, Literal, cast
 
 from dotenv import load_dotenv
+from loguru import logger
 from pydantic import BaseModel, Field, ValidationError
 
-from src.utils import PortError, logger
-
 # Load environment variables from .env file if it exists, but don't override existing env vars
 load_dotenv(override=False)
 
 REGION_TO_PORT_API_BASE = {"EU": "https://api.getport.io/v1", "US": "https://api.us.getport.io/v1"}
 
 
+def _default_cache_dir() -> Path:
+    if sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    elif os.name == "nt":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "port-mcp-server"
+
+
 class McpServerConfig(BaseModel):
     port_client_id: str = Field(..., description="The client ID for the Port.io API")
     port_client_secret: str = Field(..., description="The client secret for the Port.io API")
@@ -22,6 +33,40 @@ class McpServerConfig(BaseModel):
     )
     api_validation_enabled: bool | None = Field(default=False, description="Whether to enable API validation")
     log_path: Literal["/tmp/port-mcp.log"] = Field(default="/tmp/port-mcp.log", description="The path to the log file")
+    shared_cache_enabled: bool = Field(
+        default=False,
+        description="Whether to share access tokens and metadata responses with other server processes on this host",
+    )
+    shared_cache_ttl: int = Field(default=300, ge=0, description="Time to live in seconds for shared metadata cache entries")
+    cache_dir: str | None = Field(default=None, description="Directory for on-disk caches, defaults to the user's cache directory")
+    snapshot_enabled: bool = Field(
+        default=False, description="Whether to persist the tool catalog on disk and load it on startup"
+    )
+    snapshot_interval: int = Field(
+        default=600, ge=0, description="Seconds between periodic catalog snapshots, 0 saves only on shutdown"
+    )
+    http_pool_size: int = Field(default=10, ge=1, description="Maximum number of connections kept open to the Port API")
+    http_keepalive_expiry: int = Field(
+        default=60, ge=0, description="Seconds an idle connection is reused before opening a new one, 0 disables expiry"
+    )
+    http_prewarm_connections: int = Field(
+        default=0, ge=0, description="Number of connections to the Port API to open at startup"
+    )
+    batch_max_concurrency: int = Field(
+        default=5, ge=1, description="Maximum number of calls of one batch tool call that run at the same time"
+    )
+    response_max_bytes: int = Field(
+        default=200_000, ge=0, description="Size in bytes tool responses are shaped to fit in, 0 disables shaping"
+    )
+    result_store_max_bytes: int = Field(
+        default=50_000_000, ge=0, description="Size in bytes of the truncated lists kept to page through"
+    )
+    result_store_ttl: int = Field(
+        default=900, ge=1, description="Seconds a truncated list is kept after it was last read"
+    )
+    tool_catalog_mode: bool = Field(
+        default=False, description="Whether to list the action tools only once they're found with search_tools"
+    )
 
     def __str__(self) -> str:
         port_client_id = self.port_client_id
@@ -45,37 +90,98 @@ class McpServerConfig(BaseModel):
     def port_api_base(self) -> str:
         return REGION_TO_PORT_API_BASE[self.region]
 
+    @property
+    def cache_path(self) -> Path:
+        return Path(self.cache_dir) if self.cache_dir else _default_cache_dir()
 
-def init_server_config(override: dict[str, Any] | None = None):
+
+def _set_config(new_config: McpServerConfig) -> McpServerConfig:
+    """Make ``new_config`` the server's configuration.
+
+    The configuration is updated in place once it exists, modules hold it from ``from src.config import config``
+    so a new object wouldn't reach them.
+    """
     global config
+    if "config" not in globals():
+        config = new_config
+        return config
+    for name in McpServerConfig.model_fields:
+        setattr(config, name, getattr(new_config, name))
+    return config
+
+
+def init_server_config(override: dict[str, Any] | None = None):
     if override is not None:
-        config = McpServerConfig(
+        api_validation_enabled = override.get("api_validation_enabled", False)
+        new_config = McpServerConfig(
             port_client_id=override.get("port_client_id", ""),
             port_client_secret=override.get("port_client_secret", ""),
             region=override.get("region", "EU"),
             log_level=override.get("log_level", "ERROR"),
-            api_validation_enabled=override.get("api_validation_enabled", "false") == "true",
+            api_validation_enabled=api_validation_enabled in (True, "true"),
+            shared_cache_enabled=override.get("shared_cache_enabled", False),
+            shared_cache_ttl=override.get("shared_cache_ttl", 300),
+            cache_dir=override.get("cache_dir"),
+            snapshot_enabled=override.get("snapshot_enabled", False),
+            snapshot_interval=override.get("snapshot_interval", 600),
+            http_pool_size=override.get("http_pool_size", 10),
+            http_keepalive_expiry=override.get("http_keepalive_expiry", 60),
+            http_prewarm_connections=override.get("http_prewarm_connections", 0),
+            batch_max_concurrency=override.get("batch_max_concurrency", 5),
+            response_max_bytes=override.get("response_max_bytes", 200_000),
+            result_store_max_bytes=override.get("result_store_max_bytes", 50_000_000),
+            result_store_ttl=override.get("result_store_ttl", 900),
+            tool_catalog_mode=override.get("tool_catalog_mode", False),
         )
-        return config
+        return _set_config(new_config)
     try:
         client_id = os.environ.get("PORT_CLIENT_ID", "")
         client_secret = os.environ.get("PORT_CLIENT_SECRET", "")
         region = os.environ.get("PORT_REGION", "EU")
         log_level = os.environ.get("PORT_LOG_LEVEL", "ERROR").upper()
         api_validation_enabled = os.environ.get("PORT_API_VALIDATION_ENABLED", "False").lower() == "true"
+        shared_cache_enabled = os.environ.get("PORT_SHARED_CACHE_ENABLED", "False").lower() == "true"
+        shared_cache_ttl = int(os.environ.get("PORT_SHARED_CACHE_TTL", "300"))
+        cache_dir = os.environ.get("PORT_CACHE_DIR") or None
+        snapshot_enabled = os.environ.get("PORT_SNAPSHOT_ENABLED", "False").lower() == "true"
+        snapshot_interval = int(os.environ.get("PORT_SNAPSHOT_INTERVAL", "600"))
+        http_pool_size = int(os.environ.get("PORT_HTTP_POOL_SIZE", "10"))
+        http_keepalive_expiry = int(os.environ.get("PORT_HTTP_KEEPALIVE_EXPIRY", "60"))
+        http_prewarm_connections = int(os.environ.get("PORT_HTTP_PREWARM_CONNECTIONS", "0"))
+        batch_max_concurrency = int(os.environ.get("PORT_BATCH_MAX_CONCURRENCY", "5"))
+        response_max_bytes = int(os.environ.get("PORT_RESPONSE_MAX_BYTES", "200000"))
+        result_store_max_bytes = int(os.environ.get("PORT_RESULT_STORE_MAX_BYTES", "50000000"))
+        result_store_ttl = int(os.environ.get("PORT_RESULT_STORE_TTL", "900"))
+        tool_catalog_mode = os.environ.get("PORT_TOOL_CATALOG_MODE", "False").lower() == "true"
         region = "US" if region.upper() == "US" else "EU"
         log_level = log_level.upper() or "ERROR"
-        config = McpServerConfig(
+        new_config = McpServerConfig(
             port_client_id=client_id,
             port_client_secret=client_secret,
             region=cast(Literal["EU", "US"], region),
             log_level=cast(Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], log_level),
             api_validation_enabled=api_validation_enabled,
+            shared_cache_enabled=shared_cache_enabled,
+            shared_cache_ttl=shared_cache_ttl,
+            cache_dir=cache_dir,
+            snapshot_enabled=snapshot_enabled,
+            snapshot_interval=snapshot_interval,
+            http_pool_size=http_pool_size,
+            http_keepalive_expiry=http_keepalive_expiry,
+            http_prewarm_connections=http_prewarm_connections,
+            batch_max_concurrency=batch_max_concurrency,
+            response_max_bytes=response_max_bytes,
+            result_store_max_bytes=result_store_max_bytes,
+            result_store_ttl=result_store_ttl,
+            tool_catalog_mode=tool_catalog_mode,
         )
-        return config
+        return _set_config(new_config)
     except ValidationError as e:
         message = f"❌ Error initializing server config: {e.errors()}"
         logger.error(message)
+        # The utilities are configured from this module, so they're imported once it's loaded
+        from src.utils import PortError
+
         raise PortError(message) from e
 
 
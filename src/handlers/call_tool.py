@@ -1,14 +1,18 @@
-import json
 from typing import Any
 
+import anyio
 from loguru import logger
 from mcp.types import TextContent
 from pydantic import ValidationError
 
 from src.models.tools import Tool
+from src.utils.response_shaping import shape_response
+from src.utils.result_store import ResultStore
 
 
-async def execute_tool(tool: Tool, arguments: dict[str, Any]):
+async def execute_tool(
+    tool: Tool, arguments: dict[str, Any], max_response_bytes: int = 0, result_store: ResultStore | None = None
+):
     tool_name = tool.name
     logger.info(f"Executing tool {tool_name}")
     logger.debug(f"Executing tool {tool_name} with arguments: {arguments}")
@@ -16,9 +20,13 @@ async def execute_tool(tool: Tool, arguments: dict[str, Any]):
         validated_args = tool.validate_input(arguments)
         logger.debug("Validation was successful")
         result = await tool.function(validated_args)
-        result_str = json.dumps(result)
+        result_str = shape_response(result, max_response_bytes, result_store)
         logger.debug(f"Tool {tool_name} returned: {result_str}")
         return [TextContent(type="text", text=result_str)]
+    except anyio.get_cancelled_exc_class():
+        # Let the cancellation reach the MCP request handler, it answers the client
+        logger.info(f"Tool {tool_name} was cancelled")
+        raise
     except ValidationError as e:
         errors = e.errors()
         logger.error(f"Error calling tool {tool_name}: {errors}, {e}")
@@ -1,7 +1,26 @@
+import hashlib
+
 from src.client import PortClient
 from src.config import config
 from src.models.tools import ToolMap
-from src.utils import logger
+from src.utils import SharedCache, logger
+from src.utils.result_store import ResultStore
+from src.utils.shared_cache import SHARED_CACHE_FILENAME
+
+
+def _cache_namespace() -> str:
+    # On-disk data is scoped to the credentials so different organizations never see each other's data
+    return hashlib.sha256(f"{config.region}:{config.port_client_id}".encode()).hexdigest()[:16]
+
+
+def init_shared_cache() -> SharedCache | None:
+    if not config.shared_cache_enabled:
+        return None
+    try:
+        return SharedCache(config.cache_path / SHARED_CACHE_FILENAME, _cache_namespace(), config.shared_cache_ttl)
+    except Exception as e:
+        logger.warning(f"Shared cache is unavailable, continuing without it: {e}")
+        return None
 
 
 def init_tool_map() -> ToolMap:
@@ -9,8 +28,20 @@ def init_tool_map() -> ToolMap:
         client_id=config.port_client_id,
         client_secret=config.port_client_secret,
         region=config.region,
+        shared_cache=init_shared_cache(),
+        pool_size=config.http_pool_size,
+        keepalive_expiry=config.http_keepalive_expiry,
+        prewarm_connections=config.http_prewarm_connections,
+    )
+    snapshot_path = config.cache_path / f"snapshot-{_cache_namespace()}.json" if config.snapshot_enabled else None
+    tool_map = ToolMap(
+        port_client=port_client,
+        snapshot_path=snapshot_path,
+        batch_max_concurrency=config.batch_max_concurrency,
+        response_max_bytes=config.response_max_bytes,
+        result_store=ResultStore(config.result_store_max_bytes, config.result_store_ttl),
+        catalog_mode=config.tool_catalog_mode,
     )
-    tool_map = ToolMap(port_client=port_client)
     logger.info("Initialized tool map")
     logger.debug(f"Tool map: {tool_map}")
     return tool_map
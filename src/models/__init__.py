@@ -12,17 +12,16 @@ organized into specialized modules:
 - actions: Action models
 """
 
-# Common models
-# Agent models
+import importlib
+from typing import Any
+
 from .action_run import ActionRun
 from .actions import Action
 from .agent import PortAgentResponse
 from .blueprints import Blueprint, CreateBlueprint, UpdateBlueprint
 from .common import Annotations, BaseModel
 from .entities import CreateEntity, EntityResult, UpdateEntity
-from .resources import Resource, ResourceMap
 from .scorecards import Scorecard, ScorecardCreate, ScorecardUpdate
-from .tools import Tool, ToolMap
 
 __all__ = [
     # Common
@@ -52,3 +51,15 @@ __all__ = [
     "Resource",
     "ResourceMap",
 ]
+
+
+# Loaded on first use: the tool map imports every tool and the client, which import the models, and
+# both build on the MCP SDK, which takes most of the import time
+LAZY_IMPORTS = {"Tool": "tools", "ToolMap": "tools", "Resource": "resources", "ResourceMap": "resources"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in LAZY_IMPORTS:
+        module = importlib.import_module(f"{__name__}.{LAZY_IMPORTS[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,5 @@
 """AI Agent related data models for Port.io."""
 
-from .port_agent_response import PortAgentResponse
+from .port_agent_response import PortAgentResponse, PortAgentStreamChunk
 
-__all__ = ["PortAgentResponse"]
+__all__ = ["PortAgentResponse", "PortAgentStreamChunk"]
@@ -23,3 +23,8 @@ class PortAgentResponse(BaseModel):
     error: str | SkipJsonSchema[None] = Field(None, description="The error of the agent response")
     action_url: str | SkipJsonSchema[None] = Field(None, description="The action URL of requied to visit to complete the action")
     selected_agent: str | SkipJsonSchema[None] = Field(None, description="The selected agent that generated the response")
+
+
+class PortAgentStreamChunk(BaseModel):
+    identifier: str | SkipJsonSchema[None] = Field(None, description="The identifier of the invocation, once announced")
+    text: str = Field("", description="The output generated since the previous chunk")
@@ -1,5 +1,5 @@
 """Blueprint related data models for Port.io."""
 
-from .blueprint import Blueprint, CreateBlueprint, UpdateBlueprint
+from .blueprint import Blueprint, BlueprintSummary, CreateBlueprint, UpdateBlueprint
 
-__all__ = ["Blueprint", "CreateBlueprint", "UpdateBlueprint"]
+__all__ = ["Blueprint", "BlueprintSummary", "CreateBlueprint", "UpdateBlueprint"]
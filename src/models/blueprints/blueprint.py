@@ -194,3 +194,13 @@ class CreateBlueprint(BlueprintCommon):
 
 class UpdateBlueprint(BlueprintCommon):
     pass
+
+
+class BlueprintSummary(BaseModel):
+    identifier: str = Field(..., description="The identifier of the blueprint")
+    title: str | SkipJsonSchema[None] = Field(default=None, description="The title of the blueprint")
+    description: str | SkipJsonSchema[None] = Field(default=None, description="The description of the blueprint")
+    properties: list[str] = Field(
+        ..., description="The identifiers of the blueprint's properties, including mirror and calculation properties"
+    )
+    relations: list[str] = Field(..., description="The identifiers of the blueprint's relations")
@@ -1,7 +1,7 @@
 """Common data types for Port.io models."""
 
 from .annotations import Annotations
-from .base_pydantic import BaseModel
+from .base_pydantic import BaseModel, list_adapter
 from .icon import Icon
 
-__all__ = ["BaseModel", "Icon", "Annotations"]
+__all__ = ["BaseModel", "Icon", "Annotations", "list_adapter"]
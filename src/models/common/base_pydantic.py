@@ -1,7 +1,8 @@
-from typing import Any
+from typing import Any, TypeVar
 
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import ConfigDict as PydanticConfigDict
+from pydantic import TypeAdapter
 
 
 def json_schema_extra(schema: dict[str, Any], model: Any) -> None:
@@ -11,6 +12,22 @@ def json_schema_extra(schema: dict[str, Any], model: Any) -> None:
 
 
 class BaseModel(PydanticBaseModel):
+    # Validators and serializers are built on first use, most models aren't used by a given request
     model_config = PydanticConfigDict(
-        validate_by_name=True, validate_by_alias=True, serialize_by_alias=True, json_schema_extra=json_schema_extra
+        validate_by_name=True,
+        validate_by_alias=True,
+        serialize_by_alias=True,
+        json_schema_extra=json_schema_extra,
+        defer_build=True,
     )
+
+
+ModelT = TypeVar("ModelT", bound=PydanticBaseModel)
+
+
+def list_adapter(model: type[ModelT]) -> TypeAdapter[list[ModelT]]:
+    """Validator of a list of the model's objects, validating the whole list in one call.
+
+    Create it once per module, like the models it's built on first use.
+    """
+    return TypeAdapter(list[model], config=PydanticConfigDict(defer_build=True))  # type: ignore[valid-type]
@@ -0,0 +1,101 @@
+"""Pydantic models generated from Port property definitions, like a blueprint's schema."""
+
+import re
+from collections.abc import Collection
+from typing import Annotated, Any, Literal
+
+from pydantic import AfterValidator, ConfigDict, Field, StrictBool, StrictFloat, StrictStr, create_model
+
+from src.models.common.base_pydantic import BaseModel
+
+
+class PropertiesModel(BaseModel):
+    """Base of the generated models, only the defined properties are accepted and only by their identifier."""
+
+    # Patterns come from Port, which allows lookarounds
+    model_config = ConfigDict(extra="forbid", validate_by_name=False, regex_engine="python-re")
+
+
+def _pattern(definition: dict[str, Any]) -> str | None:
+    """The property's pattern, unless Python can't compile it.
+
+    Port's patterns are JavaScript regular expressions, those using its own syntax like ``\\p{L}`` or
+    ``(?<name>...)`` aren't checked here and are left for Port to check.
+    """
+    pattern = definition.get("pattern")
+    if not isinstance(pattern, str):
+        return None
+    try:
+        re.compile(pattern)
+    except re.error:
+        return None
+    return pattern
+
+
+def _constraints(definition: dict[str, Any]) -> dict[str, Any]:
+    constraints = {
+        "min_length": definition.get("minLength", definition.get("minItems")),
+        "max_length": definition.get("maxLength", definition.get("maxItems")),
+        "pattern": _pattern(definition),
+        "ge": definition.get("minimum"),
+        "le": definition.get("maximum"),
+    }
+    return {name: value for name, value in constraints.items() if value is not None}
+
+
+def _whole_number(value: float) -> float | int:
+    # Strict floats turn integers into floats, they're sent back as integers
+    return int(value) if value.is_integer() else value
+
+
+def property_annotation(definition: dict[str, Any]) -> Any:
+    """The type values of a property definition must have, following Port's JSON schema based definitions."""
+    # Dynamic enums are a jq query Port runs to list the options, only the base type is checked for those
+    if isinstance(definition.get("enum"), list) and definition["enum"]:
+        annotation: Any = Literal[tuple(definition["enum"])]
+        return annotation
+    property_type = definition.get("type")
+    if property_type == "string":
+        annotation = StrictStr
+    elif property_type == "number":
+        # Integers are numbers too, strict floats accept them but not numeric strings or booleans
+        annotation = Annotated[StrictFloat, AfterValidator(_whole_number)]
+    elif property_type == "boolean":
+        return StrictBool
+    elif property_type == "object":
+        return dict[str, Any]
+    elif property_type == "array":
+        items = definition.get("items") or {}
+        annotation = list[property_annotation(items)] if items else list[Any]  # type: ignore[misc]
+    else:
+        return Any
+    constraints = _constraints(definition)
+    return Annotated[annotation, Field(**constraints)] if constraints else annotation
+
+
+def properties_model(
+    name: str,
+    annotations: dict[str, Any],
+    required: Collection[str],
+    descriptions: dict[str, str] | None = None,
+    nullable: bool = True,
+) -> type[BaseModel]:
+    """Create a model accepting an object with the given properties and the types of their values.
+
+    Fields are named by position and aliased with the property identifier, so identifiers that aren't valid
+    Python names or that clash with the model's attributes work as well. Optional properties may be left out,
+    and also be null when ``nullable``.
+    """
+    descriptions = descriptions or {}
+    fields: dict[str, Any] = {}
+    for index, (identifier, annotation) in enumerate(annotations.items()):
+        description = descriptions.get(identifier)
+        if identifier in required:
+            fields[f"field_{index}"] = (annotation, Field(..., alias=identifier, description=description))
+        else:
+            fields[f"field_{index}"] = (
+                annotation | None if nullable else annotation,
+                Field(default=None, alias=identifier, description=description),
+            )
+    model: type[BaseModel] = create_model(name, __base__=PropertiesModel, **fields)
+    return model
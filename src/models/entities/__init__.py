@@ -1,5 +1,18 @@
 """Entity related data models for Port.io."""
 
-from .entity import CreateEntity, EntityResult, UpdateEntity
+from .aggregation import EntityAggregation, EntityGroup, MetricStats
+from .bulk import BulkEntityResult
+from .entity import CreateEntity, EntityResult, EntitySort, UpdateEntity
+from .table import EntityTable
 
-__all__ = ["CreateEntity", "EntityResult", "UpdateEntity"]
+__all__ = [
+    "BulkEntityResult",
+    "CreateEntity",
+    "EntityAggregation",
+    "EntityGroup",
+    "EntityResult",
+    "EntitySort",
+    "EntityTable",
+    "MetricStats",
+    "UpdateEntity",
+]
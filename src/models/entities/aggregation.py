@@ -0,0 +1,36 @@
+"""Port.io entity aggregation models."""
+
+from pydantic import Field
+from pydantic.json_schema import SkipJsonSchema
+
+from src.models.common.base_pydantic import BaseModel
+
+
+class MetricStats(BaseModel):
+    count: int = Field(..., description="The number of entities with a numeric value for the property")
+    min: float | SkipJsonSchema[None] = Field(default=None, description="The smallest value")
+    max: float | SkipJsonSchema[None] = Field(default=None, description="The largest value")
+    avg: float | SkipJsonSchema[None] = Field(default=None, description="The average value")
+
+
+class EntityGroup(BaseModel):
+    value: str | SkipJsonSchema[None] = Field(
+        default=None, description="The value of the grouped field, missing for entities without one"
+    )
+    count: int = Field(..., description="The number of entities in the group")
+    metrics: dict[str, MetricStats] | SkipJsonSchema[None] = Field(
+        default=None, description="Stats of the numeric properties within the group"
+    )
+
+
+class EntityAggregation(BaseModel):
+    total: int = Field(..., description="The number of entities matching the query")
+    metrics: dict[str, MetricStats] | SkipJsonSchema[None] = Field(
+        default=None, description="Stats of the numeric properties across all entities"
+    )
+    groups: list[EntityGroup] | SkipJsonSchema[None] = Field(
+        default=None, description="The largest groups, by number of entities"
+    )
+    other_groups: int | SkipJsonSchema[None] = Field(
+        default=None, description="The number of smaller groups left out of the result"
+    )
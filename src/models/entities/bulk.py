@@ -0,0 +1,13 @@
+"""Port.io bulk entity operation models."""
+
+from pydantic import Field
+from pydantic.json_schema import SkipJsonSchema
+
+from src.models.common.base_pydantic import BaseModel
+
+
+class BulkEntityResult(BaseModel):
+    index: int = Field(..., description="The position of the entity in the request")
+    identifier: str | SkipJsonSchema[None] = Field(default=None, description="The identifier of the entity")
+    ok: bool = Field(..., description="Whether the operation succeeded for this entity")
+    error: str | SkipJsonSchema[None] = Field(default=None, description="Why the operation failed for this entity")
@@ -2,7 +2,7 @@
 
 from typing import Any, Literal
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic.json_schema import SkipJsonSchema
 
 from src.models.common.base_pydantic import BaseModel
@@ -21,14 +21,85 @@ class SearchRuleIn(BaseModel):
     value: list[str] = Field(..., description="The value of the search rule")
 
 
+SearchOperator = Literal[
+    "=",
+    "!=",
+    ">",
+    ">=",
+    "<",
+    "<=",
+    "between",
+    "notBetween",
+    "contains",
+    "containsAny",
+    "doesNotContains",
+    "beginsWith",
+    "doesNotBeginsWith",
+    "endsWith",
+    "doesNotEndsWith",
+    "in",
+    "notIn",
+    "isEmpty",
+    "isNotEmpty",
+    "relatedTo",
+]
+
+# Operators that only test the property itself and take no value
+VALUELESS_OPERATORS = ["isEmpty", "isNotEmpty"]
+
+
+class SearchRule(BaseModel):
+    property: str | SkipJsonSchema[None] = Field(
+        default=None,
+        description="The property or meta field ($identifier, $title, $team, $createdAt, $updatedAt, ...) to compare, not set for relatedTo",
+    )
+    operator: SearchOperator = Field(..., description="The operator of the search rule")
+    value: str | int | float | bool | list[str | int | float] | dict[str, Any] | SkipJsonSchema[None] = Field(
+        default=None,
+        description=(
+            "The value to compare with: a list for in, notIn and containsAny, {\"from\": ..., \"to\": ...} or "
+            "{\"preset\": ...} for between and notBetween, the related entity's identifier for relatedTo, "
+            "nothing for isEmpty and isNotEmpty"
+        ),
+    )
+    blueprint: str | SkipJsonSchema[None] = Field(
+        default=None, description="The blueprint of the related entity, only for relatedTo"
+    )
+    direction: Literal["upstream", "downstream"] | SkipJsonSchema[None] = Field(
+        default=None, description="The direction of the relation to follow, only for relatedTo"
+    )
+    required: bool | SkipJsonSchema[None] = Field(
+        default=None, description="Whether only required relations are followed, only for relatedTo"
+    )
+
+    @model_validator(mode="after")
+    def check_operands(self) -> "SearchRule":
+        if self.operator == "relatedTo":
+            if not self.blueprint or self.value is None:
+                raise ValueError("relatedTo rules need the blueprint and identifier of the related entity")
+            return self
+        if not self.property:
+            raise ValueError(f"{self.operator} rules need a property")
+        if self.value is None and self.operator not in VALUELESS_OPERATORS:
+            raise ValueError(f"{self.operator} rules need a value")
+        return self
+
+
 class SearchRuleQuery(BaseModel):
     combinator: Literal["and", "or"] = Field(..., description="The combinator of the search query")
-    rules: list[SearchRuleEquals | SearchRuleIn] = Field(..., description="The conditions of the search query")
+    rules: list[SearchRule] = Field(..., description="The conditions of the search query")
 
 
 class SearchQuery(BaseModel):
     combinator: Literal["and", "or"] = Field(..., description="The combinator of the search query")
-    rules: list[SearchRuleEquals | SearchRuleIn] = Field(..., description="The conditions of the search query")
+    rules: list[SearchRule | SearchRuleQuery] = Field(
+        ..., description="The conditions of the search query, a condition can be a query of its own to nest and/or"
+    )
+
+
+class EntitySort(BaseModel):
+    property: str = Field(..., description="The property or meta field ($identifier, $title, $createdAt, ...) to sort by")
+    order: Literal["asc", "desc"] = Field(default="asc", description="The sort order")
 
 
 class CommonEntity(BaseModel):
@@ -0,0 +1,18 @@
+"""Port.io entity table model."""
+
+from typing import Any
+
+from pydantic import Field
+
+from src.models.common.base_pydantic import BaseModel
+
+
+class EntityTable(BaseModel):
+    blueprint: str = Field(..., description="The blueprint of the entities")
+    columns: list[str] = Field(
+        ...,
+        description="The name of each column: identifier, title and other meta fields, then properties.<identifier> and relations.<identifier>",
+    )
+    rows: list[list[Any]] = Field(
+        ..., description="One row per entity with a value per column, relations are lists of related entity identifiers"
+    )
@@ -0,0 +1,53 @@
+"""Versioned on-disk snapshot of the tool catalog used for warm starts."""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic import Field, ValidationError
+
+from src.models.common.base_pydantic import BaseModel
+from src.utils import logger
+from src.utils.user_agent import get_user_agent
+
+# Bump whenever the snapshot layout changes, older snapshots are then ignored
+SNAPSHOT_VERSION = 1
+
+
+class CatalogSnapshot(BaseModel):
+    version: int = Field(default=SNAPSHOT_VERSION, description="The snapshot layout version")
+    server_version: str = Field(default_factory=get_user_agent, description="The server that wrote the snapshot")
+    saved_at: float = Field(default_factory=time.time, description="When the snapshot was written")
+    actions: list[dict[str, Any]] = Field(default_factory=list, description="The actions exposed as dynamic tools")
+    blueprints: dict[str, dict[str, Any]] = Field(default_factory=dict, description="The known blueprints")
+    scorecards: dict[str, list[dict[str, Any]]] = Field(default_factory=dict, description="The known scorecards by blueprint")
+    permissions: list[str] = Field(default_factory=list, description="The user's permissions")
+
+
+def load_snapshot(path: Path) -> CatalogSnapshot | None:
+    if not path.exists():
+        logger.info(f"No catalog snapshot at {path}")
+        return None
+    try:
+        snapshot = CatalogSnapshot.model_validate_json(path.read_bytes())
+    except (OSError, ValidationError) as e:
+        logger.warning(f"Ignoring unreadable catalog snapshot {path}: {e}")
+        return None
+    if snapshot.version != SNAPSHOT_VERSION or snapshot.server_version != get_user_agent():
+        logger.info(f"Ignoring catalog snapshot from {snapshot.server_version} (layout v{snapshot.version})")
+        return None
+    logger.info(f"Loaded catalog snapshot saved at {time.ctime(snapshot.saved_at)} with {len(snapshot.actions)} actions")
+    return snapshot
+
+
+def save_snapshot(path: Path, snapshot: CatalogSnapshot) -> None:
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # Write to a temporary file first so a crash never leaves a truncated snapshot behind
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(snapshot.model_dump(), f)
+    os.replace(tmp_path, path)
+    logger.info(f"Saved catalog snapshot with {len(snapshot.actions)} actions to {path}")
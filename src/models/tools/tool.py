@@ -7,7 +7,7 @@ from pydantic import ValidationError
 from src.models.common.annotations import Annotations
 from src.models.common.base_pydantic import BaseModel
 from src.utils import logger
-from src.utils.schema import inline_schema
+from src.utils.schema import model_schema
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -23,11 +23,11 @@ class Tool(Generic[T]):
 
     @property
     def input_schema_json(self):
-        return inline_schema(self.input_schema.model_json_schema())
+        return model_schema(self.input_schema)
 
     @property
     def output_schema_json(self):
-        return inline_schema(self.output_schema.model_json_schema())
+        return model_schema(self.output_schema)
 
     def validate_output(self, output: dict[str, Any]) -> BaseModel:
         logger.info(f"Validating output: {output}")
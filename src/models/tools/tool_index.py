@@ -0,0 +1,66 @@
+"""Inverted index over the dynamic action tools, to find them without listing all of them."""
+
+import re
+from bisect import bisect_left
+from collections import defaultdict
+
+from src.models.actions.action import Action
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+# Matches in the identifier or title of an action count more than matches in its description
+FIELD_WEIGHTS = {"identifier": 3, "title": 3, "blueprint": 2, "description": 1}
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase words of a text, identifiers are split on case changes too so ``createJiraIssue`` has ``jira``."""
+    return TOKEN_PATTERN.findall(re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", text).lower())
+
+
+class ToolIndex:
+    """Maps the words of each action's identifier, title, description and blueprint to the tools running it.
+
+    Query words match the words starting with them, so partial words like ``deploy`` find ``deployment``.
+    """
+
+    def __init__(self, tools: dict[str, Action] | None = None):
+        self._postings: dict[str, dict[str, int]] = defaultdict(dict)
+        self.names: set[str] = set()
+        for name, action in (tools or {}).items():
+            self.names.add(name)
+            fields = {
+                "identifier": action.identifier,
+                "title": action.title,
+                "blueprint": action.trigger.blueprint_identifier if action.trigger else None,
+                "description": action.description,
+            }
+            for field, text in fields.items():
+                for token in tokenize(text or ""):
+                    postings = self._postings[token]
+                    postings[name] = max(postings.get(name, 0), FIELD_WEIGHTS[field])
+        self._tokens = sorted(self._postings)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _matches(self, word: str) -> dict[str, int]:
+        """The tools having a word starting with ``word`` and the weight of their best matching field."""
+        matches: dict[str, int] = {}
+        for token in self._tokens[bisect_left(self._tokens, word) :]:
+            if not token.startswith(word):
+                break
+            # Whole words count more than words they're the start of
+            weight_bonus = 1 if token == word else 0
+            for name, weight in self._postings[token].items():
+                matches[name] = max(matches.get(name, 0), weight + weight_bonus)
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> list[str]:
+        """Names of the tools best matching the query, those matching the most of its words first."""
+        matched_words: dict[str, int] = defaultdict(int)
+        scores: dict[str, int] = defaultdict(int)
+        for word in set(tokenize(query)):
+            for name, weight in self._matches(word).items():
+                matched_words[name] += 1
+                scores[name] += weight
+        ranked = sorted(scores, key=lambda name: (-matched_words[name], -scores[name], name))
+        return ranked[:limit]
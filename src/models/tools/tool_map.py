@@ -1,41 +1,139 @@
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from pathlib import Path
 
+import anyio
 import mcp.types as types
 
 import src.tools as mcp_tools
 from src.client.client import PortClient
+from src.models.actions.action import Action
+from src.models.tools.snapshot import CatalogSnapshot, load_snapshot, save_snapshot
 from src.models.tools.tool import Tool
+from src.models.tools.tool_index import ToolIndex
 from src.tools.action.dynamic_actions import DynamicActionToolsManager
+from src.tools.batch import BatchTool
+from src.tools.catalog import SearchToolsTool
+from src.tools.results import FetchResultPageTool
 from src.utils import logger
+from src.utils.result_store import ResultStore
 
 
 @dataclass
 class ToolMap:
     port_client: PortClient
     tools: dict[str, Tool] = field(default_factory=dict)
+    snapshot_path: Path | None = None
+    dynamic_actions: list[Action] = field(default_factory=list)
+    # Set when the dynamic tools were loaded from a snapshot and still need to be revalidated
+    stale: bool = False
+    batch_max_concurrency: int = 5
+    response_max_bytes: int = 0
+    result_store: ResultStore = field(default_factory=ResultStore)
+    # Lists only the static tools and the dynamic ones found with search_tools
+    catalog_mode: bool = False
+    tool_index: ToolIndex = field(default_factory=ToolIndex)
+    revealed_tools: set[str] = field(default_factory=set)
+    # Called when found tools are added to the list, to notify the client
+    on_tools_changed: Callable[[], Awaitable[None]] | None = None
 
     def __post_init__(self):
         # Register static tools
         for tool in mcp_tools.__all__:
             module = mcp_tools.__dict__[tool]
             self.register_tool(module(self.port_client))
+        # Looks tools up when it runs, so batches can call dynamic tools registered later on
+        self.register_tool(
+            BatchTool(self.get_tool, self.batch_max_concurrency, self.response_max_bytes, self.result_store)
+        )
+        self.register_tool(FetchResultPageTool(self.result_store))
+        if self.catalog_mode:
+            self.register_tool(SearchToolsTool(self.search_tools))
         logger.info(f"ToolMap initialized with {len(self.tools)} static tools")
-        self._register_dynamic_action_tools()
+        if not self._load_snapshot():
+            self._register_dynamic_action_tools()
 
     def _register_dynamic_action_tools(self) -> None:
         """Register dynamic tools for each Port action."""
         try:
             dynamic_manager = DynamicActionToolsManager(self.port_client)
-            dynamic_tools = dynamic_manager.get_dynamic_action_tools_sync()
+            self._set_dynamic_actions(dynamic_manager.get_dynamic_actions_sync())
+        except Exception as e:
+            logger.error(f"Failed to register dynamic action tools: {e}")
 
-            for tool in dynamic_tools:
-                self.register_tool(tool)
+    def _set_dynamic_actions(self, actions: list[Action]) -> None:
+        dynamic_tools = DynamicActionToolsManager(self.port_client).create_dynamic_action_tools(actions)
+        previous_names = {DynamicActionToolsManager.get_tool_name(action) for action in self.dynamic_actions}
+        # Swap in a new dict so concurrent readers never see a half updated catalog
+        tools = {name: tool for name, tool in self.tools.items() if name not in previous_names}
+        tools.update({tool.name: tool for tool in dynamic_tools})
+        self.tools = tools
+        self.dynamic_actions = actions
+        self.tool_index = ToolIndex(
+            {DynamicActionToolsManager.get_tool_name(action): action for action in actions if action.identifier}
+        )
+        self.revealed_tools &= self.tool_index.names
+        logger.info(f"Registered {len(dynamic_tools)} dynamic action tools")
 
-            logger.info(f"Registered {len(dynamic_tools)} dynamic action tools")
+    def _load_snapshot(self) -> bool:
+        if self.snapshot_path is None:
+            return False
+        snapshot = load_snapshot(self.snapshot_path)
+        if snapshot is None:
+            return False
+        metadata = self.port_client.metadata
+        metadata.blueprints = snapshot.blueprints
+        metadata.scorecards = snapshot.scorecards
+        metadata.permissions = snapshot.permissions
+        try:
+            self._set_dynamic_actions([Action.model_validate(action, strict=False) for action in snapshot.actions])
         except Exception as e:
-            logger.error(f"Failed to register dynamic action tools: {e}")
+            logger.warning(f"Failed to restore dynamic action tools from snapshot: {e}")
+            return False
+        self.stale = True
+        return True
+
+    def save_snapshot(self) -> None:
+        if self.snapshot_path is None:
+            return
+        metadata = self.port_client.metadata
+        snapshot = CatalogSnapshot(
+            actions=[action.model_dump(exclude_none=True) for action in self.dynamic_actions],
+            blueprints=metadata.blueprints,
+            scorecards=metadata.scorecards,
+            permissions=metadata.permissions,
+        )
+        try:
+            save_snapshot(self.snapshot_path, snapshot)
+        except OSError as e:
+            logger.warning(f"Failed to save catalog snapshot: {e}")
+
+    async def refresh_dynamic_action_tools(self) -> bool:
+        """Re-fetch the actions from Port and return whether the dynamic tools changed."""
+        # Fetching blocks on HTTP calls, keep it off the event loop that serves requests
+        actions = await anyio.to_thread.run_sync(DynamicActionToolsManager(self.port_client).get_dynamic_actions_sync)
+        self.stale = False
+        if not actions and self.dynamic_actions:
+            logger.warning("Got no actions while revalidating, keeping the current dynamic tools")
+            return False
+        changed = [action.model_dump() for action in actions] != [action.model_dump() for action in self.dynamic_actions]
+        if changed:
+            self._set_dynamic_actions(actions)
+        logger.info(f"Revalidated dynamic action tools, changed: {changed}")
+        return changed
+
+    async def search_tools(self, query: str, limit: int = 10) -> list[Tool]:
+        """Find dynamic tools by their action and add them to the listed tools."""
+        tools = [self.tools[name] for name in self.tool_index.search(query, limit) if name in self.tools]
+        found = {tool.name for tool in tools}
+        if self.catalog_mode and not found <= self.revealed_tools:
+            self.revealed_tools |= found
+            if self.on_tools_changed is not None:
+                await self.on_tools_changed()
+        return tools
 
     def list_tools(self) -> list[types.Tool]:
+        hidden = self.tool_index.names - self.revealed_tools if self.catalog_mode else set()
         return [
             types.Tool(
                 name=tool.name,
@@ -44,6 +142,7 @@ class ToolMap:
                 annotations=tool.annotations.model_dump(),  # type: ignore
             )
             for tool in self.tools.values()
+            if tool.name not in hidden
         ]
 
     def get_tool(self, tool_name: str) -> Tool:
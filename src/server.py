@@ -1,17 +1,20 @@
 # ruff: noqa: I001
 
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import anyio
 import mcp.types as types
-from mcp.server.lowlevel import Server
+from mcp.server.lowlevel import NotificationOptions, Server
 
 from src.handlers import execute_tool
 from src.maps.tool_map import tool_map
 from src.utils import logger
 from src.config import config
 
+if TYPE_CHECKING:
+    from mcp.server.session import ServerSession
+
 
 def main():
     try:
@@ -24,23 +27,72 @@ def main():
         # Initialize FastMCP server
         mcp: Server = Server("Port MCP Server")
 
+        # The client session is only known once the first request arrives, background
+        # tasks that change the tool list before that leave the notification pending
+        session: ServerSession | None = None
+        tool_list_changed = False
+
+        async def remember_session():
+            nonlocal session, tool_list_changed
+            if session is None:
+                session = mcp.request_context.session
+            if tool_list_changed:
+                tool_list_changed = False
+                await session.send_tool_list_changed()
+
+        async def notify_tool_list_changed():
+            nonlocal tool_list_changed
+            tool_list_changed = True
+            if session is not None:
+                tool_list_changed = False
+                await session.send_tool_list_changed()
+
+        tool_map.on_tools_changed = notify_tool_list_changed
+
         @mcp.call_tool()
         async def call_tool(tool_name: str, arguments: dict[str, Any]):
+            await remember_session()
             tool = tool_map.get_tool(tool_name)
             logger.debug(f"Calling tool: {tool_name} with arguments: {arguments}")
-            return await execute_tool(tool, arguments)
+            return await execute_tool(tool, arguments, config.response_max_bytes, tool_map.result_store)
 
         @mcp.list_tools()
         async def list_tools() -> list[types.Tool]:
+            await remember_session()
             return tool_map.list_tools()
 
+        async def revalidate_tool_catalog():
+            if not tool_map.stale:
+                return
+            try:
+                if await tool_map.refresh_dynamic_action_tools():
+                    await notify_tool_list_changed()
+            except Exception as e:
+                logger.warning(f"Failed to revalidate the tool catalog: {e}")
+
+        async def save_snapshots_periodically():
+            while True:
+                await anyio.sleep(config.snapshot_interval)
+                tool_map.save_snapshot()
+
         # Run the server
         logger.info("Starting FastMCP server on stdio transport")
         from mcp.server.stdio import stdio_server
 
         async def arun():
-            async with stdio_server() as streams:
-                await mcp.run(streams[0], streams[1], mcp.create_initialization_options())
+            async with stdio_server() as streams, anyio.create_task_group() as tg:
+                tg.start_soon(revalidate_tool_catalog)
+                if tool_map.snapshot_path and config.snapshot_interval:
+                    tg.start_soon(save_snapshots_periodically)
+                try:
+                    await mcp.run(
+                        streams[0],
+                        streams[1],
+                        mcp.create_initialization_options(NotificationOptions(tools_changed=True)),
+                    )
+                finally:
+                    tg.cancel_scope.cancel()
+                    tool_map.save_snapshot()
 
         anyio.run(arun)
     except KeyboardInterrupt:
@@ -11,7 +11,7 @@ from src.tools.action import (
     TrackActionRunTool,
     UpdateActionTool,
 )
-from src.tools.ai_agent import InvokeAIAGentTool
+from src.tools.ai_agent import GetAIAgentInvocationTool, InvokeAIAGentTool
 from src.tools.blueprint import (
     CreateBlueprintTool,
     DeleteBlueprintTool,
@@ -20,8 +20,12 @@ from src.tools.blueprint import (
     UpdateBlueprintTool,
 )
 from src.tools.entity import (
+    AggregateEntitiesTool,
+    BulkDeleteEntitiesTool,
+    BulkUpsertEntitiesTool,
     CreateEntityTool,
     DeleteEntityTool,
+    GetEntitiesByIdsTool,
     GetEntitiesTool,
     GetEntityTool,
     UpdateEntityTool,
@@ -51,6 +55,7 @@ __all__ = [
     "GetBlueprintTool",
     "GetBlueprintsTool",
     "InvokeAIAGentTool",
+    "GetAIAgentInvocationTool",
     "UpdateBlueprintTool",
     "DeleteBlueprintTool",
     "CreateEntityTool",
@@ -58,6 +63,10 @@ __all__ = [
     "GetEntitiesTool",
     "UpdateEntityTool",
     "DeleteEntityTool",
+    "BulkUpsertEntitiesTool",
+    "BulkDeleteEntitiesTool",
+    "GetEntitiesByIdsTool",
+    "AggregateEntitiesTool",
     "GetActionTool",
     "ListActionsTool",
     "TrackActionRunTool",
@@ -8,18 +8,23 @@ import asyncio
 import re
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, create_model
 from pydantic.json_schema import SkipJsonSchema
 
 from src.client.client import PortClient
 from src.models.action_run.action_run import ActionRun
-from src.models.actions.action import Action
+from src.models.actions.action import Action, ActionSchema, ActionTrigger
 from src.models.common.annotations import Annotations
 from src.models.common.base_pydantic import BaseModel as PortBaseModel
+from src.models.common.property_schema import properties_model, property_annotation
 from src.models.tools.tool import Tool
 from src.tools.action.get_action import GetActionTool, GetActionToolSchema
 from src.tools.action.list_actions import ListActionsTool, ListActionsToolSchema
 from src.utils import logger
+from src.utils.schema import model_schema
+
+# Operations that run on an existing entity of the action's blueprint
+ENTITY_OPERATIONS = ("DAY-2", "DELETE")
 
 
 class DynamicActionToolSchema(BaseModel):
@@ -47,12 +52,85 @@ def _camel_to_snake(name: str) -> str:
     return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
 
 
+def _user_input_description(definition: dict[str, Any]) -> str | None:
+    parts = [definition.get("title"), definition.get("description")]
+    items = definition.get("items") or {}
+    # Entity pickers take the identifiers of entities of the input's blueprint
+    if definition.get("format") == "entity":
+        parts.append(f"The identifier of a '{definition.get('blueprint')}' entity")
+    elif items.get("format") == "entity":
+        parts.append(f"The identifiers of '{items.get('blueprint')}' entities")
+    return ". ".join(part.rstrip(".") for part in parts if part) or None
+
+
+def action_input_schema(action: Action) -> type[DynamicActionToolSchema]:
+    """Build the input schema of an action's tool from its user inputs.
+
+    Actions that don't define their user inputs keep the generic schema with free-form properties, as do
+    actions whose user inputs can't be turned into a schema, so they can still be run.
+    """
+    trigger = action.trigger
+    user_inputs = trigger.user_inputs if trigger else None
+    if trigger is None or user_inputs is None:
+        return DynamicActionToolSchema
+    try:
+        return _user_inputs_schema(action, trigger, user_inputs)
+    except Exception as e:
+        logger.warning(f"Using the generic input schema for action {action.identifier}, its user inputs failed to build: {e}")
+        return DynamicActionToolSchema
+
+
+def _user_inputs_schema(
+    action: Action, trigger: ActionTrigger, user_inputs: ActionSchema
+) -> type[DynamicActionToolSchema]:
+    definitions = user_inputs.properties or {}
+    # Required inputs may also be a jq query evaluated by Port when the action runs
+    required = user_inputs.required if isinstance(user_inputs.required, list) else []
+    descriptions = {identifier: _user_input_description(definition) for identifier, definition in definitions.items()}
+    inputs = properties_model(
+        f"{action.identifier}Inputs",
+        {identifier: property_annotation(definition) for identifier, definition in definitions.items()},
+        required,
+        {identifier: description for identifier, description in descriptions.items() if description},
+        nullable=False,
+    )
+
+    fields: dict[str, Any] = {}
+    if required:
+        fields["properties"] = (inputs, Field(..., description="The user inputs of the action"))
+    else:
+        fields["properties"] = (
+            inputs | SkipJsonSchema[None],  # type: ignore[misc]
+            Field(default=None, description="The user inputs of the action"),
+        )
+    if trigger.operation in ENTITY_OPERATIONS and trigger.blueprint_identifier:
+        fields["entity_identifier"] = (
+            str,
+            Field(
+                ...,
+                description=f"The identifier of the '{trigger.blueprint_identifier}' entity to run the action on",
+            ),
+        )
+    schema: type[DynamicActionToolSchema] = create_model(
+        f"{action.identifier}ToolSchema", __base__=DynamicActionToolSchema, **fields
+    )
+    # Generated now so an input that can't be described fails here rather than when the tools are listed
+    model_schema(schema)
+    return schema
+
+
 class DynamicActionToolsManager:
     """Manager for creating and registering dynamic action tools."""
 
     def __init__(self, port_client: PortClient):
         self.port_client = port_client
 
+    @staticmethod
+    def get_tool_name(action: Action) -> str:
+        """Get the name of the dynamic tool for an action."""
+        base_tool_name = f"run_{_camel_to_snake(action.identifier)}"
+        return base_tool_name[:40] if len(base_tool_name) > 40 else base_tool_name
+
     def _create_dynamic_action_tool(self, action: Action) -> Tool:
         """Create a dynamic tool for a specific Port action."""
 
@@ -60,33 +138,39 @@ class DynamicActionToolsManager:
             if not self.port_client.action_runs:
                 raise ValueError("Action runs client not available")
 
+            properties: Any = props.properties or {}
+            if isinstance(properties, BaseModel):
+                # Only the inputs that were given are sent, Port applies the defaults of the others
+                properties = properties.model_dump(exclude_unset=True)
+
             if props.entity_identifier:
                 action_run = await self.port_client.create_entity_action_run(
                     action_identifier=action.identifier,
                     entity=props.entity_identifier,
-                    properties=props.properties or {},
+                    properties=properties,
                 )
             else:
                 action_run = await self.port_client.create_global_action_run(
                     action_identifier=action.identifier,
-                    properties=props.properties or {},
+                    properties=properties,
                 )
 
             return DynamicActionToolResponse(action_run=action_run).model_dump()
 
-        base_tool_name = f"run_{_camel_to_snake(action.identifier)}"
-        tool_name = base_tool_name[:40] if len(base_tool_name) > 40 else base_tool_name
+        tool_name = self.get_tool_name(action)
 
         description = f"Execute the '{action.title}' action"
         if action.description:
             description += f": {action.description}"
-        description += f"\n\nTo see required properties, first call get_action with action_identifier='{action.identifier}' to view the userInputs schema."
+        input_schema = action_input_schema(action)
+        if input_schema is DynamicActionToolSchema:
+            description += f"\n\nTo see required properties, first call get_action with action_identifier='{action.identifier}' to view the userInputs schema."
 
         return Tool(
             name=tool_name,
             description=description,
             function=dynamic_action_function,
-            input_schema=DynamicActionToolSchema,
+            input_schema=input_schema,
             output_schema=DynamicActionToolResponse,
             annotations=Annotations(
                 title=f"Run {action.title}",
@@ -97,9 +181,19 @@ class DynamicActionToolsManager:
             ),
         )
 
-    async def get_dynamic_action_tools(self) -> list[Tool]:
-        """Get all dynamic action tools by fetching actions from Port."""
+    def create_dynamic_action_tools(self, actions: list[Action]) -> list[Tool]:
+        """Create dynamic tools for already fetched actions."""
         tools = []
+        for action in actions:
+            try:
+                tools.append(self._create_dynamic_action_tool(action))
+            except Exception as e:
+                logger.warning(f"Failed to create dynamic tool for action {action.identifier}: {e}")
+        return tools
+
+    async def get_dynamic_actions(self) -> list[Action]:
+        """Fetch the full definition of every action the user is allowed to execute."""
+        result = []
         try:
             list_actions_tool = ListActionsTool(self.port_client)
             actions_response = await list_actions_tool.list_actions(ListActionsToolSchema())
@@ -126,8 +220,7 @@ class DynamicActionToolsManager:
                     action = Action.model_validate(action_response, strict=False)
 
                     if action:
-                        dynamic_tool = self._create_dynamic_action_tool(action)
-                        tools.append(dynamic_tool)
+                        result.append(action)
 
                 except Exception as e:
                     logger.warning(
@@ -135,13 +228,21 @@ class DynamicActionToolsManager:
                     )
                     continue
 
-            logger.info(f"Created {len(tools)} dynamic action tools")
-
         except Exception as e:
             logger.error(f"Failed to create dynamic action tools: {e}")
 
+        return result
+
+    async def get_dynamic_action_tools(self) -> list[Tool]:
+        """Get all dynamic action tools by fetching actions from Port."""
+        tools = self.create_dynamic_action_tools(await self.get_dynamic_actions())
+        logger.info(f"Created {len(tools)} dynamic action tools")
         return tools
 
     def get_dynamic_action_tools_sync(self) -> list[Tool]:
         """Synchronous wrapper for getting dynamic action tools."""
         return asyncio.run(self.get_dynamic_action_tools())
+
+    def get_dynamic_actions_sync(self) -> list[Action]:
+        """Synchronous wrapper for getting the actions behind the dynamic tools."""
+        return asyncio.run(self.get_dynamic_actions())
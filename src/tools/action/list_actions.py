@@ -11,7 +11,10 @@ from src.utils import logger
 
 
 class ListActionsToolSchema(BaseModel):
-    detailed: bool = Field(default=True, description="Whether to return detailed actions")
+    detailed: bool = Field(
+        default=True,
+        description="If True (default), returns the identifier, title, description and blueprint of each action. If False, returns only the identifier, title and blueprint.",
+    )
     trigger_type: str = Field(
         default="self-service",
         description="The type of trigger to filter actions by self-service or automation",
@@ -47,6 +50,11 @@ class ListActionsTool(Tool[ListActionsToolSchema]):
     async def list_actions(self, props: ListActionsToolSchema) -> dict[str, Any]:
         logger.info(f"ListActionsTool.list_actions called with props: {props}")
 
+        if not props.detailed:
+            summaries = await self.port_client.get_action_summaries(props.trigger_type)
+            response = ListActionsToolResponse.construct(actions=summaries)
+            return response.model_dump(exclude_unset=True, exclude_none=True)
+
         actions = await self.port_client.get_all_actions(props.trigger_type)
 
         # Convert full Action objects to ActionSummary objects
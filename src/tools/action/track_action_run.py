@@ -1,22 +1,66 @@
 import asyncio
+import base64
+import json
+import time
 from typing import Any
 
 from pydantic import Field
+from pydantic.json_schema import SkipJsonSchema
 
+from src.client.action_run_poller import ActionRunPoller
 from src.client.client import PortClient
 from src.models.action_run import ActionRun
 from src.models.common.annotations import Annotations
 from src.models.common.base_pydantic import BaseModel
 from src.models.tools.tool import Tool
+from src.utils import logger
+from src.utils.errors import PortError
+from src.utils.progress import report_progress
+
+TERMINAL_STATUSES = ["SUCCESS", "FAILURE", "CANCELLED"]
 
 
 class TrackActionRunToolSchema(BaseModel):
     run_id: str = Field(description="The action run ID to track")
-    poll_interval: int = Field(default=2, description="How often to poll for updates (seconds)")
+    poll_interval: int = Field(
+        default=1,
+        ge=1,
+        description="Initial seconds between polls, doubled while the status doesn't change up to max_poll_interval",
+    )
+    max_poll_interval: int = Field(default=30, ge=1, description="Maximum seconds between polls")
+    timeout: int = Field(
+        default=120,
+        ge=0,
+        description="Seconds to wait for the run to finish before returning its latest status and a resume token",
+    )
+    resume_token: str | SkipJsonSchema[None] = Field(
+        default=None, description="The resume token returned by a previous call that timed out"
+    )
 
 
 class TrackActionRunToolResponse(BaseModel):
     action_run: ActionRun = Field(description="Final action run status and details")
+    timed_out: bool | SkipJsonSchema[None] = Field(
+        default=None, description="Whether the run was still in progress when the timeout was reached"
+    )
+    resume_token: str | SkipJsonSchema[None] = Field(
+        default=None, description="Pass to track_action_run to continue tracking after a timeout"
+    )
+
+
+def encode_resume_token(run_id: str, status: str, poll_interval: float | None) -> str:
+    state = {"run_id": run_id, "status": status, "poll_interval": poll_interval}
+    return base64.urlsafe_b64encode(json.dumps(state).encode()).decode()
+
+
+def decode_resume_token(resume_token: str) -> dict[str, Any]:
+    try:
+        state = json.loads(base64.urlsafe_b64decode(resume_token.encode()))
+    except ValueError as e:
+        raise PortError(f"Invalid resume token: {resume_token}") from e
+    if not isinstance(state, dict):
+        raise PortError(f"Invalid resume token: {resume_token}")
+    return state
 
 
 class TrackActionRunTool(Tool[TrackActionRunToolSchema]):
@@ -27,7 +71,10 @@ class TrackActionRunTool(Tool[TrackActionRunToolSchema]):
     def __init__(self, port_client: PortClient):
         super().__init__(
             name="track_action_run",
-            description="Track an action run's progress, showing logs and final status",
+            description=(
+                "Track an action run's progress, showing logs and final status. If the run doesn't finish "
+                "within the timeout, returns its latest status and a resume token to continue tracking"
+            ),
             input_schema=TrackActionRunToolSchema,
             output_schema=TrackActionRunToolResponse,
             annotations=Annotations(
@@ -40,18 +87,48 @@ class TrackActionRunTool(Tool[TrackActionRunToolSchema]):
             function=self.track_action_run,
         )
         self.port_client = port_client
+        # Shared by all calls, so concurrent trackers of the same run don't each poll it
+        self.poller = ActionRunPoller(port_client.get_action_run)
 
     async def track_action_run(self, props: TrackActionRunToolSchema) -> dict[str, Any]:
-        action_run = await self.port_client.get_action_run(props.run_id)
+        deadline = time.monotonic() + props.timeout
+        last_status: str | None = None
+        current_interval: float | None = None
+        if props.resume_token:
+            state = decode_resume_token(props.resume_token)
+            if state.get("run_id") != props.run_id:
+                raise PortError(f"The resume token doesn't belong to action run {props.run_id}")
+            # Continue with the backoff reached before the timeout instead of polling fast again
+            last_status = state.get("status")
+            current_interval = state.get("poll_interval")
+        status_changes = 0
 
-        while True:
-            action_run = await self.port_client.get_action_run(props.run_id)
+        async with self.poller.subscribe(
+            props.run_id, props.poll_interval, props.max_poll_interval, current_interval
+        ) as updates:
+            while True:
+                try:
+                    update = await asyncio.wait_for(updates.get(), max(deadline - time.monotonic(), 0))
+                except TimeoutError:
+                    return await self._timed_out(props)
+                if isinstance(update, Exception):
+                    raise update
 
-            status = action_run.status
+                status = update.status
+                if status != last_status:
+                    status_changes += 1
+                    logger.info(f"Action run {props.run_id} status: {status}")
+                    await report_progress(status_changes, message=f"Action run {props.run_id} is {status}")
+                    last_status = status
 
-            if status in ["SUCCESS", "FAILURE", "CANCELLED"]:
-                response = TrackActionRunToolResponse.construct(action_run=action_run)
-                return response.model_dump(exclude_unset=True, exclude_none=True)
+                if status in TERMINAL_STATUSES:
+                    response = TrackActionRunToolResponse.construct(action_run=update)
+                    return response.model_dump(exclude_unset=True, exclude_none=True)
 
-            # Wait before next poll
-            await asyncio.sleep(props.poll_interval)
+    async def _timed_out(self, props: TrackActionRunToolSchema) -> dict[str, Any]:
+        # Nothing was polled yet when the timeout is shorter than the first poll
+        action_run = self.poller.latest(props.run_id) or await self.port_client.get_action_run(props.run_id)
+        logger.info(f"Stopped tracking action run {props.run_id} after {props.timeout}s, status: {action_run.status}")
+        resume_token = encode_resume_token(props.run_id, action_run.status, self.poller.interval(props.run_id))
+        response = TrackActionRunToolResponse.construct(action_run=action_run, timed_out=True, resume_token=resume_token)
+        return response.model_dump(exclude_unset=True, exclude_none=True)
@@ -3,8 +3,10 @@
 This module aggregates all tools for the Port MCP server.
 """
 
+from .get_ai_agent_invocation import GetAIAgentInvocationTool
 from .invoke_ai_agent import InvokeAIAGentTool
 
 __all__ = [
+    "GetAIAgentInvocationTool",
     "InvokeAIAGentTool",
 ]
@@ -0,0 +1,46 @@
+from typing import Any
+
+from pydantic import Field
+
+from src.client import PortClient
+from src.models.common.annotations import Annotations
+from src.models.common.base_pydantic import BaseModel
+from src.models.tools.tool import Tool
+from src.tools.ai_agent.invocation import InvokeAIAGentToolResponse, invocation_response, wait_for_invocation
+
+
+class GetAIAgentInvocationToolSchema(BaseModel):
+    invocation_id: str = Field(..., description="The invocation identifier returned by invoke_ai_agent")
+    wait: int = Field(
+        default=0,
+        ge=0,
+        description="Seconds to wait for the invocation to finish, 0 returns the current status right away",
+    )
+    stream: bool = Field(default=False, description="Relay partial output as progress notifications while waiting")
+
+
+class GetAIAgentInvocationTool(Tool):
+    port_client: PortClient
+
+    def __init__(self, port_client: PortClient):
+        super().__init__(
+            name="get_ai_agent_invocation",
+            description="Get the status and answer of a Port AI agent invocation, optionally waiting for it to finish",
+            input_schema=GetAIAgentInvocationToolSchema,
+            output_schema=InvokeAIAGentToolResponse,
+            annotations=Annotations(
+                title="Get AI Agent Invocation",
+                readOnlyHint=True,
+                destructiveHint=False,
+                idempotentHint=True,
+                openWorldHint=True,
+            ),
+            function=self.get_ai_agent_invocation,
+        )
+        self.port_client = port_client
+
+    async def get_ai_agent_invocation(self, props: GetAIAgentInvocationToolSchema) -> dict[str, Any]:
+        agent_result, _ = await wait_for_invocation(
+            self.port_client, props.invocation_id, props.wait, stream=props.stream
+        )
+        return invocation_response(props.invocation_id, agent_result)
@@ -0,0 +1,126 @@
+"""Streaming and polling of AI agent invocations shared by the AI agent tools."""
+
+import asyncio
+import time
+from typing import Any
+
+import anyio
+from pydantic import Field
+from pydantic.json_schema import SkipJsonSchema
+
+from src.client import PortClient
+from src.models.agent import PortAgentResponse, PortAgentStreamChunk
+from src.models.agent.port_agent_response import PortAgentTriggerResponse
+from src.models.common.base_pydantic import BaseModel
+from src.utils import logger
+from src.utils.progress import report_progress
+
+FINISHED_STATUSES = ["completed", "failed", "error"]
+# Agents often answer within a few seconds, poll fast first and back off for longer invocations
+POLL_INTERVAL = 0.5
+MAX_POLL_INTERVAL = 5
+POLL_BACKOFF = 1.5
+
+
+class InvokeAIAGentToolResponse(BaseModel):
+    invocation_id: str = Field(description="The identifier of the invocation")
+    invocation_status: str = Field(description="The status of the invocation")
+    message: str = Field(description="The message from the AI agent")
+    selected_agent: str | SkipJsonSchema[None] = Field(
+        default=None, description="The selected agent that generated the response"
+    )
+
+
+def is_finished(agent_result: PortAgentResponse) -> bool:
+    return agent_result.status.lower() in FINISHED_STATUSES
+
+
+async def relay_output(output: str, relayed: str) -> str:
+    """Send the output the client hasn't seen yet as a progress notification and return what was relayed."""
+    if not output or output == relayed:
+        return relayed
+    # The agent normally appends to its output, resend everything if it was rewritten instead
+    delta = output[len(relayed) :] if output.startswith(relayed) else output
+    await report_progress(len(output), message=delta)
+    return output
+
+
+async def wait_for_invocation(
+    port_client: PortClient, identifier: str, timeout: float, stream: bool = False, relayed: str = ""
+) -> tuple[PortAgentResponse, bool]:
+    """Poll an invocation until it finishes or the timeout passes, returning its latest status and whether it finished.
+
+    ``relayed`` is the output the client already received, e.g. from a stream that was cut off.
+    """
+    deadline = time.monotonic() + timeout
+    poll_interval: float = POLL_INTERVAL
+    attempt = 1
+    while True:
+        logger.info(f"Polling attempt {attempt} for invocation {identifier}")
+        agent_result = await port_client.get_invocation_status(identifier)
+        logger.info(f"Status received: {agent_result.status}")
+        if stream:
+            relayed = await relay_output(agent_result.output or "", relayed)
+
+        if is_finished(agent_result):
+            logger.info(f"Invocation {identifier} finished with status: {agent_result.status}")
+            return agent_result, True
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.warning(f"Invocation {identifier} still in progress after {timeout} seconds")
+            logger.warning(f"Last status: {agent_result.status}")
+            return agent_result, False
+
+        await asyncio.sleep(min(poll_interval, remaining))
+        poll_interval = min(poll_interval * POLL_BACKOFF, MAX_POLL_INTERVAL)
+        attempt += 1
+
+
+async def stream_invocation(
+    port_client: PortClient, prompt: str, timeout: float
+) -> tuple[str | None, PortAgentResponse | None, bool]:
+    """Invoke the agent and relay its output as progress notifications while it's generated.
+
+    Falls back to polling when the API doesn't stream or the stream ends before the agent finishes.
+    Returns the invocation identifier, its latest status and whether it finished, the identifier and
+    status are unknown when the timeout passes before the stream announced them.
+    """
+    deadline = time.monotonic() + timeout
+    identifier: str | None = None
+    relayed = ""
+
+    async def relay_chunk(chunk: PortAgentStreamChunk) -> None:
+        nonlocal identifier, relayed
+        identifier = identifier or chunk.identifier
+        if chunk.text:
+            relayed += chunk.text
+            await report_progress(len(relayed), message=chunk.text)
+
+    result: PortAgentResponse | PortAgentTriggerResponse | None = None
+    with anyio.move_on_after(timeout):
+        result = await port_client.stream_agent(prompt, relay_chunk)
+    if result is None:
+        logger.warning(f"Agent invocation {identifier} still streaming after {timeout} seconds")
+        return identifier, None, False
+
+    if isinstance(result, PortAgentTriggerResponse):
+        identifier = result.invocation.identifier
+    elif is_finished(result):
+        logger.info(f"Invocation {result.identifier} finished with status: {result.status}")
+        return result.identifier, result, True
+    else:
+        identifier = result.identifier
+
+    remaining = max(deadline - time.monotonic(), 0)
+    agent_result, finished = await wait_for_invocation(port_client, identifier, remaining, stream=True, relayed=relayed)
+    return identifier, agent_result, finished
+
+
+def invocation_response(identifier: str, agent_result: PortAgentResponse) -> dict[str, Any]:
+    return InvokeAIAGentToolResponse(
+        invocation_id=identifier,
+        invocation_status=agent_result.status,
+        message=agent_result.output or "",
+        selected_agent=agent_result.selected_agent,
+    ).model_dump(exclude_unset=True, exclude_none=True)
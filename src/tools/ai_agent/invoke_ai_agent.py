@@ -1,24 +1,34 @@
-import asyncio
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field
 
 from src.client import PortClient
+from src.models.agent import PortAgentResponse
 from src.models.common.annotations import Annotations
 from src.models.common.base_pydantic import BaseModel
 from src.models.tools.tool import Tool
+from src.tools.ai_agent.invocation import (
+    InvokeAIAGentToolResponse,
+    invocation_response,
+    stream_invocation,
+    wait_for_invocation,
+)
 from src.utils import logger
 
 
 class InvokeAIAGentToolSchema(BaseModel):
     prompt: str = Field(..., description="The prompt to send to the AI agent")
-
-
-class InvokeAIAGentToolResponse(BaseModel):
-    invocation_id: str = Field(description="The identifier of the invocation")
-    invocation_status: str = Field(description="The status of the invocation")
-    message: str = Field(description="The message from the AI agent")
-    selected_agent: str | None = Field(default=None, description="The selected agent that generated the response")
+    mode: Literal["wait", "async", "stream"] = Field(
+        default="wait",
+        description=(
+            "wait: return the agent's answer once it finishes. async: return the invocation id right away, "
+            "check it later with get_ai_agent_invocation. stream: like wait, and relay the output as "
+            "progress notifications while the agent generates it"
+        ),
+    )
+    timeout: int = Field(
+        default=50, ge=0, description="Seconds to wait for the agent in wait and stream modes before timing out"
+    )
 
 
 class InvokeAIAGentTool(Tool):
@@ -44,43 +54,42 @@ class InvokeAIAGentTool(Tool):
     async def invoke_ai_agent(self, props: InvokeAIAGentToolSchema) -> dict[str, Any]:
         prompt = props.prompt
         logger.info(f"Invoking Port's AI agent with prompt: {prompt[:50]}{'...' if len(prompt) > 50 else ''}")
+        if props.mode == "stream":
+            stream_identifier, agent_result, finished = await stream_invocation(self.port_client, prompt, props.timeout)
+            if finished and stream_identifier is not None and agent_result is not None:
+                return invocation_response(stream_identifier, agent_result)
+            return self._timed_out(stream_identifier, agent_result)
+
         response = await self.port_client.trigger_agent(prompt)
 
         identifier = response.invocation.identifier
 
         logger.info(f"Got invocation identifier: {identifier}")
 
-        # Poll for completion
-        max_attempts = 10
-        attempt = 1
-        while attempt < max_attempts:
-            logger.info(f"Polling attempt {attempt}/{max_attempts} for invocation {identifier}")
-            agent_result = await self.port_client.get_invocation_status(identifier)
-            logger.info(f"Status received: {agent_result.status}")
-
-            if agent_result.status.lower() in ["completed", "failed", "error"]:
-                logger.info(f"Invocation {identifier} finished with status: {agent_result.status}")
-                return InvokeAIAGentToolResponse(
-                    invocation_id=identifier,
-                    invocation_status=agent_result.status,
-                    message=agent_result.output or "",
-                    selected_agent=agent_result.selected_agent,
-                ).model_dump(exclude_unset=True, exclude_none=True)
+        if props.mode == "async":
+            return InvokeAIAGentToolResponse(
+                invocation_id=identifier,
+                invocation_status="in_progress",
+                message=f"The agent is working on it. Check the result with get_ai_agent_invocation and identifier: {identifier}",
+            ).model_dump(exclude_unset=True, exclude_none=True)
 
-            logger.warning(
-                f"Invocation {identifier} still in progress after {attempt * 5} seconds. Status: {agent_result.status}"
-            )
-            logger.warning(f"Status details: {agent_result.__dict__ if hasattr(agent_result, '__dict__') else agent_result}")
-
-            await asyncio.sleep(5)
-            attempt += 1
+        agent_result, finished = await wait_for_invocation(self.port_client, identifier, props.timeout)
+        if finished:
+            return invocation_response(identifier, agent_result)
+        return self._timed_out(identifier, agent_result)
 
-        logger.warning(f"Invocation {identifier} timed out after {max_attempts * 5} seconds")
-        logger.warning(f"Last status: {agent_result.status}")
+    def _timed_out(self, identifier: str | None, agent_result: PortAgentResponse | None) -> dict[str, Any]:
         logger.warning(f"Last status details: {agent_result.__dict__ if hasattr(agent_result, '__dict__') else agent_result}")
-
+        if identifier is None:
+            # The stream hadn't announced the invocation yet when the timeout passed
+            message = "⏳ Operation timed out before the agent started answering. Try again with a longer timeout"
+        else:
+            message = (
+                "⏳ Operation timed out. You can check the status later with get_ai_agent_invocation "
+                f"and identifier: {identifier}"
+            )
         return InvokeAIAGentToolResponse.model_construct(
-            invocation_id=identifier,
+            invocation_id=identifier or "",
             invocation_status="timed_out",
-            message="⏳ Operation timed out. You can check the status later with identifier: {identifier}",
+            message=message,
         ).model_dump(exclude_unset=True, exclude_none=True)
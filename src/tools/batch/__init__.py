@@ -0,0 +1,8 @@
+"""Tools for Port MCP server.
+
+This module aggregates all tools for the Port MCP server.
+"""
+
+from .batch import BatchTool
+
+__all__ = ["BatchTool"]
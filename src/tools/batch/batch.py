@@ -0,0 +1,108 @@
+import json
+from collections.abc import Callable
+from typing import Any
+
+import anyio
+from pydantic import Field
+from pydantic.json_schema import SkipJsonSchema
+
+from src.models.common.annotations import Annotations
+from src.models.common.base_pydantic import BaseModel
+from src.models.tools.tool import Tool
+from src.utils import logger
+from src.utils.result_store import ResultStore
+
+BATCH_TOOL_NAME = "batch"
+
+
+class BatchToolCall(BaseModel):
+    tool_name: str = Field(..., description="The name of the tool to call")
+    arguments: dict[str, Any] = Field(default_factory=dict, description="The arguments of the tool call")
+
+
+class BatchToolSchema(BaseModel):
+    calls: list[BatchToolCall] = Field(
+        ..., min_length=1, max_length=50, description="The tool calls to run, independent of each other"
+    )
+
+
+class BatchCallResult(BaseModel):
+    tool_name: str = Field(..., description="The name of the tool called")
+    ok: bool = Field(..., description="Whether the call succeeded")
+    result: Any | SkipJsonSchema[None] = Field(default=None, description="The result of the call")
+    error: str | SkipJsonSchema[None] = Field(default=None, description="Why the call failed")
+
+
+class BatchToolResponse(BaseModel):
+    results: list[BatchCallResult] = Field(..., description="The outcome of each call, in the order given")
+
+
+class BatchTool(Tool[BatchToolSchema]):
+    """Runs several independent tool calls concurrently in one MCP round trip."""
+
+    def __init__(
+        self,
+        get_tool: Callable[[str], Tool],
+        max_concurrency: int = 5,
+        max_response_bytes: int = 0,
+        result_store: ResultStore | None = None,
+    ):
+        super().__init__(
+            name=BATCH_TOOL_NAME,
+            description=(
+                "Run several independent tool calls at once and get all of their results in one response. "
+                "Use it instead of calling tools one after another when no call depends on another's result"
+            ),
+            input_schema=BatchToolSchema,
+            output_schema=BatchToolResponse,
+            annotations=Annotations(
+                title="Batch Tool Calls",
+                readOnlyHint=False,
+                destructiveHint=True,
+                idempotentHint=False,
+                openWorldHint=True,
+            ),
+            function=self.batch,
+        )
+        self.get_tool = get_tool
+        self.max_concurrency = max_concurrency
+        self.max_response_bytes = max_response_bytes
+        self.result_store = result_store
+
+    async def batch(self, props: BatchToolSchema) -> dict[str, Any]:
+        results: list[BatchCallResult | None] = [None] * len(props.calls)
+        runnable: list[tuple[int, Tool, dict[str, Any]]] = []
+        # Invalid calls fail on their own without running anything, the valid ones still run
+        for index, call in enumerate(props.calls):
+            try:
+                if call.tool_name == BATCH_TOOL_NAME:
+                    raise ValueError("Batches can't be nested")
+                tool = self.get_tool(call.tool_name)
+                tool.validate_input(call.arguments)
+            except ValueError as e:
+                results[index] = BatchCallResult(tool_name=call.tool_name, ok=False, error=str(e))
+                continue
+            runnable.append((index, tool, call.arguments))
+
+        logger.info(f"Running {len(runnable)}/{len(props.calls)} batched tool calls")
+        semaphore = anyio.Semaphore(self.max_concurrency)
+        # Each call gets a share of the budget, so one large result doesn't crowd out the others
+        max_response_bytes = self.max_response_bytes // max(len(runnable), 1)
+
+        # The handlers import the tool models, which register this tool, so import them only once needed
+        from src.handlers.call_tool import execute_tool
+
+        async def run(index: int, tool: Tool, arguments: dict[str, Any]) -> None:
+            async with semaphore:
+                try:
+                    content = await execute_tool(tool, arguments, max_response_bytes, self.result_store)
+                    results[index] = BatchCallResult(tool_name=tool.name, ok=True, result=json.loads(content[0].text))
+                except Exception as e:
+                    results[index] = BatchCallResult(tool_name=tool.name, ok=False, error=str(e))
+
+        async with anyio.create_task_group() as tg:
+            for index, tool, arguments in runnable:
+                tg.start_soon(run, index, tool, arguments)
+
+        response = BatchToolResponse.construct(results=results)
+        return response.model_dump(exclude_unset=True, exclude_none=True)
@@ -3,18 +3,21 @@ from typing import Any
 from pydantic import Field
 
 from src.client.client import PortClient
-from src.models.blueprints import Blueprint
+from src.models.blueprints import Blueprint, BlueprintSummary
 from src.models.common.annotations import Annotations
 from src.models.common.base_pydantic import BaseModel
 from src.models.tools.tool import Tool
 
 
 class GetBlueprintsToolSchema(BaseModel):
-    detailed: bool = Field(default=True, description="Whether to return detailed blueprints")
+    detailed: bool = Field(
+        default=True,
+        description="If True (default), returns the full blueprint definitions. If False, returns only the identifier, title, description and property and relation names of each blueprint, prefer False to find out which blueprints exist.",
+    )
 
 
 class GetBlueprintsToolResponse(BaseModel):
-    blueprints: list[Blueprint] = Field(description="The list of blueprints")
+    blueprints: list[Blueprint] | list[BlueprintSummary] = Field(description="The list of blueprints")
 
 
 class GetBlueprintsTool(Tool[GetBlueprintsToolSchema]):
@@ -40,6 +43,11 @@ class GetBlueprintsTool(Tool[GetBlueprintsToolSchema]):
         self.port_client = port_client
 
     async def get_blueprints(self, props: GetBlueprintsToolSchema) -> dict[str, Any]:
+        if not props.detailed:
+            summaries = await self.port_client.get_blueprint_summaries()
+            response = GetBlueprintsToolResponse.construct(blueprints=summaries)
+            return response.model_dump(exclude_unset=True, exclude_none=True)
+
         blueprints = await self.port_client.get_blueprints()
         response = GetBlueprintsToolResponse.construct(blueprints=blueprints)
         return response.model_dump(exclude_unset=True, exclude_none=True)
@@ -0,0 +1,58 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from pydantic import Field
+
+from src.models.common.annotations import Annotations
+from src.models.common.base_pydantic import BaseModel
+from src.models.tools.tool import Tool
+
+SEARCH_TOOLS_TOOL_NAME = "search_tools"
+
+
+class SearchToolsToolSchema(BaseModel):
+    query: str = Field(..., min_length=1, description="Words describing the action to run, e.g. 'deploy service' or 'jira issue'")
+    limit: int = Field(default=10, ge=1, le=50, description="The maximum number of tools to return")
+
+
+class FoundTool(BaseModel):
+    name: str = Field(..., description="The name to call the tool by")
+    description: str = Field(..., description="What the tool does")
+    input_schema: dict[str, Any] = Field(..., description="The JSON schema of the tool's arguments")
+
+
+class SearchToolsToolResponse(BaseModel):
+    tools: list[FoundTool] = Field(..., description="The matching tools, best matches first")
+
+
+class SearchToolsTool(Tool[SearchToolsToolSchema]):
+    """Finds the tools running self-service actions when they aren't all listed."""
+
+    def __init__(self, search: Callable[[str, int], Awaitable[list[Tool]]]):
+        super().__init__(
+            name=SEARCH_TOOLS_TOOL_NAME,
+            description=(
+                "Find the tools that run Port self-service actions, which aren't listed until they're found. "
+                "Search by words of the action's identifier, title, description or blueprint. Found tools can be "
+                "called by name right away and are added to the tool list"
+            ),
+            input_schema=SearchToolsToolSchema,
+            output_schema=SearchToolsToolResponse,
+            annotations=Annotations(
+                title="Search Tools",
+                readOnlyHint=True,
+                destructiveHint=False,
+                idempotentHint=True,
+                openWorldHint=False,
+            ),
+            function=self.search_tools,
+        )
+        self.search = search
+
+    async def search_tools(self, props: SearchToolsToolSchema) -> dict[str, Any]:
+        tools = await self.search(props.query, props.limit)
+        found = [
+            FoundTool.construct(name=tool.name, description=tool.description, input_schema=tool.input_schema_json)
+            for tool in tools
+        ]
+        return SearchToolsToolResponse.construct(tools=found).model_dump(exclude_unset=True, exclude_none=True)
@@ -3,9 +3,13 @@
 This module aggregates all tools for the Port MCP server.
 """
 
+from .aggregate_entities import AggregateEntitiesTool
+from .bulk_delete_entities import BulkDeleteEntitiesTool
+from .bulk_upsert_entities import BulkUpsertEntitiesTool
 from .create_entity import CreateEntityTool
 from .delete_entity import DeleteEntityTool
 from .get_entities import GetEntitiesTool
+from .get_entities_by_ids import GetEntitiesByIdsTool
 from .get_entity import GetEntityTool
 from .update_entity import UpdateEntityTool
 
@@ -15,4 +19,8 @@ __all__ = [
     "GetEntitiesTool",
     "UpdateEntityTool",
     "DeleteEntityTool",
+    "BulkUpsertEntitiesTool",
+    "BulkDeleteEntitiesTool",
+    "GetEntitiesByIdsTool",
+    "AggregateEntitiesTool",
 ]
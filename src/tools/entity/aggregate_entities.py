@@ -0,0 +1,65 @@
+from typing import Any
+
+from pydantic import Field
+from pydantic.json_schema import SkipJsonSchema
+
+from src.client.client import PortClient
+from src.models.common.annotations import Annotations
+from src.models.common.base_pydantic import BaseModel
+from src.models.entities import EntityAggregation
+from src.models.entities.entity import SearchQuery
+from src.models.tools.tool import Tool
+
+
+class AggregateEntitiesToolSchema(BaseModel):
+    blueprint_identifier: str = Field(..., description="The identifier of the blueprint to aggregate entities of")
+    query: SearchQuery | SkipJsonSchema[None] = Field(
+        default=None, description="A search query selecting the entities to aggregate, all entities of the blueprint by default"
+    )
+    group_by: str | SkipJsonSchema[None] = Field(
+        default=None,
+        description="A property or relation identifier, or a meta field like $team, to count the entities per value of",
+    )
+    metrics: list[str] = Field(
+        default_factory=list, description="Numeric property identifiers to return the min, max and average of"
+    )
+    max_groups: int = Field(default=50, ge=1, le=500, description="The maximum number of groups to return, largest first")
+
+
+class AggregateEntitiesTool(Tool[AggregateEntitiesToolSchema]):
+    port_client: PortClient
+
+    def __init__(self, port_client: PortClient):
+        super().__init__(
+            name="aggregate_entities",
+            description=(
+                "Count the entities of a blueprint, optionally grouped by a property, relation or team, with the "
+                "min, max and average of numeric properties. Use it instead of fetching entities to count them"
+            ),
+            input_schema=AggregateEntitiesToolSchema,
+            output_schema=EntityAggregation,
+            annotations=Annotations(
+                title="Aggregate Entities",
+                readOnlyHint=True,
+                destructiveHint=False,
+                idempotentHint=True,
+                openWorldHint=False,
+            ),
+            function=self.aggregate_entities,
+        )
+        self.port_client = port_client
+
+    async def aggregate_entities(self, props: AggregateEntitiesToolSchema) -> dict[str, Any]:
+        blueprint_identifier = props.blueprint_identifier
+        if props.query is not None:
+            query = props.query.model_dump(exclude_none=True)
+        else:
+            query = {
+                "combinator": "and",
+                "rules": [{"property": "$blueprint", "operator": "=", "value": blueprint_identifier}],
+            }
+
+        result = await self.port_client.aggregate_entities(
+            blueprint_identifier, query, props.group_by, props.metrics, props.max_groups
+        )
+        return result.model_dump(exclude_unset=True, exclude_none=True)
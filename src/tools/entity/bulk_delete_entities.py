@@ -0,0 +1,100 @@
+from typing import Any
+
+from pydantic import Field, model_validator
+from pydantic.json_schema import SkipJsonSchema
+
+from src.client.client import PortClient
+from src.models.common.annotations import Annotations
+from src.models.common.base_pydantic import BaseModel
+from src.models.entities import BulkEntityResult
+from src.models.entities.entity import SearchQuery
+from src.models.tools.tool import Tool
+from src.utils.progress import report_progress
+
+# Enough for the caller to check the query matches what it means to delete
+DRY_RUN_SAMPLE_SIZE = 20
+
+
+class BulkDeleteEntitiesToolSchema(BaseModel):
+    blueprint_identifier: str = Field(..., description="The identifier of the blueprint to delete the entities from")
+    entity_identifiers: list[str] | SkipJsonSchema[None] = Field(
+        default=None, description="The identifiers of the entities to delete, instead of a query"
+    )
+    query: SearchQuery | SkipJsonSchema[None] = Field(
+        default=None, description="A search query matching the entities to delete, instead of identifiers"
+    )
+    delete_dependents: bool = Field(
+        default=False,
+        description="If true, this call will also delete all of the entities' dependents",
+    )
+    dry_run: bool = Field(
+        default=False,
+        description="If true, only count the matching entities and return a sample of their identifiers",
+    )
+
+    @model_validator(mode="after")
+    def check_target(self) -> "BulkDeleteEntitiesToolSchema":
+        if (self.entity_identifiers is None) == (self.query is None):
+            raise ValueError("Provide either entity_identifiers or query")
+        return self
+
+
+class BulkDeleteEntitiesToolResponse(BaseModel):
+    matched: int = Field(..., description="The number of entities matching the identifiers or query")
+    deleted: int | SkipJsonSchema[None] = Field(default=None, description="The number of entities deleted")
+    failures: list[BulkEntityResult] | SkipJsonSchema[None] = Field(
+        default=None, description="The entities that couldn't be deleted and why"
+    )
+    sample: list[str] | SkipJsonSchema[None] = Field(
+        default=None, description="Identifiers of some of the matching entities, on a dry run"
+    )
+
+
+class BulkDeleteEntitiesTool(Tool[BulkDeleteEntitiesToolSchema]):
+    port_client: PortClient
+
+    def __init__(self, port_client: PortClient):
+        super().__init__(
+            name="bulk_delete_entities",
+            description=(
+                "Delete many entities of one blueprint by identifiers or by a search query. Use dry_run first "
+                "to count what a query matches"
+            ),
+            input_schema=BulkDeleteEntitiesToolSchema,
+            output_schema=BulkDeleteEntitiesToolResponse,
+            annotations=Annotations(
+                title="Bulk Delete Entities",
+                readOnlyHint=False,
+                destructiveHint=True,
+                idempotentHint=False,
+                openWorldHint=True,
+            ),
+            function=self.bulk_delete_entities,
+        )
+        self.port_client = port_client
+
+    async def bulk_delete_entities(self, props: BulkDeleteEntitiesToolSchema) -> dict[str, Any]:
+        blueprint_identifier = props.blueprint_identifier
+        if props.query is not None:
+            query = props.query.model_dump(exclude_none=True)
+            identifiers = await self.port_client.find_entity_identifiers(blueprint_identifier, query)
+        else:
+            identifiers = list(dict.fromkeys(props.entity_identifiers or []))
+
+        if props.dry_run:
+            response = BulkDeleteEntitiesToolResponse.construct(
+                matched=len(identifiers), sample=identifiers[:DRY_RUN_SAMPLE_SIZE]
+            )
+            return response.model_dump(exclude_unset=True, exclude_none=True)
+
+        async def on_progress(handled: int) -> None:
+            await report_progress(handled, total=len(identifiers), message=f"Deleted {handled}/{len(identifiers)} entities")
+
+        results = await self.port_client.bulk_delete_entities(
+            blueprint_identifier, identifiers, props.delete_dependents, on_progress
+        )
+        failures = [result for result in results if not result.ok]
+        response = BulkDeleteEntitiesToolResponse.construct(
+            matched=len(identifiers), deleted=len(results) - len(failures), failures=failures
+        )
+        return response.model_dump(exclude_unset=True, exclude_none=True)
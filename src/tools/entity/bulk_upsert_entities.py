@@ -0,0 +1,64 @@
+from typing import Any
+
+from pydantic import Field
+
+from src.client.client import PortClient
+from src.models.common.annotations import Annotations
+from src.models.common.base_pydantic import BaseModel
+from src.models.entities import BulkEntityResult, CreateEntity
+from src.models.tools.tool import Tool
+from src.tools.entity.create_entity import CreateEntitiyQuery
+
+
+class BulkUpsertEntitiesToolSchema(BaseModel):
+    blueprint_identifier: str = Field(..., description="The identifier of the blueprint to upsert the entities for")
+    entities: list[CreateEntity] = Field(
+        ..., min_length=1, max_length=1000, description="The entities to create or update"
+    )
+    query: CreateEntitiyQuery = Field(
+        default_factory=CreateEntitiyQuery, description="The query applied to every entity, as in create_entity"
+    )
+
+
+class BulkUpsertEntitiesToolResponse(BaseModel):
+    succeeded: int = Field(..., description="The number of entities upserted")
+    failed: int = Field(..., description="The number of entities that failed")
+    failures: list[BulkEntityResult] = Field(
+        ..., description="The entities that failed and why, with their index in the entities given"
+    )
+
+
+class BulkUpsertEntitiesTool(Tool[BulkUpsertEntitiesToolSchema]):
+    port_client: PortClient
+
+    def __init__(self, port_client: PortClient):
+        super().__init__(
+            name="bulk_upsert_entities",
+            description=(
+                "Create or update many entities of one blueprint in a single call. Use instead of calling "
+                "create_entity repeatedly, the result counts the upserted entities and lists the ones that failed"
+            ),
+            input_schema=BulkUpsertEntitiesToolSchema,
+            output_schema=BulkUpsertEntitiesToolResponse,
+            annotations=Annotations(
+                title="Bulk Upsert Entities",
+                readOnlyHint=False,
+                destructiveHint=False,
+                idempotentHint=False,
+                openWorldHint=True,
+            ),
+            function=self.bulk_upsert_entities,
+        )
+        self.port_client = port_client
+
+    async def bulk_upsert_entities(self, props: BulkUpsertEntitiesToolSchema) -> dict[str, Any]:
+        entities = [entity.model_dump(exclude_unset=True, exclude_none=True) for entity in props.entities]
+        query = props.query.model_dump(exclude_none=True)
+
+        results = await self.port_client.bulk_upsert_entities(props.blueprint_identifier, entities, query)
+        failures = [result for result in results if not result.ok]
+
+        response = BulkUpsertEntitiesToolResponse.construct(
+            succeeded=len(results) - len(failures), failed=len(failures), failures=failures
+        )
+        return response.model_dump(exclude_unset=True, exclude_none=True)
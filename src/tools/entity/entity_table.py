@@ -0,0 +1,50 @@
+"""Columnar rendering of entity lists shared by the entity tools."""
+
+from typing import Any
+
+from src.models.entities import EntityResult, EntityTable
+
+# Meta fields that get a column when any of the entities has them
+META_COLUMNS = ["team", "created_at", "created_by", "updated_at", "updated_by"]
+
+
+def _relation_identifiers(value: Any) -> list[Any]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def build_entity_table(entities: list[EntityResult], blueprint: str) -> EntityTable:
+    """Lay entities out as one header and a row of values per entity, instead of repeating every key per entity."""
+    meta_columns = [column for column in META_COLUMNS if any(getattr(entity, column, None) for entity in entities)]
+    # Properties and relations get columns in the order they're first seen, dicts keep them unique
+    property_columns: dict[str, None] = {}
+    relation_columns: dict[str, None] = {}
+    for entity in entities:
+        property_columns.update(dict.fromkeys(getattr(entity, "properties", None) or {}))
+        relation_columns.update(dict.fromkeys(getattr(entity, "relations", None) or {}))
+
+    rows = []
+    for entity in entities:
+        properties = getattr(entity, "properties", None) or {}
+        relations = getattr(entity, "relations", None) or {}
+        rows.append(
+            [
+                getattr(entity, "identifier", None),
+                getattr(entity, "title", None),
+                *(getattr(entity, column, None) for column in meta_columns),
+                *(properties.get(column) for column in property_columns),
+                *(_relation_identifiers(relations.get(column)) for column in relation_columns),
+            ]
+        )
+
+    columns = [
+        "identifier",
+        "title",
+        *meta_columns,
+        *(f"properties.{column}" for column in property_columns),
+        *(f"relations.{column}" for column in relation_columns),
+    ]
+    return EntityTable.construct(blueprint=blueprint, columns=columns, rows=rows)
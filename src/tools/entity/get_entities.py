@@ -1,12 +1,15 @@
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field
+from pydantic.json_schema import SkipJsonSchema
 
 from src.client.client import PortClient
 from src.models.common.annotations import Annotations
 from src.models.common.base_pydantic import BaseModel
-from src.models.entities import EntityResult
+from src.models.entities import EntityResult, EntitySort, EntityTable
+from src.models.entities.entity import SearchQuery
 from src.models.tools.tool import Tool
+from src.tools.entity.entity_table import build_entity_table
 
 
 class GetEntitiesToolSchema(BaseModel):
@@ -15,10 +18,30 @@ class GetEntitiesToolSchema(BaseModel):
         default=False,
         description="Controls whether to return extended entity information. If True, returns complete entity details including all properties. If False (default), returns only identifier and title to keep context minimal. Prefer False unless specifically asked for detailed information.",
     )
+    include: list[str] | SkipJsonSchema[None] = Field(
+        default=None,
+        min_length=1,
+        description="The fields to return, e.g. $identifier, $title, $team, properties.<identifier> or relations.<identifier>. Overrides detailed, prefer it over detailed=True when only some properties are needed.",
+    )
+    query: SearchQuery | SkipJsonSchema[None] = Field(
+        default=None,
+        description="Search rules the entities must match, applied by Port in addition to the blueprint. Prefer filtering here over fetching all entities.",
+    )
+    sort: EntitySort | SkipJsonSchema[None] = Field(default=None, description="The order to return the entities in")
+    limit: int | SkipJsonSchema[None] = Field(
+        default=None, ge=1, le=10000, description="The maximum number of entities to return, 200 by default"
+    )
+    format: Literal["list", "table"] = Field(
+        default="list",
+        description="list returns an object per entity. table returns the column names once and a row of values per entity, about half the size for many entities",
+    )
 
 
 class GetEntitiesToolResponse(BaseModel):
-    entities: list[EntityResult] = Field(..., description="The list of entities")
+    entities: list[EntityResult] | SkipJsonSchema[None] = Field(
+        default=None, description="The list of entities, in the list format"
+    )
+    table: EntityTable | SkipJsonSchema[None] = Field(default=None, description="The entities, in the table format")
 
 
 class GetEntitiesTool(Tool[GetEntitiesToolSchema]):
@@ -27,7 +50,10 @@ class GetEntitiesTool(Tool[GetEntitiesToolSchema]):
     def __init__(self, port_client: PortClient):
         super().__init__(
             name="get_entities",
-            description="Get all of the entities for a given blueprint",
+            description=(
+                "Get the entities of a given blueprint, optionally only the ones matching search rules, sorted, "
+                "limited and with only the requested fields"
+            ),
             input_schema=GetEntitiesToolSchema,
             output_schema=GetEntitiesToolResponse,
             annotations=Annotations(
@@ -50,7 +76,7 @@ class GetEntitiesTool(Tool[GetEntitiesToolSchema]):
 
         detailed = args.get("detailed", False)
         
-        query = {
+        query: dict[str, Any] = {
             "combinator": "and",
             "rules": [
                 {
@@ -60,15 +86,33 @@ class GetEntitiesTool(Tool[GetEntitiesToolSchema]):
                 }
             ]
         }
-        
+        if props.query is not None:
+            filters = props.query.model_dump(exclude_none=True)
+            # An "and" query's rules join the blueprint rule, an "or" query has to be nested to keep its meaning
+            query["rules"] += filters["rules"] if filters["combinator"] == "and" else [filters]
+
         include = ["$identifier", "$title"] if not detailed else None
+        if props.include is not None:
+            include = props.include
+
+        # Only passed when set, so the client's defaults apply otherwise
+        options: dict[str, Any] = {}
+        if props.limit is not None:
+            options["limit"] = props.limit
+        if props.sort is not None:
+            options["sort"] = props.sort
 
         raw_entities = await self.port_client.search_entities(
             blueprint_identifier=blueprint_identifier,
             query=query,
-            include=include
+            include=include,
+            **options,
         )
-        
+
+        if props.format == "table":
+            table = build_entity_table(raw_entities, blueprint_identifier)
+            return GetEntitiesToolResponse.construct(table=table).model_dump(exclude_unset=True, exclude_none=True)
+
         processed_entities = []
         for entity in raw_entities:
             entity_dict = entity.model_dump(exclude_unset=True, exclude_none=True)
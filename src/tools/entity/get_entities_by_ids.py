@@ -0,0 +1,61 @@
+from typing import Any
+
+from pydantic import Field
+
+from src.client.client import PortClient
+from src.models.common.annotations import Annotations
+from src.models.common.base_pydantic import BaseModel
+from src.models.entities import EntityResult
+from src.models.tools.tool import Tool
+
+
+class GetEntitiesByIdsToolSchema(BaseModel):
+    blueprint_identifier: str = Field(..., description="The identifier of the blueprint the entities belong to")
+    entity_identifiers: list[str] = Field(
+        ..., min_length=1, max_length=1000, description="The identifiers of the entities to get"
+    )
+    detailed: bool = Field(
+        default=True,
+        description="If True (default), returns complete entity details including properties. If False, returns only identifier and title.",
+    )
+
+
+class GetEntitiesByIdsToolResponse(BaseModel):
+    entities: dict[str, EntityResult] = Field(..., description="The entities found, keyed by identifier")
+    missing: list[str] = Field(..., description="The identifiers no entity was found for")
+
+
+class GetEntitiesByIdsTool(Tool[GetEntitiesByIdsToolSchema]):
+    port_client: PortClient
+
+    def __init__(self, port_client: PortClient):
+        super().__init__(
+            name="get_entities_by_ids",
+            description=(
+                "Get many entities of a blueprint by their identifiers in one call. Use instead of calling "
+                "get_entity for each identifier"
+            ),
+            input_schema=GetEntitiesByIdsToolSchema,
+            output_schema=GetEntitiesByIdsToolResponse,
+            annotations=Annotations(
+                title="Get Entities By Identifiers",
+                readOnlyHint=True,
+                destructiveHint=False,
+                idempotentHint=True,
+                openWorldHint=False,
+            ),
+            function=self.get_entities_by_ids,
+        )
+        self.port_client = port_client
+
+    async def get_entities_by_ids(self, props: GetEntitiesByIdsToolSchema) -> dict[str, Any]:
+        identifiers = list(dict.fromkeys(props.entity_identifiers))
+        include = None if props.detailed else ["$identifier", "$title"]
+
+        found = await self.port_client.get_entities_by_ids(props.blueprint_identifier, identifiers, include)
+
+        response = GetEntitiesByIdsToolResponse.construct(
+            entities={identifier: found[identifier] for identifier in identifiers if identifier in found},
+            missing=[identifier for identifier in identifiers if identifier not in found],
+        )
+        return response.model_dump(exclude_unset=True, exclude_none=True)
@@ -0,0 +1,8 @@
+"""Tools for Port MCP server.
+
+This module aggregates all tools for the Port MCP server.
+"""
+
+from .fetch_result_page import FetchResultPageTool
+
+__all__ = ["FetchResultPageTool"]
@@ -0,0 +1,58 @@
+from typing import Any
+
+from pydantic import Field
+from pydantic.json_schema import SkipJsonSchema
+
+from src.models.common.annotations import Annotations
+from src.models.common.base_pydantic import BaseModel
+from src.models.tools.tool import Tool
+from src.utils.result_store import ResultStore
+
+
+class FetchResultPageToolSchema(BaseModel):
+    handle: str = Field(..., description="The handle of a truncated list, as reported under _truncated")
+    offset: int = Field(
+        default=0, ge=0, description="The index of the first item to return, the list's returned count for the next page"
+    )
+    limit: int = Field(default=100, ge=1, le=1000, description="The maximum number of items to return")
+
+
+class FetchResultPageToolResponse(BaseModel):
+    items: list[Any] = Field(..., description="The items of the page")
+    offset: int = Field(..., description="The index of the first item returned")
+    total: int = Field(..., description="The number of items in the whole list")
+    next_offset: int | SkipJsonSchema[None] = Field(
+        default=None, description="The offset of the next page, not set on the last page"
+    )
+
+
+class FetchResultPageTool(Tool[FetchResultPageToolSchema]):
+    """Serves pages of truncated tool responses from the result store."""
+
+    def __init__(self, result_store: ResultStore):
+        super().__init__(
+            name="fetch_result_page",
+            description=(
+                "Get more items of a list that was truncated in a previous tool response, without running the "
+                "original tool again. Use the handle and returned count reported under _truncated"
+            ),
+            input_schema=FetchResultPageToolSchema,
+            output_schema=FetchResultPageToolResponse,
+            annotations=Annotations(
+                title="Fetch Result Page",
+                readOnlyHint=True,
+                destructiveHint=False,
+                idempotentHint=True,
+                openWorldHint=False,
+            ),
+            function=self.fetch_result_page,
+        )
+        self.result_store = result_store
+
+    async def fetch_result_page(self, props: FetchResultPageToolSchema) -> dict[str, Any]:
+        items, total = self.result_store.page(props.handle, props.offset, props.limit)
+        next_offset = props.offset + len(items)
+        response = FetchResultPageToolResponse.construct(
+            items=items, offset=props.offset, total=total, next_offset=next_offset if next_offset < total else None
+        )
+        return response.model_dump(exclude_unset=True, exclude_none=True)
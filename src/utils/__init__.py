@@ -1,8 +1,9 @@
 """Utility functions for the Port MCP Server."""
 
 # Import and re-export setup_logging function
-from .errors import PortAuthError, PortError
+from .errors import PortAuthError, PortError, PortRequestCancelledError
 from .logger import logger
 from .schema import inline_schema
+from .shared_cache import SharedCache
 
-__all__ = ["logger", "PortError", "PortAuthError", "inline_schema"]
+__all__ = ["logger", "PortError", "PortAuthError", "PortRequestCancelledError", "inline_schema", "SharedCache"]
@@ -11,3 +11,9 @@ class PortAuthError(PortError):
     """Exception raised for authentication errors."""
 
     pass
+
+
+class PortRequestCancelledError(PortError):
+    """Exception raised when a request to Port is aborted because its tool call was cancelled."""
+
+    pass
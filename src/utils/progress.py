@@ -0,0 +1,30 @@
+"""Progress notifications for long running tool calls."""
+
+import mcp.types as types
+from mcp.server.lowlevel.server import request_ctx
+
+from .logger import logger
+
+
+async def report_progress(progress: float, total: float | None = None, message: str | None = None) -> None:
+    """Send a progress notification for the current tool call, if the client asked for progress updates."""
+    try:
+        ctx = request_ctx.get()
+    except LookupError:
+        # Not running inside an MCP request, e.g. when tools are called directly
+        return
+    progress_token = ctx.meta.progressToken if ctx.meta else None
+    if progress_token is None:
+        return
+    # Newer protocol versions add a message to progress notifications
+    extra = {"message": message} if message else {}
+    params = types.ProgressNotificationParams.model_validate(
+        {"progressToken": progress_token, "progress": progress, "total": total, **extra}
+    )
+    try:
+        await ctx.session.send_notification(
+            types.ServerNotification(types.ProgressNotification(method="notifications/progress", params=params)),
+            ctx.request_id,
+        )
+    except Exception as e:
+        logger.debug(f"Failed to send progress notification: {e}")
@@ -0,0 +1,257 @@
+"""Shaping of tool results that exceed the response size budget."""
+
+import copy
+import json
+from bisect import bisect_left
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from .result_store import ResultStore
+
+TRUNCATED_KEY = "_truncated"
+# Nesting below this depth is summarized when truncating the lists isn't enough, e.g. the property definitions
+# within blueprint schemas
+SUMMARY_DEPTH = 6
+# Also summarized when the response still doesn't fit after that
+MIN_SUMMARY_DEPTH = 3
+SUMMARY_KEYS = 10
+# Strings are cut last, when the response still doesn't fit, but never shorter than this
+MIN_STRING_LENGTH = 100
+STRING_MARKER = "... <{} more characters>"
+# Results other than objects are returned under this key once they're truncated, to hold the report
+RESULT_KEY = "result"
+# Room kept free for the truncation report
+REPORT_RESERVE = 512
+TRUNCATED_MESSAGE = (
+    "The response was shortened to fit the response size budget. Narrow the request, e.g. with search rules, "
+    "include or limit, to get the rest"
+)
+STORED_MESSAGE = (
+    "The response was shortened to fit the response size budget. Call fetch_result_page with a list's handle "
+    "and its returned count as the offset to get the rest, or narrow the request, e.g. with search rules, "
+    "include or limit"
+)
+
+
+@dataclass
+class TruncatedList:
+    path: str
+    returned: int
+    total: int
+    handle: str | None = None
+
+
+def _size(value: Any) -> int:
+    # json.dumps escapes non-ASCII characters, so the length of the text is its size in bytes
+    return len(json.dumps(value))
+
+
+def drop_empty(value: Any) -> Any:
+    """Remove None, empty strings and empty containers, False and 0 are kept."""
+    if isinstance(value, dict):
+        dropped = {key: drop_empty(item) for key, item in value.items()}
+        return {key: item for key, item in dropped.items() if item not in (None, "", [], {})}
+    if isinstance(value, list):
+        return [drop_empty(item) for item in value]
+    return value
+
+
+def summarize_deep(value: Any, max_depth: int, depth: int = 0) -> Any:
+    """Replace objects and lists nested deeper than ``max_depth`` with a one-line description."""
+    if isinstance(value, dict):
+        if depth >= max_depth and value:
+            keys = list(value)
+            shown = ", ".join(keys[:SUMMARY_KEYS]) + (", ..." if len(keys) > SUMMARY_KEYS else "")
+            return f"<object with {len(keys)} fields: {shown}>"
+        return {key: summarize_deep(item, max_depth, depth + 1) for key, item in value.items()}
+    if isinstance(value, list):
+        if depth >= max_depth and value:
+            return f"<list of {len(value)} items>"
+        return [summarize_deep(item, max_depth, depth + 1) for item in value]
+    return value
+
+
+def _lists(value: Any, path: str = "", keys: tuple[Any, ...] = ()) -> list[tuple[str, tuple[Any, ...], list[Any]]]:
+    """Every list with more than one item, its path like ``entities`` or ``results[0].blueprints`` and its keys."""
+    found: list[tuple[str, tuple[Any, ...], list[Any]]] = []
+    if isinstance(value, dict):
+        for key, item in value.items():
+            found += _lists(item, f"{path}.{key}" if path else str(key), (*keys, key))
+    elif isinstance(value, list):
+        if len(value) > 1:
+            found.append((path, keys, value))
+        for index, item in enumerate(value):
+            found += _lists(item, f"{path}[{index}]", (*keys, index))
+    return found
+
+
+def _original(result: Any, keys: tuple[Any, ...]) -> list[Any] | None:
+    """The list at ``keys`` in the unshaped result, None if the shaping moved it."""
+    value = result
+    for key in keys:
+        try:
+            value = value[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return value if isinstance(value, list) else None
+
+
+def _largest_nested(path: str, paths: list[str], sizes: dict[str, int]) -> int:
+    """The size of the largest list nested in the list at ``path``, ``paths`` are all list paths in sorted order."""
+    # Nested paths all start with the list's path and an index, so they sort next to each other
+    prefix = f"{path}["
+    largest = 0
+    for other in paths[bisect_left(paths, prefix) :]:
+        if not other.startswith(prefix):
+            break
+        largest = max(largest, sizes[other])
+    return largest
+
+
+def _truncate_largest_list(
+    value: Any, excess: int, truncated: dict[str, TruncatedList], store: ResultStore | None, result: Any
+) -> bool:
+    """Cut the list that takes the most bytes by about ``excess`` bytes, returns False when nothing is left to cut.
+
+    ``result`` is the value before it was shaped, the stored lists are taken from it.
+    """
+    lists = _lists(value)
+    if not lists:
+        return False
+    sizes = {path: _size(items) for path, _, items in lists}
+    # A list whose bytes are mostly in one nested list is left alone, cutting the nested one drops less,
+    # e.g. the entities of a batched call rather than the batched calls themselves
+    paths = sorted(sizes)
+    cuttable = [(path, keys, items) for path, keys, items in lists if _largest_nested(path, paths, sizes) * 2 <= sizes[path]]
+    path, keys, items = max(cuttable, key=lambda item: sizes[item[0]])
+    keep_bytes = sizes[path] - excess
+    kept, used = 0, 2
+    for item in items:
+        # Each item takes its own size and a separator
+        used += _size(item) + 2
+        if used > keep_bytes:
+            break
+        kept += 1
+    # Keep at least one item, later passes cut other lists if that isn't enough
+    kept = max(kept, 1)
+    record = truncated.get(path)
+    if record is None:
+        handle = None
+        if store is not None:
+            # The whole list is stored the first time it's cut, copied from the result as the tool returned it,
+            # so its pages have the empty fields and nested objects the response may have lost
+            original = _original(result, keys)
+            if original is None or len(original) != len(items):
+                # Lists nested in the items still returned may be cut later on, so those items are copied
+                original = copy.deepcopy(items[:kept]) + items[kept:]
+            else:
+                original = copy.deepcopy(original)
+            handle = store.put(original, _size(original))
+        record = truncated[path] = TruncatedList(path=path, returned=len(items), total=len(items), handle=handle)
+    record.returned = kept
+    del items[kept:]
+    return True
+
+
+def _string_lengths(value: Any) -> list[int]:
+    if isinstance(value, str):
+        return [len(value)]
+    if isinstance(value, dict):
+        return [length for item in value.values() for length in _string_lengths(item)]
+    if isinstance(value, list):
+        return [length for item in value for length in _string_lengths(item)]
+    return []
+
+
+def _saved(length: int, max_length: int) -> int:
+    """Characters saved by cutting a string of ``length`` characters to ``max_length`` and the marker."""
+    return length - max_length - len(STRING_MARKER.format(length - max_length))
+
+
+def _cut_strings(value: Any, max_length: int) -> Any:
+    if isinstance(value, str) and _saved(len(value), max_length) > 0:
+        return value[:max_length] + STRING_MARKER.format(len(value) - max_length)
+    if isinstance(value, dict):
+        return {key: _cut_strings(item, max_length) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_cut_strings(item, max_length) for item in value]
+    return value
+
+
+def truncate_strings(value: Any, excess: int) -> Any:
+    """Cut the longest strings to a common length so the value shrinks by about ``excess`` characters.
+
+    Cut strings end with a marker telling how many characters were left out.
+    """
+    lengths = _string_lengths(value)
+    longest = max(lengths, default=0)
+    if longest <= MIN_STRING_LENGTH:
+        return value
+    # The longest length strings can be cut to that still saves ``excess``, found by bisecting
+    low, high = MIN_STRING_LENGTH, longest
+    while low < high:
+        middle = (low + high + 1) // 2
+        saved = sum(max(_saved(length, middle), 0) for length in lengths)
+        if saved >= excess:
+            low = middle
+        else:
+            high = middle - 1
+    return _cut_strings(value, low)
+
+
+def shape_response(result: Any, max_bytes: int, store: ResultStore | None = None) -> str:
+    """Serialize a tool result, shaping it to stay within ``max_bytes`` if it's larger.
+
+    Results within the budget are returned as they are. Larger ones first lose their empty fields, then
+    have their longest lists truncated. Truncated lists are reported under ``_truncated`` with how many of
+    their items were returned. With a ``store``, the full lists are kept in it and reported with the handle
+    to page through them. Results other than objects are returned under ``result`` once truncated, next to
+    the report. Only results still too large have deeply nested objects summarized and, last, strings too
+    long for the budget cut, like a long markdown property. A budget of 0 disables shaping.
+    """
+    text = json.dumps(result)
+    if max_bytes <= 0 or len(text) <= max_bytes:
+        return text
+
+    shaped = drop_empty(result)
+    text = json.dumps(shaped)
+    if len(text) <= max_bytes:
+        return text
+
+    # Only an object can hold the truncation report
+    wrapped = not isinstance(shaped, dict)
+    if wrapped:
+        shaped, result = {RESULT_KEY: shaped}, {RESULT_KEY: result}
+    truncated: dict[str, TruncatedList] = {}
+    budget = max_bytes - REPORT_RESERVE
+    size = len(text)
+    while size > budget and _truncate_largest_list(shaped, size - budget, truncated, store, result):
+        new_size = _size(shaped)
+        if new_size >= size:
+            break
+        size = new_size
+    # Nested objects are only summarized when truncating the lists wasn't enough, the deepest ones first
+    for depth in (SUMMARY_DEPTH, MIN_SUMMARY_DEPTH):
+        if size > budget:
+            shaped = summarize_deep(shaped, depth)
+            size = _size(shaped)
+    # Non-ASCII characters take several bytes once escaped, so cutting them by their count may not be enough
+    # and the strings are cut again, from their full text, by more
+    full, excess = shaped, size - budget
+    while size > budget:
+        shortened = truncate_strings(full, excess)
+        new_size = _size(shortened)
+        if new_size >= size:
+            break
+        shaped, size = shortened, new_size
+        excess += size - budget
+
+    if wrapped and not truncated:
+        shaped = shaped[RESULT_KEY]
+    if truncated:
+        stored = any(record.handle for record in truncated.values())
+        shaped[TRUNCATED_KEY] = {
+            "message": STORED_MESSAGE if stored else TRUNCATED_MESSAGE,
+            "lists": [drop_empty(asdict(record)) for record in truncated.values()],
+        }
+    return json.dumps(shaped)
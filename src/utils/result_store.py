@@ -0,0 +1,76 @@
+"""In-memory store of the full lists behind truncated tool responses."""
+
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from .errors import PortError
+from .logger import logger
+
+
+@dataclass
+class StoredResult:
+    items: list[Any]
+    size: int
+    expires_at: float
+
+
+class ResultStore:
+    """Keeps lists that were cut from responses so their other pages can be served without calling Port again.
+
+    Entries expire ``ttl`` seconds after they were last read. When the stored lists would take more than
+    ``max_bytes``, the least recently read ones are evicted first.
+    """
+
+    def __init__(self, max_bytes: int = 50_000_000, ttl: float = 900):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._results: OrderedDict[str, StoredResult] = OrderedDict()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def put(self, items: list[Any], size: int) -> str | None:
+        """Store a list of ``size`` serialized bytes, returns its handle or None if it's larger than the store."""
+        if size > self.max_bytes:
+            logger.info(f"Not storing a result of {size} bytes, larger than the store's {self.max_bytes} bytes")
+            return None
+        self._evict_expired()
+        while self._results and self._size + size > self.max_bytes:
+            self._remove(next(iter(self._results)))
+        handle = secrets.token_urlsafe(12)
+        self._results[handle] = StoredResult(items=items, size=size, expires_at=time.monotonic() + self.ttl)
+        self._size += size
+        logger.debug(f"Stored result {handle} of {len(items)} items, {self._size} bytes stored")
+        return handle
+
+    def page(self, handle: str, offset: int, limit: int) -> tuple[list[Any], int]:
+        """Return the items from ``offset`` on, up to ``limit`` of them, and the number of items stored."""
+        self._evict_expired()
+        result = self._results.get(handle)
+        if result is None:
+            raise PortError(f"Result {handle} wasn't found, it may have expired. Call the original tool again")
+        result.expires_at = time.monotonic() + self.ttl
+        self._results.move_to_end(handle)
+        return result.items[offset : offset + limit], len(result.items)
+
+    def _evict_expired(self) -> None:
+        # Entries are kept in the order they were last read in, so they also expire in that order
+        now = time.monotonic()
+        while self._results:
+            handle, result = next(iter(self._results.items()))
+            if result.expires_at > now:
+                return
+            self._remove(handle)
+
+    def _remove(self, handle: str) -> None:
+        result = self._results.pop(handle)
+        self._size -= result.size
+        logger.debug(f"Evicted result {handle}")
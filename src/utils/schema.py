@@ -1,4 +1,25 @@
+import copy
+import json
+from collections import Counter
+from collections.abc import Iterator
 from typing import Any
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
+
+# Keywords whose values are schemas, lists of schemas and maps of schemas
+SCHEMA_KEYWORDS = ("items", "additionalProperties", "not", "contains", "propertyNames")
+SCHEMA_LIST_KEYWORDS = ("anyOf", "oneOf", "allOf", "prefixItems")
+SCHEMA_MAP_KEYWORDS = ("properties", "patternProperties")
+# Keywords describing values without constraining them, they may differ between uses of a shared subschema
+ANNOTATION_KEYWORDS = ("title", "description", "default", "examples", "deprecated", "readOnly", "writeOnly")
+DEFS_PREFIX = "#/$defs/"
+# Size of a reference to a definition with a short name
+REF_BYTES = len('{"$ref": "#/$defs/shared"}')
+# Repeated subschemas smaller than this stay inline, a reference wouldn't save much
+MIN_SHARED_BYTES = 100
+
+_model_schemas: WeakKeyDictionary[type[BaseModel], dict[str, Any]] = WeakKeyDictionary()
 
 
 def inline_schema(schema: dict[str, Any]) -> dict[str, Any] | list[Any] | Any:
@@ -16,3 +37,192 @@ def inline_schema(schema: dict[str, Any]) -> dict[str, Any] | list[Any] | Any:
         return obj
 
     return replace_refs(schema)
+
+
+def _canonical(schema: Any) -> str:
+    return json.dumps(schema, sort_keys=True)
+
+
+def _children(schema: dict[str, Any]) -> Iterator[tuple[str, dict[str, Any]]]:
+    """The subschemas directly within a schema, with the name of the property or keyword holding them."""
+    for keyword in SCHEMA_KEYWORDS:
+        if isinstance(schema.get(keyword), dict):
+            yield keyword, schema[keyword]
+    for keyword in SCHEMA_LIST_KEYWORDS:
+        for item in schema.get(keyword) or []:
+            if isinstance(item, dict):
+                yield keyword, item
+    for keyword in SCHEMA_MAP_KEYWORDS:
+        for name, item in (schema.get(keyword) or {}).items():
+            if isinstance(item, dict):
+                yield name, item
+
+
+def _map_children(schema: dict[str, Any], replace: Any) -> dict[str, Any]:
+    """Copy of a schema with each of its direct subschemas replaced with ``replace(subschema)``."""
+    mapped = dict(schema)
+    for keyword in SCHEMA_KEYWORDS:
+        if isinstance(schema.get(keyword), dict):
+            mapped[keyword] = replace(schema[keyword])
+    for keyword in SCHEMA_LIST_KEYWORDS:
+        if isinstance(schema.get(keyword), list):
+            mapped[keyword] = [replace(item) if isinstance(item, dict) else item for item in schema[keyword]]
+    for keyword in SCHEMA_MAP_KEYWORDS:
+        if isinstance(schema.get(keyword), dict):
+            mapped[keyword] = {name: replace(item) if isinstance(item, dict) else item for name, item in schema[keyword].items()}
+    return mapped
+
+
+def _map_refs(schema: Any, replace: Any) -> Any:
+    """Copy of a schema with each ``{"$ref": ...}`` object replaced with ``replace(name, ref_object)``."""
+    if isinstance(schema, dict):
+        if isinstance(schema.get("$ref"), str) and schema["$ref"].startswith(DEFS_PREFIX):
+            return replace(schema["$ref"].removeprefix(DEFS_PREFIX), schema)
+        return {key: _map_refs(value, replace) for key, value in schema.items()}
+    if isinstance(schema, list):
+        return [_map_refs(item, replace) for item in schema]
+    return schema
+
+
+def _count_refs(schema: Any, counts: Counter[str]) -> None:
+    if isinstance(schema, dict):
+        if isinstance(schema.get("$ref"), str) and schema["$ref"].startswith(DEFS_PREFIX):
+            counts[schema["$ref"].removeprefix(DEFS_PREFIX)] += 1
+        for value in schema.values():
+            _count_refs(value, counts)
+    elif isinstance(schema, list):
+        for item in schema:
+            _count_refs(item, counts)
+
+
+def _merge_identical_defs(root: dict[str, Any], defs: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Point the references to identical definitions at one of them."""
+    while True:
+        first: dict[str, str] = {}
+        aliases: dict[str, str] = {}
+        for name, definition in defs.items():
+            canonical = _canonical(definition)
+            if canonical in first:
+                aliases[name] = first[canonical]
+            else:
+                first[canonical] = name
+        if not aliases:
+            return root, defs
+
+        def replace(name: str, ref: dict[str, Any], aliases: dict[str, str] = aliases) -> dict[str, Any]:
+            return {**ref, "$ref": DEFS_PREFIX + aliases.get(name, name)}
+
+        # Merging definitions can make the ones referencing them identical as well
+        root = _map_refs(root, replace)
+        defs = {name: _map_refs(definition, replace) for name, definition in defs.items() if name not in aliases}
+
+
+def _inline_single_use_defs(root: dict[str, Any], defs: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Inline the definitions referenced once, from the root or the definitions still used."""
+    counts: Counter[str] = Counter()
+    _count_refs(root, counts)
+    pending = list(counts)
+    reachable = set(pending)
+    while pending:
+        definition = defs[pending.pop()]
+        nested: Counter[str] = Counter()
+        _count_refs(definition, nested)
+        counts.update(nested)
+        pending += [name for name in nested if name not in reachable]
+        reachable.update(nested)
+    shared = {name for name in reachable if counts[name] > 1}
+
+    def replace(name: str, ref: dict[str, Any]) -> dict[str, Any]:
+        if name in shared:
+            return ref
+        # A definition referenced once isn't part of a cycle with itself, so inlining it ends
+        siblings = {key: value for key, value in ref.items() if key != "$ref"}
+        return {**_map_refs(defs[name], replace), **siblings}
+
+    return _map_refs(root, replace), {name: _map_refs(defs[name], replace) for name in defs if name in shared}
+
+
+def _split_annotations(schema: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Split a schema into the keywords constraining values and the ones only describing them."""
+    core = {key: value for key, value in schema.items() if key not in ANNOTATION_KEYWORDS}
+    annotations = {key: value for key, value in schema.items() if key in ANNOTATION_KEYWORDS}
+    return core, annotations
+
+
+def _repeated_subschemas(root: dict[str, Any], defs: dict[str, Any]) -> dict[str, tuple[int, int, str]]:
+    """Subschemas repeated apart from their annotations, with their count, size and the name of their first holder."""
+    found: dict[str, tuple[int, int, str]] = {}
+
+    def visit(schema: dict[str, Any], holder: str) -> None:
+        core, _ = _split_annotations(schema)
+        canonical = _canonical(core)
+        if len(canonical) >= MIN_SHARED_BYTES:
+            count, size, first_holder = found.get(canonical, (0, len(canonical), holder))
+            found[canonical] = (count + 1, size, first_holder)
+        for name, child in _children(schema):
+            visit(child, name)
+
+    for schema in [root, *defs.values()]:
+        for name, child in _children(schema):
+            visit(child, name)
+    return {canonical: found[canonical] for canonical in found if found[canonical][0] > 1}
+
+
+def _share_repeated_subschemas(root: dict[str, Any], defs: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Move subschemas repeated within the schema to definitions, largest savings first.
+
+    The annotations of each occurrence, like its description, stay next to the reference.
+    """
+    while True:
+        repeated = _repeated_subschemas(root, defs)
+        savings = {canonical: (count - 1) * size - count * REF_BYTES for canonical, (count, size, _) in repeated.items()}
+        if not savings or max(savings.values()) <= 0:
+            return root, defs
+        canonical = max(savings, key=lambda canonical: savings[canonical])
+        holder = repeated[canonical][2]
+        # Named after the property first holding it, like the definitions pydantic names after models
+        base = "shared" if holder in SCHEMA_KEYWORDS + SCHEMA_LIST_KEYWORDS else holder
+        name, index = base, 1
+        while name in defs:
+            index += 1
+            name = f"{base}{index}"
+        defs[name] = json.loads(canonical)
+
+        def replace(schema: dict[str, Any], name: str = name, canonical: str = canonical) -> dict[str, Any]:
+            core, annotations = _split_annotations(schema)
+            if _canonical(core) == canonical:
+                return {"$ref": DEFS_PREFIX + name, **annotations}
+            return _map_children(schema, replace)
+
+        root = _map_children(root, replace)
+        defs = {key: definition if key == name else _map_children(definition, replace) for key, definition in defs.items()}
+
+
+def compact_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Shrink a JSON schema by keeping each shared subschema once under ``$defs``.
+
+    Identical definitions are merged and the ones referenced once are inlined. Subschemas repeated
+    within the schema are moved to definitions, so e.g. an enum used by several fields is written once.
+    """
+    root = copy.deepcopy(schema)
+    defs = root.pop("$defs", {})
+    root, defs = _merge_identical_defs(root, defs)
+    root, defs = _inline_single_use_defs(root, defs)
+    root, defs = _share_repeated_subschemas(root, defs)
+    if defs:
+        root["$defs"] = defs
+    return root
+
+
+def model_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """The compact JSON schema of a model, generated once per model. It's shared so it must not be changed."""
+    schema = _model_schemas.get(model)
+    if schema is None:
+        schema = _model_schemas[model] = compact_schema(model.model_json_schema())
+    return schema
+
+
+def schema_sizes(model: type[BaseModel]) -> tuple[int, int]:
+    """The size in bytes of a model's JSON schema with every reference inlined and of its compact schema."""
+    inlined = inline_schema(model.model_json_schema())
+    return len(json.dumps(inlined)), len(json.dumps(model_schema(model)))
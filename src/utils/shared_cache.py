@@ -0,0 +1,115 @@
+"""File-backed cache shared between Port MCP server processes on the same host."""
+
+import json
+import os
+import sqlite3
+import time
+from collections.abc import Callable
+from contextlib import closing
+from pathlib import Path
+from typing import Any, TypeVar
+
+from .logger import logger
+
+T = TypeVar("T")
+
+SHARED_CACHE_FILENAME = "shared-cache.sqlite3"
+
+
+class SharedCache:
+    """Key/value store with per-entry TTLs backed by a SQLite database.
+
+    Every operation opens its own short-lived connection, so one cache file can be used
+    from several threads and processes at once. The WAL journal lets readers proceed while
+    another process writes, and the busy timeout serializes concurrent writers.
+    Keys are prefixed with ``namespace`` so different credentials never share entries.
+    """
+
+    def __init__(self, path: str | Path, namespace: str = "", default_ttl: float = 300):
+        self.path = Path(path)
+        self.namespace = namespace
+        self.default_ttl = default_ttl
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5, isolation_level=None)
+
+    def _sidecars(self) -> list[Path]:
+        return [self.path.with_name(self.path.name + suffix) for suffix in ("-wal", "-shm")]
+
+    def _init_db(self) -> None:
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # The cache holds access tokens, keep it readable by the current user only. SQLite creates the WAL
+        # and shared memory files with the database's permissions, files left by an older version are fixed
+        os.close(os.open(self.path, os.O_WRONLY | os.O_CREAT, 0o600))
+        for path in (self.path, *self._sidecars()):
+            if path.exists():
+                os.chmod(path, 0o600)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)")
+        logger.info(f"Using shared cache at {self.path}")
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def get(self, key: str) -> Any | None:
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute("SELECT value, expires_at FROM entries WHERE key = ?", (self._key(key),)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read '{key}' from shared cache: {e}")
+            return None
+        if row is None or row[1] <= time.time():
+            return None
+        logger.debug(f"Shared cache hit for '{key}'")
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, expires_at) VALUES (?, ?, ?)",
+                    (self._key(key), json.dumps(value), now + ttl),
+                )
+                conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write '{key}' to shared cache: {e}")
+
+    def delete(self, *keys: str) -> None:
+        try:
+            with closing(self._connect()) as conn:
+                conn.executemany("DELETE FROM entries WHERE key = ?", [(self._key(key),) for key in keys])
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to delete {keys} from shared cache: {e}")
+
+    def delete_prefix(self, prefix: str) -> None:
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("DELETE FROM entries WHERE substr(key, 1, ?) = ?", (len(self._key(prefix)), self._key(prefix)))
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to delete '{prefix}*' from shared cache: {e}")
+
+
+def _failed(value: Any) -> bool:
+    return isinstance(value, dict) and value.get("ok") is False
+
+
+def fetch_cached(cache: SharedCache | None, key: str, fetch: Callable[[], T], ttl: float | None = None) -> T:
+    """Return the cached value for ``key``, calling ``fetch`` and storing its result on a miss.
+
+    Failed Port responses, ``{"ok": false, ...}``, are returned without being stored, so other processes
+    don't get them for the rest of the TTL.
+    """
+    if cache is None:
+        return fetch()
+    value = cache.get(key)
+    if value is None:
+        value = fetch()
+        if not _failed(value):
+            cache.set(key, value, ttl)
+    return value
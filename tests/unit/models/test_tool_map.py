@@ -1,8 +1,12 @@
-from unittest.mock import MagicMock
+import json
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.client.metadata import MetadataStore
+from src.models.actions import Action
 from src.models.tools import ToolMap
+from src.tools.action.dynamic_actions import DynamicActionToolsManager
 
 from .conftest import TestBaseTool
 
@@ -82,3 +86,118 @@ async def test_tool_map_error_handling(clean_tool_map):
 
     # Verify the second tool replaced the first
     assert tool_map.get_tool("test_tool") is tool2
+
+
+def make_action(identifier: str, title: str) -> Action:
+    return Action.model_validate(
+        {
+            "identifier": identifier,
+            "title": title,
+            "trigger": {"type": "self-service", "operation": "CREATE"},
+            "invocationMethod": {"type": "WEBHOOK", "url": "https://example.com/webhook"},
+        }
+    )
+
+
+@pytest.fixture
+def snapshot_port_client():
+    port_client = MagicMock()
+    port_client.metadata = MetadataStore()
+    return port_client
+
+
+def test_tool_map_snapshot_round_trip(snapshot_port_client, tmp_path):
+    """Test that a saved snapshot restores the dynamic tools and metadata without calling Port."""
+    snapshot_path = tmp_path / "snapshot.json"
+    tool_map = ToolMap(port_client=snapshot_port_client, snapshot_path=snapshot_path)
+    tool_map._set_dynamic_actions([make_action("createJiraIssue", "Create Jira Issue")])
+    snapshot_port_client.metadata.set_blueprints([{"identifier": "service", "title": "Service"}])
+    snapshot_port_client.metadata.set_permissions(["execute:actions:createJiraIssue"])
+    tool_map.save_snapshot()
+
+    restored_client = MagicMock()
+    restored_client.metadata = MetadataStore()
+    with patch.object(DynamicActionToolsManager, "get_dynamic_actions_sync") as mock_fetch:
+        restored = ToolMap(port_client=restored_client, snapshot_path=snapshot_path)
+
+    mock_fetch.assert_not_called()
+    assert restored.stale
+    assert "run_create_jira_issue" in restored.tools
+    assert restored.dynamic_actions[0].identifier == "createJiraIssue"
+    assert restored_client.metadata.blueprints == {"service": {"identifier": "service", "title": "Service"}}
+    assert restored_client.metadata.permissions == ["execute:actions:createJiraIssue"]
+
+
+def test_tool_map_ignores_snapshot_from_other_layout(snapshot_port_client, tmp_path):
+    """Test that snapshots with another layout version are ignored."""
+    snapshot_path = tmp_path / "snapshot.json"
+    snapshot_path.write_text(json.dumps({"version": 0, "actions": []}))
+
+    with patch.object(DynamicActionToolsManager, "get_dynamic_actions_sync", return_value=[]) as mock_fetch:
+        tool_map = ToolMap(port_client=snapshot_port_client, snapshot_path=snapshot_path)
+
+    mock_fetch.assert_called_once()
+    assert not tool_map.stale
+
+
+@pytest.mark.asyncio
+async def test_tool_map_refresh_dynamic_action_tools(snapshot_port_client):
+    """Test that revalidation swaps the dynamic tools and reports changes."""
+    tool_map = ToolMap(port_client=snapshot_port_client)
+    tool_map._set_dynamic_actions([make_action("createJiraIssue", "Create Jira Issue")])
+    tool_map.stale = True
+
+    fresh_actions = [make_action("deployService", "Deploy Service")]
+    with patch.object(DynamicActionToolsManager, "get_dynamic_actions_sync", return_value=fresh_actions):
+        assert await tool_map.refresh_dynamic_action_tools() is True
+        assert await tool_map.refresh_dynamic_action_tools() is False
+
+    assert not tool_map.stale
+    assert "run_deploy_service" in tool_map.tools
+    assert "run_create_jira_issue" not in tool_map.tools
+    assert "get_blueprints" in tool_map.tools
+
+
+@pytest.mark.asyncio
+async def test_tool_map_catalog_mode_lists_found_tools(snapshot_port_client):
+    """Test that catalog mode lists the dynamic tools only once search_tools found them."""
+    with patch.object(DynamicActionToolsManager, "get_dynamic_actions_sync", return_value=[]):
+        tool_map = ToolMap(port_client=snapshot_port_client, catalog_mode=True)
+    tool_map._set_dynamic_actions(
+        [make_action("createJiraIssue", "Create Jira Issue"), make_action("deployService", "Deploy Service")]
+    )
+    notifications = []
+
+    async def on_tools_changed():
+        notifications.append(True)
+
+    tool_map.on_tools_changed = on_tools_changed
+    listed = {tool.name for tool in tool_map.list_tools()}
+    assert "search_tools" in listed
+    assert not listed & {"run_create_jira_issue", "run_deploy_service"}
+    # Found or not, dynamic tools can be called by name
+    assert tool_map.get_tool("run_deploy_service")
+
+    found = await tool_map.search_tools("jira")
+    await tool_map.search_tools("jira issue")
+
+    assert [tool.name for tool in found] == ["run_create_jira_issue"]
+    assert len(notifications) == 1
+    listed = {tool.name for tool in tool_map.list_tools()}
+    assert "run_create_jira_issue" in listed
+    assert "run_deploy_service" not in listed
+
+    tool_map._set_dynamic_actions([make_action("deployService", "Deploy Service")])
+    assert tool_map.revealed_tools == set()
+
+
+def test_tool_map_lists_all_tools_outside_catalog_mode(snapshot_port_client):
+    """Test that all dynamic tools are listed and search_tools isn't registered by default."""
+    with patch.object(DynamicActionToolsManager, "get_dynamic_actions_sync", return_value=[]):
+        tool_map = ToolMap(port_client=snapshot_port_client)
+    tool_map._set_dynamic_actions([make_action("createJiraIssue", "Create Jira Issue")])
+
+    listed = {tool.name for tool in tool_map.list_tools()}
+
+    assert "run_create_jira_issue" in listed
+    assert "search_tools" not in listed
@@ -0,0 +1,168 @@
+"""Tests for streaming AI agent invocations against a local stub of the invoke endpoint."""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pyport
+import pytest
+
+from src.client.agent import PortAgentClient, parse_sse
+from src.client.session import relay_to_event_loop, run_cancellable
+from src.models.agent import PortAgentResponse, PortAgentStreamChunk
+from src.models.agent.port_agent_response import PortAgentTriggerResponse
+from src.utils.errors import PortError
+
+STREAM = [
+    ("invocation", {"invocation": {"identifier": "inv-1"}}),
+    ("execution", {"content": "Looking up "}),
+    ("execution", {"content": "services. "}),
+    ("execution", {"content": "Found 3 ✓"}),
+    ("done", {"status": "Completed", "selectedAgent": "catalog-agent"}),
+]
+
+
+class StubAgentHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Set per test: "stream", "json" or "unsupported"
+    mode = "stream"
+    events = STREAM
+    chunk_delay = 0.0
+    requests: list[str] = []
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.requests.append(self.path)
+        streaming = "stream=true" in self.path
+        if streaming and self.mode == "unsupported":
+            self._send_json(404, {"ok": False, "error": "not_found"})
+        elif streaming and self.mode == "stream":
+            self._send_stream()
+        else:
+            self._send_json(200, {"ok": True, "invocation": {"identifier": "inv-1"}})
+
+    def _send_json(self, status: int, body: dict) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for event, payload in self.events:
+            chunk = f"event: {event}\ndata: {json.dumps(payload)}\n\n".encode()
+            self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.flush()
+            time.sleep(self.chunk_delay)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_url() -> Iterator[str]:
+    StubAgentHandler.mode = "stream"
+    StubAgentHandler.events = STREAM
+    StubAgentHandler.chunk_delay = 0.0
+    StubAgentHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubAgentHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def agent_client(stub_url) -> PortAgentClient:
+    client = pyport.PortClient(client_id="test_id", client_secret="test_secret", skip_auth=True)
+    client._request_manager.api_url = stub_url
+    return PortAgentClient(client)
+
+
+def test_parse_sse_groups_lines_into_events():
+    lines = [": keep-alive", "event: execution", "data: first", "data: second", "", "data:plain", ""]
+
+    assert list(parse_sse(lines)) == [("execution", "first\nsecond"), ("message", "plain")]
+
+
+@pytest.mark.asyncio
+async def test_stream_agent_relays_chunks(agent_client):
+    chunks: list[PortAgentStreamChunk] = []
+
+    result = await agent_client.stream_agent("Which services?", chunks.append)
+
+    assert isinstance(result, PortAgentResponse)
+    assert result.identifier == "inv-1"
+    assert result.status == "Completed"
+    assert result.output == "Looking up services. Found 3 ✓"
+    assert result.selected_agent == "catalog-agent"
+    assert [chunk.text for chunk in chunks] == ["", "Looking up ", "services. ", "Found 3 ✓"]
+    assert chunks[0].identifier == "inv-1"
+
+
+@pytest.mark.asyncio
+async def test_stream_agent_relays_chunks_before_the_stream_ends(agent_client):
+    StubAgentHandler.chunk_delay = 0.3
+    received: list[float] = []
+
+    async def on_chunk(chunk: PortAgentStreamChunk) -> None:
+        if chunk.text:
+            received.append(time.monotonic())
+
+    relay = relay_to_event_loop(on_chunk)
+    started = time.monotonic()
+    await run_cancellable(lambda: agent_client.stream_agent("Which services?", relay))
+    finished = time.monotonic()
+
+    assert len(received) == 3
+    # The first text reaches the event loop while the agent is still generating the rest
+    assert received[0] - started < 0.6
+    assert finished - received[0] > 0.5
+
+
+@pytest.mark.asyncio
+async def test_stream_agent_raises_on_error_event(agent_client):
+    StubAgentHandler.events = [
+        ("invocation", {"invocation": {"identifier": "inv-1"}}),
+        ("error", {"message": "Agent quota exceeded"}),
+    ]
+
+    with pytest.raises(PortError, match="Agent quota exceeded"):
+        await agent_client.stream_agent("Which services?", lambda chunk: None)
+
+
+@pytest.mark.asyncio
+async def test_stream_agent_returns_unfinished_response_when_cut_off(agent_client):
+    StubAgentHandler.events = STREAM[:2]
+
+    result = await agent_client.stream_agent("Which services?", lambda chunk: None)
+
+    assert isinstance(result, PortAgentResponse)
+    assert result.status == "in_progress"
+    assert result.output == "Looking up "
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["json", "unsupported"])
+async def test_stream_agent_falls_back_to_polling(agent_client, mode):
+    StubAgentHandler.mode = mode
+
+    first = await agent_client.stream_agent("Which services?", lambda chunk: None)
+    second = await agent_client.stream_agent("Which services?", lambda chunk: None)
+
+    assert isinstance(first, PortAgentTriggerResponse)
+    assert isinstance(second, PortAgentTriggerResponse)
+    assert second.invocation.identifier == "inv-1"
+    # Once the API turned streaming down, later invocations don't try it again
+    assert StubAgentHandler.requests[-1] == "/agent/invoke"
+    assert sum("stream=true" in path for path in StubAgentHandler.requests) == 1
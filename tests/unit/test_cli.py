@@ -0,0 +1,60 @@
+import importlib
+import sys
+
+import pytest
+
+from src.cli import cli_main
+from src.client.client import PortClient
+from src.config import config
+
+# The package exports the tool map object under the module's name
+tool_map_module = importlib.import_module("src.maps.tool_map")
+
+
+@pytest.fixture
+def restore_config():
+    saved = config.model_dump()
+    yield
+    for name, value in saved.items():
+        setattr(config, name, value)
+
+
+def test_cli_flags_reach_the_client_and_tool_map(monkeypatch, restore_config):
+    client_arguments = {}
+
+    def port_client(**kwargs):
+        client_arguments.update(kwargs)
+        return PortClient()
+
+    tool_maps = []
+    monkeypatch.setattr(tool_map_module, "PortClient", port_client)
+    monkeypatch.setattr("src.server.main", lambda: tool_maps.append(tool_map_module.init_tool_map()))
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "port-mcp-server",
+            "--client-id",
+            "client-id",
+            "--client-secret",
+            "client-secret",
+            "--api-validation-enabled",
+            "true",
+            "--http-pool-size",
+            "3",
+            "--response-max-bytes",
+            "123",
+            "--tool-catalog-mode",
+            "true",
+        ],
+    )
+
+    cli_main()
+
+    # Modules importing the configuration see the values of the flags
+    assert config.api_validation_enabled is True
+    assert client_arguments["client_id"] == "client-id"
+    assert client_arguments["pool_size"] == 3
+    [tool_map] = tool_maps
+    assert tool_map.response_max_bytes == 123
+    assert tool_map.catalog_mode is True
@@ -25,7 +25,8 @@ def test_port_client_sets_user_agent_header(mock_pyport_client):
     mock_pyport_client.assert_called_once_with(
         client_id="test_id",
         client_secret="test_secret",
-        us_region=False
+        us_region=False,
+        skip_auth=True
     )
     
     # Verify that the make_request method was modified to include headers
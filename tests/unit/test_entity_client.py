@@ -0,0 +1,306 @@
+"""Tests for the bulk and paged operations of the entity client."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+from pyport.exceptions import PortResourceNotFoundError, PortServerError
+
+from src.client.entities import BULK_UPSERT_CHUNK_SIZE, PortEntityClient
+from src.config import config
+from src.models.entities import EntityResult, EntitySort
+
+
+def make_response(data: dict) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = data
+    return response
+
+
+@pytest.fixture
+def pyport_client() -> MagicMock:
+    return MagicMock()
+
+
+def entities(count: int) -> list[dict]:
+    return [{"identifier": f"service-{i}", "properties": {}} for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_sends_chunks_to_bulk_endpoint(pyport_client):
+    def make_request(method, endpoint, json):
+        chunk = json["entities"]
+        created = [{"identifier": entity["identifier"], "index": i} for i, entity in enumerate(chunk) if i != 1]
+        errors = [{"identifier": chunk[1]["identifier"], "index": 1, "message": "Invalid property"}]
+        return make_response({"ok": True, "entities": created, "errors": errors})
+
+    pyport_client.make_request.side_effect = make_request
+    client = PortEntityClient(pyport_client)
+
+    results = await client.bulk_upsert_entities("service", entities(45), {"upsert": True, "merge": True})
+
+    assert pyport_client.make_request.call_count == 3
+    method, endpoint = pyport_client.make_request.call_args_list[0].args
+    assert (method, endpoint) == (
+        "POST",
+        "blueprints/service/entities/bulk?upsert=true&validation_only=false&create_missing_related_entities=false&merge=true",
+    )
+    # Chunks are sent concurrently, so in no particular order
+    assert sorted(len(call.kwargs["json"]["entities"]) for call in pyport_client.make_request.call_args_list) == [
+        5,
+        BULK_UPSERT_CHUNK_SIZE,
+        BULK_UPSERT_CHUNK_SIZE,
+    ]
+    assert [result.index for result in results] == list(range(45))
+    assert [result.identifier for result in results if not result.ok] == ["service-1", "service-21", "service-41"]
+    assert results[1].error == "Invalid property"
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_reports_failed_chunk_and_continues(pyport_client):
+    def make_request(method, endpoint, json):
+        if json["entities"][0]["identifier"] == "service-0":
+            raise PortServerError("Internal error", status_code=500)
+        return make_response({"ok": True, "entities": [{"identifier": e["identifier"]} for e in json["entities"]]})
+
+    pyport_client.make_request.side_effect = make_request
+    client = PortEntityClient(pyport_client)
+
+    results = await client.bulk_upsert_entities("service", entities(25), {})
+
+    assert sum(not result.ok for result in results) == BULK_UPSERT_CHUNK_SIZE
+    assert all(result.ok for result in results[BULK_UPSERT_CHUNK_SIZE:])
+    assert "Internal error" in (results[0].error or "")
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_falls_back_to_single_requests(pyport_client):
+    def make_request(method, endpoint, json):
+        if "/bulk" in endpoint:
+            raise PortResourceNotFoundError("Not found", status_code=404)
+        if json["identifier"] == "service-2":
+            return make_response({"ok": False, "error": "invalid"})
+        return make_response({"ok": True, "entity": {"identifier": json["identifier"]}})
+
+    pyport_client.make_request.side_effect = make_request
+    client = PortEntityClient(pyport_client)
+
+    results = await client.bulk_upsert_entities("service", entities(3), {}, max_concurrency=1)
+    again = await client.bulk_upsert_entities("service", entities(1), {})
+
+    assert [result.ok for result in results] == [True, True, False]
+    assert again[0].ok
+    # The bulk endpoint is only tried once
+    bulk_calls = [call for call in pyport_client.make_request.call_args_list if "/bulk" in call.args[1]]
+    assert len(bulk_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_find_entity_identifiers_follows_pages(pyport_client):
+    pages = [
+        {"ok": True, "entities": [{"identifier": "service-0"}, {"identifier": "service-1"}], "next": "cursor-1"},
+        {"ok": True, "entities": [{"identifier": "service-2"}]},
+    ]
+    pyport_client.make_request.side_effect = [make_response(page) for page in pages]
+    client = PortEntityClient(pyport_client)
+    query = {"combinator": "and", "rules": [{"property": "stale", "operator": "=", "value": "true"}]}
+
+    identifiers = await client.find_entity_identifiers("service", query, page_size=2)
+
+    assert identifiers == ["service-0", "service-1", "service-2"]
+    bodies = [call.kwargs["json"] for call in pyport_client.make_request.call_args_list]
+    assert bodies[0] == {"query": query, "include": ["$identifier"], "limit": 2}
+    assert bodies[1]["from"] == "cursor-1"
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_reports_failures_and_progress(pyport_client):
+    def make_request(method, endpoint, json):
+        failed = [{"identifier": identifier, "message": "Has dependents"} for identifier in json["entities"][:1]]
+        return make_response({"ok": True, "failedEntities": failed})
+
+    pyport_client.make_request.side_effect = make_request
+    client = PortEntityClient(pyport_client)
+    progress: list[int] = []
+    identifiers = [f"service-{i}" for i in range(250)]
+
+    results = await client.bulk_delete_entities("service", identifiers, on_progress=progress.append)
+
+    assert pyport_client.make_request.call_args_list[0].args == (
+        "DELETE",
+        "blueprints/service/bulk/entities?delete_dependents=false",
+    )
+    assert [result.identifier for result in results if not result.ok] == ["service-0", "service-100", "service-200"]
+    assert sorted(progress) == progress
+    assert progress[-1] == 250
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_falls_back_to_single_requests(pyport_client):
+    def make_request(method, endpoint, json=None):
+        if "/bulk/" in endpoint:
+            raise PortResourceNotFoundError("Not found", status_code=404)
+        if "service-1" in endpoint:
+            raise PortResourceNotFoundError("Entity not found", status_code=404)
+        return make_response({"ok": True})
+
+    pyport_client.make_request.side_effect = make_request
+    client = PortEntityClient(pyport_client)
+
+    results = await client.bulk_delete_entities("service", ["service-0", "service-1"], delete_dependents=True)
+
+    assert [result.ok for result in results] == [True, False]
+    assert "Entity not found" in (results[1].error or "")
+    assert pyport_client.make_request.call_args_list[-1].args == (
+        "DELETE",
+        "blueprints/service/entities/service-1?delete_dependents=true",
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_entities_by_ids_searches_in_chunks(pyport_client):
+    def make_request(method, endpoint, json):
+        requested = json["query"]["rules"][1]["value"]
+        found = [{"identifier": identifier, "blueprint": "service"} for identifier in requested if identifier != "service-7"]
+        return make_response({"ok": True, "entities": found})
+
+    pyport_client.make_request.side_effect = make_request
+    client = PortEntityClient(pyport_client)
+    identifiers = [f"service-{i}" for i in range(150)]
+
+    entities = await client.get_entities_by_ids("service", identifiers, include=["$identifier", "$title"])
+
+    assert pyport_client.make_request.call_count == 2
+    body = pyport_client.make_request.call_args_list[0].kwargs["json"]
+    assert body["query"]["rules"][1]["operator"] == "in"
+    assert body["include"] == ["$identifier", "$title"]
+    assert sorted(len(call.kwargs["json"]["query"]["rules"][1]["value"]) for call in pyport_client.make_request.call_args_list) == [50, 100]
+    assert len(entities) == 149
+    assert "service-7" not in entities
+    assert entities["service-149"].identifier == "service-149"
+
+
+@pytest.mark.asyncio
+async def test_aggregate_entities_groups_pages_as_they_arrive(pyport_client):
+    pages = [
+        {
+            "ok": True,
+            "entities": [
+                {"identifier": "a", "properties": {"tier": "gold", "latency": 10}},
+                {"identifier": "b", "properties": {"tier": "gold", "latency": 30}},
+            ],
+            "next": "cursor-1",
+        },
+        {
+            "ok": True,
+            "entities": [
+                {"identifier": "c", "properties": {"tier": "silver", "latency": True}},
+                {"identifier": "d", "properties": {"latency": 20}, "relations": {}},
+            ],
+        },
+    ]
+    pyport_client.make_request.side_effect = [make_response(page) for page in pages]
+    client = PortEntityClient(pyport_client)
+    query = {"combinator": "and", "rules": [{"property": "$blueprint", "operator": "=", "value": "service"}]}
+
+    result = await client.aggregate_entities("service", query, group_by="tier", metrics=["latency"], max_groups=2)
+
+    body = pyport_client.make_request.call_args_list[0].kwargs["json"]
+    assert body["include"] == ["$identifier", "properties.latency", "properties.tier", "relations.tier"]
+    assert result.total == 4
+    # Booleans aren't counted as numbers
+    assert result.metrics["latency"].count == 3
+    assert result.metrics["latency"].avg == 20
+    assert [(group.value, group.count) for group in result.groups] == [("gold", 2), ("silver", 1)]
+    assert result.groups[0].metrics["latency"].max == 30
+    assert result.other_groups == 1
+
+
+@pytest.mark.asyncio
+async def test_aggregate_entities_by_relation_and_meta_field(pyport_client):
+    page = {
+        "ok": True,
+        "entities": [
+            {"identifier": "a", "team": ["platform", "sre"], "relations": {"domain": "payments"}},
+            {"identifier": "b", "team": ["platform"], "relations": {"domain": "payments"}},
+        ],
+    }
+    pyport_client.make_request.side_effect = [make_response(page), make_response(page)]
+    client = PortEntityClient(pyport_client)
+
+    by_team = await client.aggregate_entities("service", {"combinator": "and", "rules": []}, group_by="$team")
+    by_domain = await client.aggregate_entities("service", {"combinator": "and", "rules": []}, group_by="domain")
+
+    assert pyport_client.make_request.call_args_list[0].kwargs["json"]["include"] == ["$identifier", "$team"]
+    # Entities of several teams count in each of them
+    assert [(group.value, group.count) for group in by_team.groups] == [("platform", 2), ("sre", 1)]
+    assert [(group.value, group.count) for group in by_domain.groups] == [("payments", 2)]
+    assert by_team.metrics is None
+
+
+@pytest.mark.asyncio
+async def test_search_entities_sorts_across_pages(pyport_client):
+    pages = [
+        {
+            "ok": True,
+            "entities": [
+                {"identifier": "a", "blueprint": "service", "properties": {"latency": 30}},
+                {"identifier": "b", "blueprint": "service", "properties": {}},
+            ],
+            "next": "cursor-1",
+        },
+        {
+            "ok": True,
+            "entities": [
+                {"identifier": "c", "blueprint": "service", "properties": {"latency": 10}},
+                {"identifier": "d", "blueprint": "service", "properties": {"latency": 20}},
+            ],
+        },
+    ]
+    pyport_client.make_request.side_effect = [make_response(page) for page in pages * 2]
+    client = PortEntityClient(pyport_client)
+
+    ascending = await client.search_entities("service", include=["$identifier"], limit=3, sort=EntitySort(property="latency"))
+    descending = await client.search_entities("service", limit=2, sort=EntitySort(property="latency", order="desc"))
+
+    # The sort property is fetched even when it isn't in the projection
+    body = pyport_client.make_request.call_args_list[0].kwargs["json"]
+    assert body["include"] == ["$identifier", "properties.latency", "relations.latency"]
+    assert [entity.identifier for entity in ascending] == ["c", "d", "a"]
+    assert [entity.identifier for entity in descending] == ["a", "d"]
+
+
+@pytest.mark.asyncio
+async def test_search_entities_pages_past_the_page_size(pyport_client):
+    pages = [
+        {"ok": True, "entities": [{"identifier": f"service-{i}"} for i in range(500)], "next": "cursor-1"},
+        {"ok": True, "entities": [{"identifier": f"service-{i}"} for i in range(500, 1000)], "next": "cursor-2"},
+    ]
+    pyport_client.make_request.side_effect = [make_response(page) for page in pages]
+    client = PortEntityClient(pyport_client)
+
+    found = await client.search_entities("service", limit=600)
+
+    assert len(found) == 600
+    # The second page fills the limit, the third isn't requested
+    assert pyport_client.make_request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_validated_entities_are_checked_as_one_list(pyport_client, monkeypatch):
+    monkeypatch.setattr(config, "api_validation_enabled", True)
+    found = [{"identifier": f"service-{i}", "blueprint": "service", "title": f"Service {i}"} for i in range(3)]
+    pyport_client.make_request.return_value = make_response({"ok": True, "entities": found})
+    client = PortEntityClient(pyport_client)
+
+    entities = await client.search_entities("service")
+    by_identifier = await client.get_entities_by_ids("service", ["service-0", "service-1", "service-2"])
+
+    assert all(isinstance(entity, EntityResult) for entity in entities)
+    assert [entity.title for entity in entities] == ["Service 0", "Service 1", "Service 2"]
+    assert list(by_identifier) == ["service-0", "service-1", "service-2"]
+    assert by_identifier["service-1"].title == "Service 1"
+
+    pyport_client.make_request.return_value = make_response({"ok": True, "entities": [*found, {"identifier": "x"}]})
+    with pytest.raises(ValidationError, match=r"3\.blueprint"):
+        await client.search_entities("service")
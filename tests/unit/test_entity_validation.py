@@ -0,0 +1,207 @@
+"""Tests for validating entity writes against the cached blueprint schemas."""
+
+import copy
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.client.blueprints import PortBlueprintClient
+from src.client.client import PortClient
+from src.client.entities import PortEntityClient
+from src.client.entity_validation import EntityValidators
+from src.client.metadata import BLUEPRINT_VALIDATION_TTL, MetadataStore
+from src.utils.errors import PortError
+
+SERVICE = {
+    "identifier": "service",
+    "title": "Service",
+    "schema": {
+        "properties": {
+            "tier": {"type": "string", "enum": ["gold", "silver"]},
+            "replicas": {"type": "number", "minimum": 1},
+            "public": {"type": "boolean"},
+            "tags": {"type": "array", "items": {"type": "string"}},
+            "slug": {"type": "string", "pattern": "^[a-z-]+$"},
+        },
+        "required": ["tier"],
+    },
+    "relations": {
+        "domain": {"target": "domain", "many": False, "required": True},
+        "dependencies": {"target": "service", "many": True, "required": False},
+    },
+}
+
+VALID = {
+    "identifier": "payments",
+    "properties": {"tier": "gold", "replicas": 3, "public": False, "tags": ["pci"], "slug": "payments"},
+    "relations": {"domain": "billing", "dependencies": ["ledger"]},
+}
+
+
+@pytest.fixture
+def validators() -> EntityValidators:
+    metadata = MetadataStore()
+    metadata.set_blueprint(copy.deepcopy(SERVICE))
+    return EntityValidators(metadata)
+
+
+def test_valid_entity_has_no_errors(validators):
+    assert validators.get("service").errors(VALID) == []
+
+
+def test_reports_each_invalid_field(validators):
+    entity = {
+        "properties": {"tier": "bronze", "replicas": "3", "public": "yes", "tags": [1], "slug": "Pay", "owner": "x"},
+        "relations": {"dependencies": "ledger", "team": "payments"},
+    }
+
+    assert validators.get("service").errors(entity) == [
+        "properties.tier: Input should be 'gold' or 'silver'",
+        "properties.replicas: Input should be a valid number",
+        "properties.public: Input should be a valid boolean",
+        "properties.tags.0: Input should be a valid string",
+        "properties.slug: String should match pattern '^[a-z-]+$'",
+        "properties.owner: not defined in blueprint 'service'",
+        "relations.domain: Field required",
+        "relations.dependencies: Input should be a list of entity identifiers or a search query",
+        "relations.team: not defined in blueprint 'service'",
+    ]
+
+
+def test_reports_missing_required_properties_unless_partial(validators):
+    entity = {"properties": {"replicas": 0}, "relations": {}}
+
+    assert validators.get("service").errors(entity) == [
+        "properties.tier: Field required",
+        "properties.replicas: Input should be greater than or equal to 1",
+        "relations.domain: Field required",
+    ]
+    assert validators.get("service").errors(entity, partial=True) == [
+        "properties.replicas: Input should be greater than or equal to 1"
+    ]
+
+
+def test_accepts_nulls_and_relation_queries(validators):
+    entity = {
+        "properties": {"tier": "silver", "replicas": None},
+        "relations": {"domain": {"combinator": "and", "rules": []}, "dependencies": None},
+    }
+
+    assert validators.get("service").errors(entity) == []
+
+
+def test_validators_are_compiled_again_when_the_blueprint_changes(validators):
+    validator = validators.get("service")
+    assert validators.get("service") is validator
+
+    changed = copy.deepcopy(SERVICE)
+    changed["schema"]["properties"]["tier"]["enum"].append("bronze")
+    validators._metadata.set_blueprint(changed)
+
+    assert validators.get("service") is not validator
+    assert validators.get("service").errors({**VALID, "properties": {"tier": "bronze"}}) == []
+
+    validators._metadata.remove_blueprint("service")
+    assert validators.get("service") is None
+
+
+def test_patterns_python_cannot_compile_are_left_to_port():
+    metadata = MetadataStore()
+    blueprint = copy.deepcopy(SERVICE)
+    blueprint["schema"]["properties"]["name"] = {"type": "string", "pattern": "^\\p{L}+$"}
+    blueprint["schema"]["properties"]["release"] = {"type": "string", "pattern": "^(?<year>[0-9]{4})$"}
+    metadata.set_blueprint(blueprint)
+    validator = EntityValidators(metadata).get("service")
+
+    entity = {**VALID, "properties": {"tier": "gold", "name": "Zahlungsdienst", "release": "2024", "slug": "Pay"}}
+    assert validator.errors(entity) == ["properties.slug: String should match pattern '^[a-z-]+$'"]
+
+
+@pytest.fixture
+def port_client() -> tuple[PortClient, MagicMock]:
+    pyport_client = MagicMock()
+    pyport_client.blueprints.get_blueprint.return_value = copy.deepcopy(SERVICE)
+    pyport_client.make_request.return_value.json.return_value = {"ok": True, "entity": VALID}
+    client = PortClient()
+    client._client = pyport_client
+    client.blueprints = PortBlueprintClient(pyport_client, metadata=client.metadata)
+    client.entities = PortEntityClient(pyport_client)
+    return client, pyport_client
+
+
+@pytest.mark.asyncio
+async def test_invalid_entity_is_rejected_before_any_request(port_client):
+    client, pyport_client = port_client
+    client.metadata.set_blueprint(copy.deepcopy(SERVICE))
+
+    with pytest.raises(PortError, match="properties.tier: Input should be 'gold' or 'silver'"):
+        await client.create_entity("service", {**VALID, "properties": {"tier": "bronze"}}, {"upsert": True})
+
+    # Invalid values of known fields are rejected without any request
+    pyport_client.blueprints.get_blueprint.assert_not_called()
+    pyport_client.make_request.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("restored_from_snapshot", [True, False])
+async def test_stale_blueprint_is_fetched_again_before_rejecting(port_client, monkeypatch, restored_from_snapshot):
+    client, pyport_client = port_client
+    stale = copy.deepcopy(SERVICE)
+    stale["schema"]["properties"]["tier"]["enum"] = ["gold"]
+    if restored_from_snapshot:
+        client.metadata.blueprints = {"service": stale}
+    else:
+        client.metadata.set_blueprint(stale)
+        fetched_at = time.monotonic() - BLUEPRINT_VALIDATION_TTL - 1
+        monkeypatch.setitem(client.metadata._blueprint_fetched_at, "service", fetched_at)
+
+    # 'silver' was added to the blueprint since it was stored
+    await client.create_entity("service", {**VALID, "properties": {"tier": "silver"}}, {"upsert": True})
+    pyport_client.blueprints.get_blueprint.assert_called_once_with("service")
+    pyport_client.make_request.assert_called_once()
+
+    # The fetched blueprint is fresh, so invalid values are rejected without fetching it again
+    with pytest.raises(PortError, match="properties.tier: Input should be 'gold' or 'silver'"):
+        await client.create_entity("service", {**VALID, "properties": {"tier": "bronze"}}, {"upsert": True})
+    pyport_client.blueprints.get_blueprint.assert_called_once()
+    pyport_client.make_request.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_blueprint_is_fetched_again_for_fields_it_does_not_define(port_client):
+    client, pyport_client = port_client
+    stored = copy.deepcopy(SERVICE)
+    del stored["schema"]["properties"]["slug"]
+    client.metadata.set_blueprint(stored)
+
+    # The field was added to the blueprint since it was stored
+    await client.create_entity("service", VALID, {"upsert": True})
+    pyport_client.blueprints.get_blueprint.assert_called_once_with("service")
+    pyport_client.make_request.assert_called_once()
+
+    with pytest.raises(PortError, match="properties.owner: not defined in blueprint 'service'"):
+        await client.create_entity("service", {**VALID, "properties": {"tier": "gold", "owner": "x"}}, {"upsert": True})
+    assert pyport_client.blueprints.get_blueprint.call_count == 2
+    pyport_client.make_request.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_unknown_blueprint_is_fetched_before_validating(port_client):
+    client, pyport_client = port_client
+
+    await client.create_entity("service", VALID, {"upsert": True})
+    await client.create_entity("service", {"properties": {"replicas": 2}}, {"upsert": True, "merge": True})
+
+    pyport_client.blueprints.get_blueprint.assert_called_once_with("service")
+    assert pyport_client.make_request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_entity_is_sent_when_the_blueprint_cannot_be_fetched(port_client):
+    client, pyport_client = port_client
+    pyport_client.blueprints.get_blueprint.side_effect = RuntimeError("unavailable")
+
+    await client.create_entity("service", {"properties": {"tier": "bronze"}}, {"upsert": True})
+
+    pyport_client.make_request.assert_called_once()
@@ -0,0 +1,41 @@
+"""Tests keeping the package cheap to import, each import runs in a fresh interpreter."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+
+
+@pytest.mark.parametrize("module", ["src", "src.config", "src.models", "src.client", "src.tools", "src.server", "src.cli"])
+def test_each_package_imports_on_its_own(module):
+    run(f"import {module}")
+
+
+def test_models_do_not_load_the_server():
+    loaded = run(
+        "import sys, src.models; print(sorted(name for name in ('mcp', 'src.server', 'src.tools') if name in sys.modules))"
+    )
+
+    assert loaded == "[]"
+
+
+def test_models_are_built_on_first_use():
+    code = """
+from src.models import Blueprint
+print(Blueprint.__pydantic_complete__)
+blueprint = Blueprint.model_validate({"identifier": "service", "title": "Service", "schema": {"properties": {}, "required": []}})
+print(Blueprint.__pydantic_complete__, blueprint.identifier)
+"""
+
+    assert run(code).splitlines() == ["False", "True service"]
+
+
+def test_lazy_exports_are_the_same_classes():
+    from src.models import ToolMap
+    from src.models.tools.tool_map import ToolMap as ToolMapClass
+
+    assert ToolMap is ToolMapClass
@@ -0,0 +1,101 @@
+"""Tests for the blueprint and action summary indexes of the metadata store."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.client.actions import PortActionClient
+from src.client.blueprints import PortBlueprintClient
+from src.client.metadata import MetadataStore
+
+SERVICE = {
+    "identifier": "service",
+    "title": "Service",
+    "description": "A deployable service",
+    "schema": {"properties": {"language": {"type": "string", "enum": ["go", "python"]}}, "required": []},
+    "mirrorProperties": {"domain_owner": {"path": "domain.owner"}},
+    "calculationProperties": {"url": {"calculation": ".identifier", "type": "string"}},
+    "relations": {"domain": {"target": "domain", "many": False, "required": False}},
+}
+
+
+def test_blueprint_summaries_are_indexed_once_fetched():
+    metadata = MetadataStore()
+    assert metadata.blueprint_summaries() is None
+
+    metadata.set_blueprints([SERVICE, {"identifier": "domain", "title": "Domain", "schema": {"properties": {}}}])
+
+    assert metadata.blueprint_summaries() == [
+        {
+            "identifier": "service",
+            "title": "Service",
+            "description": "A deployable service",
+            "properties": ["language", "domain_owner", "url"],
+            "relations": ["domain"],
+        },
+        {"identifier": "domain", "title": "Domain", "description": None, "properties": [], "relations": []},
+    ]
+
+
+def test_blueprint_summaries_follow_changes_and_expire(monkeypatch):
+    metadata = MetadataStore()
+    metadata.set_blueprints([SERVICE])
+    metadata.blueprint_summaries()
+
+    metadata.set_blueprint({**SERVICE, "title": "Microservice", "relations": {}})
+    metadata.set_blueprint({"identifier": "domain", "title": "Domain"})
+    metadata.remove_blueprint("domain")
+
+    [summary] = metadata.blueprint_summaries() or []
+    assert summary["title"] == "Microservice"
+    assert summary["relations"] == []
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 301)
+    assert metadata.blueprint_summaries() is None
+
+
+@pytest.mark.asyncio
+async def test_blueprint_client_serves_summaries_from_the_index():
+    pyport_client = MagicMock()
+    pyport_client.blueprints.get_blueprints.return_value = [SERVICE]
+    client = PortBlueprintClient(pyport_client)
+
+    first = await client.get_blueprint_summaries()
+    second = await client.get_blueprint_summaries()
+
+    assert pyport_client.blueprints.get_blueprints.call_count == 1
+    assert [summary.identifier for summary in second] == ["service"]
+    assert first[0].properties == ["language", "domain_owner", "url"]
+
+
+@pytest.mark.asyncio
+async def test_action_client_serves_summaries_from_the_index():
+    responses = {
+        "auth/permissions?action_version=v2": {"ok": True, "permissions": ["execute:actions:deploy"]},
+        "actions?trigger_type=self-service": {
+            "actions": [
+                {"identifier": "deploy", "title": "Deploy", "trigger": {"blueprintIdentifier": "service"}},
+                {"identifier": "destroy", "title": "Destroy", "trigger": {"blueprintIdentifier": "service"}},
+            ]
+        },
+    }
+    pyport_client = MagicMock()
+    pyport_client.make_request.side_effect = lambda method, endpoint, **kwargs: MagicMock(
+        json=MagicMock(return_value=responses[endpoint])
+    )
+    client = PortActionClient(pyport_client)
+
+    await client.get_action_summaries()
+    summaries = await client.get_action_summaries()
+
+    assert pyport_client.make_request.call_count == 2
+    # Only the actions the user may run are listed
+    assert [summary.model_dump(exclude_none=True) for summary in summaries] == [
+        {"identifier": "deploy", "title": "Deploy", "blueprint": "service"}
+    ]
+
+    client._invalidate_cache("deploy")
+    await client.get_action_summaries()
+    assert pyport_client.make_request.call_count == 4
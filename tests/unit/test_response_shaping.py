@@ -0,0 +1,124 @@
+import json
+
+import pytest
+
+from src.handlers.call_tool import execute_tool
+from src.models.common.annotations import Annotations
+from src.models.common.base_pydantic import BaseModel
+from src.models.tools.tool import Tool
+from src.utils.response_shaping import RESULT_KEY, TRUNCATED_KEY, drop_empty, shape_response, summarize_deep
+
+
+def entities(count: int) -> list[dict]:
+    return [
+        {"identifier": f"service-{i}", "title": f"Service {i}", "properties": {"tier": "gold", "owner": None}}
+        for i in range(count)
+    ]
+
+
+def test_shape_response_keeps_results_within_budget():
+    result = {"entities": entities(3), "note": None}
+
+    assert shape_response(result, 10_000) == json.dumps(result)
+    assert shape_response(result, 0) == json.dumps(result)
+
+
+def test_drop_empty_keeps_false_and_zero():
+    assert drop_empty({"a": None, "b": "", "c": [], "d": {"e": {}}, "f": False, "g": 0, "h": [None, 1]}) == {
+        "f": False,
+        "g": 0,
+        "h": [None, 1],
+    }
+
+
+def test_summarize_deep():
+    value = {"schema": {"properties": {"tier": {"type": "string", "enum": ["gold", "silver"]}}}}
+
+    assert summarize_deep(value, 2) == {"schema": {"properties": "<object with 1 fields: tier>"}}
+    assert summarize_deep(value, 3)["schema"]["properties"]["tier"] == "<object with 2 fields: type, enum>"
+
+
+def test_shape_response_truncates_the_largest_list():
+    result = {"entities": entities(2000), "blueprint": "service"}
+
+    text = shape_response(result, 20_000)
+
+    assert len(text) <= 20_000
+    shaped = json.loads(text)
+    returned = len(shaped["entities"])
+    assert 0 < returned < 2000
+    # The shaped entities are returned in order, without their empty fields
+    assert shaped["entities"][0] == {"identifier": "service-0", "title": "Service 0", "properties": {"tier": "gold"}}
+    assert shaped["blueprint"] == "service"
+    assert shaped[TRUNCATED_KEY]["lists"] == [{"path": "entities", "returned": returned, "total": 2000}]
+    # Most of the budget is still used
+    assert len(text) > 15_000
+
+
+def test_shape_response_truncates_lists_before_summarizing():
+    deep = {"schema": {"properties": {"tier": {"enum": {"gold": {"color": "yellow"}}}}}}
+    result = {"blueprints": [{"identifier": f"bp-{i}", **deep} for i in range(200)]}
+
+    shaped = json.loads(shape_response(result, 5_000))
+
+    # Truncating the list is enough, so what's returned of each item is left as it was
+    assert 0 < len(shaped["blueprints"]) < 200
+    assert shaped["blueprints"][0] == result["blueprints"][0]
+
+
+def test_shape_response_truncates_nested_lists():
+    result = {"results": [{"ok": True, "result": {"entities": entities(500)}}, {"ok": True, "result": {}}]}
+
+    shaped = json.loads(shape_response(result, 5_000))
+
+    assert len(shaped["results"]) == 2
+    assert shaped[TRUNCATED_KEY]["lists"][0]["path"] == "results[0].result.entities"
+
+
+def test_shape_response_cuts_long_strings():
+    result = {"identifier": "runbook", "properties": {"readme": "x" * 1_000_000, "owner": "platform"}}
+
+    text = shape_response(result, 1_000)
+
+    assert len(text) <= 1_000
+    shaped = json.loads(text)
+    assert shaped["identifier"] == "runbook"
+    assert shaped["properties"]["owner"] == "platform"
+    readme = shaped["properties"]["readme"]
+    assert readme.startswith("xxx")
+    assert readme.endswith(f"... <{1_000_000 - readme.index('.')} more characters>")
+
+
+def test_shape_response_reports_truncated_top_level_lists():
+    result = entities(500)
+
+    shaped = json.loads(shape_response(result, 5_000))
+
+    returned = len(shaped[RESULT_KEY])
+    assert 0 < returned < 500
+    assert shaped[TRUNCATED_KEY]["lists"] == [{"path": RESULT_KEY, "returned": returned, "total": 500}]
+    # Lists that fit once their empty fields are dropped are returned as they are
+    assert isinstance(json.loads(shape_response(entities(3), 250)), list)
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_shapes_the_result():
+    async def get_entities(props: BaseModel) -> dict:
+        return {"entities": entities(1000)}
+
+    tool = Tool(
+        name="get_entities",
+        description="Get entities",
+        function=get_entities,
+        input_schema=BaseModel,
+        output_schema=BaseModel,
+        annotations=Annotations(
+            title="Get Entities", readOnlyHint=True, destructiveHint=False, idempotentHint=True, openWorldHint=False
+        ),
+    )
+
+    unshaped = await execute_tool(tool, {})
+    shaped = await execute_tool(tool, {}, max_response_bytes=10_000)
+
+    assert len(json.loads(unshaped[0].text)["entities"]) == 1000
+    assert len(shaped[0].text) <= 10_000
@@ -0,0 +1,80 @@
+import json
+import time
+
+import pytest
+
+from src.utils.errors import PortError
+from src.utils.response_shaping import TRUNCATED_KEY, shape_response
+from src.utils.result_store import ResultStore
+
+
+def test_result_store_pages_through_items():
+    store = ResultStore()
+    handle = store.put(list(range(250)), 1000)
+
+    assert handle is not None
+    assert store.page(handle, 100, 100) == (list(range(100, 200)), 250)
+    assert store.page(handle, 200, 100) == (list(range(200, 250)), 250)
+
+
+def test_result_store_evicts_least_recently_read_over_max_bytes():
+    store = ResultStore(max_bytes=300)
+    first = store.put(["a"], 100)
+    second = store.put(["b"], 100)
+    store.put(["c"], 100)
+    assert first is not None and second is not None
+    # Reading the first one keeps it, the second is now the least recently read
+    store.page(first, 0, 1)
+
+    store.put(["d"], 100)
+
+    assert store.size == 300
+    assert store.page(first, 0, 1) == (["a"], 1)
+    with pytest.raises(PortError, match="wasn't found"):
+        store.page(second, 0, 1)
+    assert store.put(["too large"], 301) is None
+
+
+def test_result_store_expires_entries(monkeypatch):
+    store = ResultStore(ttl=10)
+    handle = store.put(["a"], 100)
+    assert handle is not None
+    now = time.monotonic()
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+
+    with pytest.raises(PortError):
+        store.page(handle, 0, 1)
+    assert store.size == 0
+    assert len(store) == 0
+
+
+def test_shape_response_stores_truncated_lists():
+    store = ResultStore()
+    result = {"entities": [{"identifier": f"service-{i}", "tags": ["a", "b"]} for i in range(1000)]}
+
+    shaped = json.loads(shape_response(result, 5_000, store))
+
+    [truncated] = shaped[TRUNCATED_KEY]["lists"]
+    assert "fetch_result_page" in shaped[TRUNCATED_KEY]["message"]
+    items, total = store.page(truncated["handle"], truncated["returned"], 10)
+    assert total == 1000
+    assert items[0] == {"identifier": f"service-{truncated['returned']}", "tags": ["a", "b"]}
+    # The tool's result itself is left as it was
+    assert len(result["entities"]) == 1000
+
+
+def test_stored_pages_match_the_original_items():
+    store = ResultStore()
+    schema = {"properties": {"tier": {"enum": ["a", "b"], "enumColors": {"a": "red", "b": "blue"}}}}
+    items = [{"identifier": f"bp-{i}", "description": None, "schema": schema} for i in range(300)]
+    result = {"results": [{"ok": True, "result": {"blueprints": items}}]}
+
+    shaped = json.loads(shape_response(result, 5_000, store))
+
+    [truncated] = shaped[TRUNCATED_KEY]["lists"]
+    assert truncated["path"] == "results[0].result.blueprints"
+    page, total = store.page(truncated["handle"], truncated["returned"], 10)
+    assert total == 300
+    # Pages aren't shaped like the response, empty fields and nested objects are kept
+    assert page == items[truncated["returned"] : truncated["returned"] + 10]
@@ -0,0 +1,93 @@
+"""Tests for compacting tool JSON schemas."""
+
+import json
+from typing import Literal
+
+from pydantic import Field
+
+from src.models.common.base_pydantic import BaseModel
+from src.utils.schema import compact_schema, inline_schema, model_schema, schema_sizes
+
+Color = Literal["red", "orange", "yellow", "green", "blue", "indigo", "violet", "black", "white", "gray"]
+
+
+class Point(BaseModel):
+    x: int
+    y: int
+
+
+class Shape(BaseModel):
+    fill: Color = Field(..., description="The fill color")
+    stroke: Color = Field(default="black", description="The stroke color")
+    origin: Point
+    points: list[Point]
+
+
+class Canvas(BaseModel):
+    shapes: list[Shape]
+    background: Color = Field(default="white", description="The background color")
+
+
+def test_compact_schema_merges_identical_definitions():
+    schema = {
+        "type": "object",
+        "properties": {"a": {"$ref": "#/$defs/A"}, "b": {"$ref": "#/$defs/B"}},
+        "$defs": {
+            "A": {"type": "object", "properties": {"id": {"type": "string"}}},
+            "B": {"type": "object", "properties": {"id": {"type": "string"}}},
+        },
+    }
+
+    compact = compact_schema(schema)
+
+    assert compact["properties"] == {"a": {"$ref": "#/$defs/A"}, "b": {"$ref": "#/$defs/A"}}
+    assert list(compact["$defs"]) == ["A"]
+    # The given schema isn't changed
+    assert "B" in schema["$defs"]
+
+
+def test_compact_schema_inlines_definitions_used_once():
+    schema = {
+        "type": "object",
+        "properties": {"a": {"$ref": "#/$defs/A", "description": "The A"}},
+        "$defs": {"A": {"type": "object", "properties": {"b": {"$ref": "#/$defs/B"}}}, "B": {"type": "integer"}},
+    }
+
+    assert compact_schema(schema) == {
+        "type": "object",
+        "properties": {"a": {"type": "object", "properties": {"b": {"type": "integer"}}, "description": "The A"}},
+    }
+
+
+def test_compact_schema_keeps_recursive_definitions():
+    schema = {
+        "$ref": "#/$defs/Node",
+        "$defs": {"Node": {"type": "object", "properties": {"children": {"type": "array", "items": {"$ref": "#/$defs/Node"}}}}},
+    }
+
+    assert compact_schema(schema) == schema
+
+
+def test_compact_schema_shares_repeated_subschemas():
+    compact = model_schema(Canvas)
+    shape = compact["properties"]["shapes"]["items"]
+
+    # The color enum is written once, each use keeps its own description and default
+    assert compact["$defs"]["fill"]["enum"][0] == "red"
+    assert shape["properties"]["fill"] == {"$ref": "#/$defs/fill", "description": "The fill color"}
+    assert shape["properties"]["stroke"] == {"$ref": "#/$defs/fill", "default": "black", "description": "The stroke color"}
+    assert compact["properties"]["background"]["$ref"] == "#/$defs/fill"
+    # Models used in several places stay shared
+    assert shape["properties"]["origin"] == {"$ref": "#/$defs/Point"}
+    assert shape["properties"]["points"]["items"] == {"$ref": "#/$defs/Point"}
+    assert sorted(compact["$defs"]) == ["Point", "fill"]
+
+
+def test_model_schema_is_generated_once_per_model():
+    assert model_schema(Canvas) is model_schema(Canvas)
+
+    inlined, compact = schema_sizes(Canvas)
+
+    assert inlined == len(json.dumps(inline_schema(Canvas.model_json_schema())))
+    assert compact == len(json.dumps(model_schema(Canvas)))
+    assert compact < inlined
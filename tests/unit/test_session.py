@@ -0,0 +1,125 @@
+"""Tests for the Port API connection pool."""
+
+import socket
+import threading
+import time
+from unittest.mock import patch
+
+import anyio
+import pytest
+import requests  # type: ignore[import-untyped]
+
+from src.client.client import PortClient
+from src.client.session import KeepAliveHTTPAdapter, RequestScope, configure_session, current_request_scope, run_cancellable
+from src.utils import PortRequestCancelledError
+
+
+def start_listener() -> tuple[socket.socket, list[socket.socket]]:
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    accepted: list[socket.socket] = []
+
+    def accept() -> None:
+        while True:
+            try:
+                accepted.append(listener.accept()[0])
+            except OSError:
+                return
+
+    threading.Thread(target=accept, daemon=True).start()
+    return listener, accepted
+
+
+def test_configure_session_mounts_sized_adapter():
+    session = requests.Session()
+
+    adapter = configure_session(session, pool_size=4, keepalive_expiry=30)
+
+    assert session.get_adapter("https://api.getport.io/v1") is adapter
+    assert adapter._pool_maxsize == 4
+
+
+def test_prewarm_opens_connections_in_the_pool():
+    listener, accepted = start_listener()
+    url = f"http://127.0.0.1:{listener.getsockname()[1]}"
+    adapter = KeepAliveHTTPAdapter(pool_size=2, keepalive_expiry=60)
+    try:
+        # Never opens more connections than the pool can keep
+        assert adapter.prewarm(url, 3) == 2
+
+        deadline = time.time() + 2
+        while len(accepted) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(accepted) == 2
+        pool = adapter.get_connection_with_tls_context(requests.Request("GET", url).prepare(), True)
+        assert pool.num_connections == 2
+    finally:
+        listener.close()
+
+
+def test_idle_connections_expire():
+    adapter = KeepAliveHTTPAdapter(pool_size=2, keepalive_expiry=60)
+
+    with patch.object(adapter.poolmanager, "clear") as clear:
+        adapter._expire_idle_connections()
+        clear.assert_not_called()
+
+        adapter._last_used -= 61
+        adapter._expire_idle_connections()
+        clear.assert_called_once()
+
+
+@patch("src.client.client.pyport.PortClient")
+def test_port_client_configures_connection_pool(mock_pyport_client):
+    session = requests.Session()
+    mock_pyport_client.return_value._session = session
+
+    client = PortClient(client_id="test_id", client_secret="test_secret", pool_size=5, keepalive_expiry=15)
+    client.token_manager.stop()
+
+    adapter = session.get_adapter("https://api.getport.io/v1")
+    assert isinstance(adapter, KeepAliveHTTPAdapter)
+    assert adapter._pool_maxsize == 5
+    assert adapter.keepalive_expiry == 15
+
+
+async def test_cancellation_aborts_in_flight_request():
+    # The listener accepts connections but never answers, like a stuck request
+    listener, _ = start_listener()
+    url = f"http://127.0.0.1:{listener.getsockname()[1]}"
+    session = requests.Session()
+    session.mount("http://", KeepAliveHTTPAdapter(pool_size=2, keepalive_expiry=60))
+    finished = threading.Event()
+    errors: list[Exception] = []
+
+    async def stuck_request():
+        try:
+            session.get(url, timeout=10)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            finished.set()
+
+    try:
+        started = time.monotonic()
+        with anyio.move_on_after(0.2):
+            await run_cancellable(stuck_request)
+        # The caller returns right away and the worker thread isn't left waiting on the socket
+        assert time.monotonic() - started < 1
+        assert finished.wait(2)
+        assert isinstance(errors[0], requests.ConnectionError)
+    finally:
+        listener.close()
+
+
+def test_cancelled_scope_stops_further_requests():
+    adapter = KeepAliveHTTPAdapter(pool_size=2, keepalive_expiry=60)
+    scope = RequestScope()
+    scope.cancel()
+    token = current_request_scope.set(scope)
+    try:
+        with pytest.raises(PortRequestCancelledError):
+            adapter.send(requests.Request("GET", "http://127.0.0.1:1").prepare())
+    finally:
+        current_request_scope.reset(token)
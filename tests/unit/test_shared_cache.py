@@ -0,0 +1,114 @@
+"""Tests for the host-level shared cache."""
+
+import sqlite3
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from unittest.mock import Mock
+
+from src.utils.shared_cache import SharedCache, fetch_cached
+
+
+def test_shared_cache_set_and_get(tmp_path):
+    cache = SharedCache(tmp_path / "cache.sqlite3", namespace="org")
+
+    cache.set("blueprints", [{"identifier": "service"}])
+
+    # A second instance on the same file sees the entry, like another server process would
+    other_process_cache = SharedCache(tmp_path / "cache.sqlite3", namespace="org")
+    assert other_process_cache.get("blueprints") == [{"identifier": "service"}]
+    assert other_process_cache.get("missing") is None
+
+
+def test_shared_cache_ttl_expiry(tmp_path):
+    cache = SharedCache(tmp_path / "cache.sqlite3")
+
+    cache.set("short", "value", ttl=0.05)
+    cache.set("disabled", "value", ttl=0)
+
+    assert cache.get("short") == "value"
+    assert cache.get("disabled") is None
+    time.sleep(0.1)
+    assert cache.get("short") is None
+
+
+def test_shared_cache_namespaces_are_isolated(tmp_path):
+    first = SharedCache(tmp_path / "cache.sqlite3", namespace="first")
+    second = SharedCache(tmp_path / "cache.sqlite3", namespace="second")
+
+    first.set("access_token", "first-token")
+
+    assert second.get("access_token") is None
+
+
+def test_shared_cache_delete_and_delete_prefix(tmp_path):
+    cache = SharedCache(tmp_path / "cache.sqlite3")
+    cache.set("actions:self-service", [1])
+    cache.set("actions:automation", [2])
+    cache.set("action:deploy", {"identifier": "deploy"})
+
+    cache.delete_prefix("actions:")
+    assert cache.get("actions:self-service") is None
+    assert cache.get("actions:automation") is None
+    assert cache.get("action:deploy") == {"identifier": "deploy"}
+
+    cache.delete("action:deploy")
+    assert cache.get("action:deploy") is None
+
+
+def test_shared_cache_concurrent_writers(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    SharedCache(path)
+
+    def write(i: int) -> None:
+        SharedCache(path).set(f"key-{i}", i)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(write, range(50)))
+
+    cache = SharedCache(path)
+    assert [cache.get(f"key-{i}") for i in range(50)] == list(range(50))
+
+
+def test_shared_cache_files_are_private(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    files = [path, tmp_path / "cache.sqlite3-wal", tmp_path / "cache.sqlite3-shm"]
+
+    # Another process keeps the WAL files of a database readable by others open
+    with closing(sqlite3.connect(path, isolation_level=None)) as other:
+        other.execute("PRAGMA journal_mode=WAL")
+        other.execute("CREATE TABLE entries (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)")
+        for file in files:
+            file.chmod(0o644)
+
+        SharedCache(path).set("token", "secret")
+        assert [stat.S_IMODE(file.stat().st_mode) for file in files] == [0o600, 0o600, 0o600]
+
+    # Files created later get the database's permissions
+    with closing(sqlite3.connect(path)) as reader:
+        reader.execute("SELECT count(*) FROM entries").fetchone()
+        SharedCache(path).set("token", "secret")
+        assert [stat.S_IMODE(file.stat().st_mode) for file in files] == [0o600, 0o600, 0o600]
+
+
+def test_fetch_cached(tmp_path):
+    cache = SharedCache(tmp_path / "cache.sqlite3")
+    fetch = Mock(return_value={"ok": True})
+
+    assert fetch_cached(cache, "key", fetch) == {"ok": True}
+    assert fetch_cached(cache, "key", fetch) == {"ok": True}
+    assert fetch.call_count == 1
+
+    assert fetch_cached(None, "key", fetch) == {"ok": True}
+    assert fetch.call_count == 2
+
+
+def test_fetch_cached_does_not_store_failed_responses(tmp_path):
+    cache = SharedCache(tmp_path / "cache.sqlite3")
+    fetch = Mock(side_effect=[{"ok": False, "error": "unavailable"}, {"ok": True, "permissions": []}])
+
+    assert fetch_cached(cache, "permissions", fetch) == {"ok": False, "error": "unavailable"}
+    assert fetch_cached(cache, "permissions", fetch) == {"ok": True, "permissions": []}
+    assert fetch_cached(cache, "permissions", fetch) == {"ok": True, "permissions": []}
+    assert fetch.call_count == 2
@@ -0,0 +1,158 @@
+"""Tests for the access token manager."""
+
+import base64
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from src.client.client import PortClient
+from src.client.token_manager import TOKEN_REFRESH_MARGIN, TokenManager, get_token_expiry
+from src.utils.shared_cache import SharedCache
+
+
+def make_token(expires_in: float) -> str:
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": time.time() + expires_in}).encode()).decode().rstrip("=")
+    return f"header.{claims}.signature"
+
+
+def wait_for(condition, timeout: float = 2) -> None:
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def test_get_token_expiry():
+    token = make_token(3600)
+    assert abs(get_token_expiry(token) - (time.time() + 3600)) < 5
+    assert get_token_expiry("not-a-jwt") is None
+
+
+def test_concurrent_callers_share_a_single_fetch():
+    release = threading.Event()
+    token = make_token(3600)
+
+    def fetch_token():
+        release.wait(1)
+        return token
+
+    fetch = Mock(side_effect=fetch_token)
+    on_token = Mock()
+    manager = TokenManager(fetch, on_token)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(manager.get_token) for _ in range(8)]
+        time.sleep(0.05)
+        release.set()
+        assert [future.result() for future in futures] == [token] * 8
+
+    fetch.assert_called_once()
+    on_token.assert_called_once_with(token)
+
+
+def test_prefetches_token_in_the_background():
+    token = make_token(3600)
+    fetch = Mock(return_value=token)
+    manager = TokenManager(fetch, Mock())
+
+    manager.start()
+    try:
+        wait_for(lambda: manager.token == token)
+        # A caller arriving after the prefetch doesn't trigger another request
+        assert manager.get_token() == token
+        fetch.assert_called_once()
+    finally:
+        manager.stop()
+
+
+def test_refreshes_token_before_expiry():
+    soon_expiring = make_token(TOKEN_REFRESH_MARGIN + 0.2)
+    fresh = make_token(3600)
+    fetch = Mock(side_effect=[soon_expiring, fresh])
+    on_token = Mock()
+    manager = TokenManager(fetch, on_token)
+
+    manager.start()
+    try:
+        wait_for(lambda: manager.token == fresh)
+        assert on_token.call_args_list[-1].args == (fresh,)
+        assert fetch.call_count == 2
+    finally:
+        manager.stop()
+
+
+def test_refreshes_token_without_expiry_on_the_fixed_interval():
+    fetch = Mock(side_effect=["opaque-1", "opaque-2", "opaque-3"])
+    manager = TokenManager(fetch, Mock())
+
+    with patch("src.client.token_manager.TOKEN_REFRESH_INTERVAL", 0.05):
+        manager.start()
+        try:
+            wait_for(lambda: manager.token == "opaque-2")
+        finally:
+            manager.stop()
+
+
+def test_keeps_retrying_after_a_failed_refresh():
+    token = make_token(3600)
+    fetch = Mock(side_effect=[RuntimeError("boom"), token])
+    manager = TokenManager(fetch, Mock())
+
+    with patch("src.client.token_manager.TOKEN_RETRY_MIN_DELAY", 0.01):
+        manager.start()
+        try:
+            wait_for(lambda: manager.token == token)
+        finally:
+            manager.stop()
+
+
+def test_shares_fetched_token(tmp_path):
+    token = make_token(3 * 3600)
+    cache = SharedCache(tmp_path / "cache.sqlite3")
+    manager = TokenManager(Mock(return_value=token), Mock(), cache)
+
+    manager.get_token()
+
+    assert cache.get("access_token") == token
+
+
+def test_reuses_shared_token(tmp_path):
+    token = make_token(3 * 3600)
+    cache = SharedCache(tmp_path / "cache.sqlite3")
+    cache.set("access_token", token)
+    fetch = Mock()
+    manager = TokenManager(fetch, Mock(), cache)
+
+    assert manager.get_token() == token
+    fetch.assert_not_called()
+
+
+def test_does_not_share_expiring_token(tmp_path):
+    cache = SharedCache(tmp_path / "cache.sqlite3")
+    manager = TokenManager(Mock(return_value=make_token(TOKEN_REFRESH_MARGIN - 10)), Mock(), cache)
+
+    manager.get_token()
+
+    assert cache.get("access_token") is None
+
+
+@patch("src.client.client.pyport.PortClient")
+def test_port_client_prefetches_token(mock_pyport_client):
+    token = make_token(3600)
+    pyport_client = mock_pyport_client.return_value
+    pyport_client._auth_manager._get_access_token.return_value = token
+
+    client = PortClient(client_id="test_id", client_secret="test_secret")
+    try:
+        wait_for(lambda: pyport_client._update_session_token.called)
+    finally:
+        client.token_manager.stop()
+
+    # pyport no longer fetches the token while the client is being constructed
+    mock_pyport_client.assert_called_once_with(
+        client_id="test_id", client_secret="test_secret", us_region=False, skip_auth=True
+    )
+    pyport_client._update_session_token.assert_called_once_with(token)
+    assert pyport_client._auth_manager.token == token
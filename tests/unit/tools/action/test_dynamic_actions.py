@@ -481,3 +481,149 @@ class TestDynamicActionToolsManager:
 
                 mock_run.assert_called_once()
                 assert result == []
+
+
+@pytest.fixture
+def scale_action():
+    """Create an action on service entities with user inputs."""
+    return Action.model_validate(
+        {
+            "identifier": "scaleService",
+            "title": "Scale Service",
+            "trigger": {
+                "type": "self-service",
+                "operation": "DAY-2",
+                "blueprintIdentifier": "service",
+                "userInputs": {
+                    "properties": {
+                        "replicas": {"type": "number", "title": "Replicas", "minimum": 1},
+                        "environment": {"type": "string", "enum": ["production", "staging"]},
+                        "cluster": {"type": "string", "format": "entity", "blueprint": "cluster"},
+                        "reviewers": {"type": "array", "items": {"type": "string", "format": "entity", "blueprint": "_user"}},
+                    },
+                    "required": ["replicas"],
+                },
+            },
+            "invocationMethod": {"type": "KAFKA"},
+        },
+        strict=False,
+    )
+
+
+class TestActionInputSchema:
+    """Test the input schemas generated from the user inputs of actions."""
+
+    def test_schema_follows_user_inputs(self, mock_client_for_dynamic_actions, scale_action):
+        """Test that the tool's input schema describes the action's user inputs."""
+        tool = DynamicActionToolsManager(mock_client_for_dynamic_actions)._create_dynamic_action_tool(scale_action)
+
+        schema = tool.input_schema_json
+        inputs = schema["properties"]["properties"]
+        assert schema["required"] == ["entity_identifier", "properties"]
+        assert "'service' entity" in schema["properties"]["entity_identifier"]["description"]
+        assert inputs["required"] == ["replicas"]
+        assert inputs["additionalProperties"] is False
+        assert inputs["properties"]["replicas"] == {"type": "number", "minimum": 1, "description": "Replicas"}
+        assert inputs["properties"]["environment"]["enum"] == ["production", "staging"]
+        assert inputs["properties"]["cluster"]["description"] == "The identifier of a 'cluster' entity"
+        assert inputs["properties"]["reviewers"]["items"] == {"type": "string"}
+        assert "get_action" not in tool.description
+        # The schema is generated once per tool
+        assert tool.input_schema_json is schema
+
+    def test_arguments_are_validated_locally(self, mock_client_for_dynamic_actions, scale_action):
+        """Test that arguments not matching the user inputs are rejected."""
+        tool = DynamicActionToolsManager(mock_client_for_dynamic_actions)._create_dynamic_action_tool(scale_action)
+
+        with pytest.raises(ValueError) as error:
+            tool.validate_input(
+                {"entity_identifier": "payments", "properties": {"replicas": "3", "environment": "qa", "size": 1}}
+            )
+
+        message = str(error.value)
+        assert "'float_type', 'loc': ('properties', 'replicas')" in message
+        assert "'literal_error', 'loc': ('properties', 'environment')" in message
+        assert "'extra_forbidden', 'loc': ('properties', 'size')" in message
+
+    @pytest.mark.asyncio
+    async def test_given_inputs_are_sent(self, mock_client_for_dynamic_actions, scale_action):
+        """Test that the validated inputs are sent as they were given."""
+        tool = DynamicActionToolsManager(mock_client_for_dynamic_actions)._create_dynamic_action_tool(scale_action)
+
+        await tool.function(
+            tool.validate_input({"entity_identifier": "payments", "properties": {"replicas": 3, "reviewers": ["jane"]}})
+        )
+
+        mock_client_for_dynamic_actions.create_entity_action_run.assert_awaited_once_with(
+            action_identifier="scaleService",
+            entity="payments",
+            properties={"replicas": 3, "reviewers": ["jane"]},
+        )
+
+    def test_actions_without_required_inputs_accept_no_properties(self, mock_client_for_dynamic_actions):
+        """Test that properties are optional when no user input is required."""
+        action = Action.model_validate(
+            {
+                "identifier": "restartAll",
+                "title": "Restart All",
+                "trigger": {
+                    "type": "self-service",
+                    "operation": "CREATE",
+                    "userInputs": {"properties": {"force": {"type": "boolean"}}, "required": []},
+                },
+                "invocationMethod": {"type": "KAFKA"},
+            },
+            strict=False,
+        )
+        tool = DynamicActionToolsManager(mock_client_for_dynamic_actions)._create_dynamic_action_tool(action)
+
+        assert "required" not in tool.input_schema_json
+        assert tool.validate_input({}).properties is None
+
+    def test_dynamic_enums_accept_any_value_of_their_type(self, mock_client_for_dynamic_actions):
+        """Test that inputs whose options come from a jq query only check the input's type."""
+        action = Action.model_validate(
+            {
+                "identifier": "deploy",
+                "title": "Deploy",
+                "trigger": {
+                    "type": "self-service",
+                    "operation": "CREATE",
+                    "userInputs": {
+                        "properties": {
+                            "environment": {"type": "string", "enum": {"jqQuery": "[.environments[].name]"}}
+                        },
+                        "required": ["environment"],
+                    },
+                },
+                "invocationMethod": {"type": "KAFKA"},
+            },
+            strict=False,
+        )
+        tool = DynamicActionToolsManager(mock_client_for_dynamic_actions)._create_dynamic_action_tool(action)
+
+        assert tool.validate_input({"properties": {"environment": "dev"}}).properties.model_dump() == {"environment": "dev"}
+        with pytest.raises(ValueError, match="string_type"):
+            tool.validate_input({"properties": {"environment": 1}})
+
+    def test_actions_whose_inputs_fail_to_build_keep_the_generic_schema(self, mock_client_for_dynamic_actions):
+        """Test that an action stays runnable when its user inputs can't be turned into a schema."""
+        action = Action.model_validate(
+            {
+                "identifier": "deploy",
+                "title": "Deploy",
+                "trigger": {
+                    "type": "self-service",
+                    "operation": "CREATE",
+                    "userInputs": {"properties": {"version": {"type": "string", "minLength": "one"}}, "required": []},
+                },
+                "invocationMethod": {"type": "KAFKA"},
+            },
+            strict=False,
+        )
+
+        tools = DynamicActionToolsManager(mock_client_for_dynamic_actions).create_dynamic_action_tools([action])
+
+        assert [tool.name for tool in tools] == ["run_deploy"]
+        assert tools[0].input_schema is DynamicActionToolSchema
+        assert "get_action" in tools[0].description
@@ -1,6 +1,7 @@
 import pytest
 
 from src.models.actions import Action
+from src.models.actions.action import ActionSummary
 from src.tools.action import ListActionsTool
 
 
@@ -67,3 +68,18 @@ async def test_list_actions_tool_with_defaults(mock_client_with_actions):
     result = await tool.list_actions(tool.validate_input(schema))
     mock_client_with_actions.get_all_actions.assert_awaited_once_with("self-service")
     assert result is not None
+
+
+@pytest.mark.asyncio
+async def test_list_actions_tool_summary(mock_client_with_actions):
+    """Test that detailed=False returns the action summaries without fetching the full actions."""
+    mock_client_with_actions.get_action_summaries.return_value = [
+        ActionSummary(identifier="test-action-1", title="Test Action 1", blueprint="service")
+    ]
+    tool = ListActionsTool(mock_client_with_actions)
+
+    result = await tool.list_actions(tool.validate_input({"detailed": False}))
+
+    mock_client_with_actions.get_action_summaries.assert_awaited_once_with("self-service")
+    mock_client_with_actions.get_all_actions.assert_not_awaited()
+    assert result == {"actions": [{"identifier": "test-action-1", "title": "Test Action 1", "blueprint": "service"}]}
@@ -1,8 +1,18 @@
+import asyncio
+import base64
+
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
+
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+from mcp.types import RequestParams
 
+from src.client.action_run_poller import ActionRunPoller, WatchedRun
 from src.models.action_run import ActionRun
 from src.tools.action import TrackActionRunTool
+from src.tools.action.track_action_run import TrackActionRunToolSchema, decode_resume_token, encode_resume_token
+from src.utils import PortError
 
 
 @pytest.fixture
@@ -106,3 +116,112 @@ async def test_track_action_run_tool_failure_status(mock_client):
 
     assert result is not None
     assert result["action_run"]["status"] == "FAILURE"
+
+
+def fast_props(**kwargs) -> TrackActionRunToolSchema:
+    """Build the tool input with sub-second poll intervals, which the schema doesn't allow."""
+    props = {"run_id": "run-789", "poll_interval": 0.01, "max_poll_interval": 0.04, "timeout": 5}
+    return TrackActionRunToolSchema.model_construct(**{**props, **kwargs})
+
+
+def make_run(status: str) -> ActionRun:
+    return ActionRun.construct(id="run-789", status=status, action={"identifier": "test-action", "title": "Test Action"})
+
+
+@pytest.mark.asyncio
+async def test_track_action_run_tool_polls_in_progress_run(mock_client_for_track_in_progress):
+    """Test that tracking polls until the run finishes, without an extra initial request."""
+    tool = TrackActionRunTool(mock_client_for_track_in_progress)
+
+    result = await tool.track_action_run(fast_props(run_id="run-456"))
+
+    assert result["action_run"]["status"] == "SUCCESS"
+    assert mock_client_for_track_in_progress.get_action_run.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_track_action_run_tool_shares_polls_between_trackers(mock_client):
+    """Test that concurrent trackers of the same run share one poll per status."""
+    mock_client.get_action_run.side_effect = [make_run("IN_PROGRESS"), make_run("SUCCESS")]
+    tool = TrackActionRunTool(mock_client)
+
+    results = await asyncio.gather(*(tool.track_action_run(fast_props()) for _ in range(5)))
+
+    assert [result["action_run"]["status"] for result in results] == ["SUCCESS"] * 5
+    assert mock_client.get_action_run.await_count == 2
+    assert tool.poller.watched_run_ids == []
+
+
+@pytest.mark.asyncio
+async def test_action_run_poller_backs_off_while_unchanged(mock_client):
+    """Test that the poll interval doubles while the status is unchanged and resets on a change."""
+    statuses = ["IN_PROGRESS", "IN_PROGRESS", "IN_PROGRESS", "IN_PROGRESS", "WAITING_FOR_APPROVAL"]
+    mock_client.get_action_run.side_effect = [make_run(status) for status in statuses]
+    poller = ActionRunPoller(mock_client.get_action_run)
+    run = WatchedRun("run-789", poll_interval=1, max_poll_interval=4, interval=1)
+
+    intervals = []
+    for _ in statuses:
+        await poller._poll(run)
+        intervals.append(run.interval)
+
+    assert intervals == [1, 2, 4, 4, 1]
+
+
+@pytest.mark.asyncio
+async def test_track_action_run_tool_returns_resume_token_on_timeout(mock_client):
+    """Test that the timeout returns the latest status with a resume token that continues tracking."""
+    mock_client.get_action_run.return_value = make_run("IN_PROGRESS")
+    tool = TrackActionRunTool(mock_client)
+
+    result = await tool.track_action_run(tool.validate_input({"run_id": "run-789", "timeout": 0}))
+
+    assert result["action_run"]["status"] == "IN_PROGRESS"
+    assert result["timed_out"] is True
+    assert decode_resume_token(result["resume_token"]) == {"run_id": "run-789", "status": "IN_PROGRESS", "poll_interval": 1}
+
+    mock_client.get_action_run.return_value = make_run("SUCCESS")
+    resumed = await tool.track_action_run(fast_props(resume_token=result["resume_token"]))
+
+    assert resumed["action_run"]["status"] == "SUCCESS"
+    assert "resume_token" not in resumed
+
+
+@pytest.mark.asyncio
+async def test_track_action_run_tool_rejects_resume_token_of_other_run(mock_client):
+    """Test that a resume token can't be used to track a different run."""
+    tool = TrackActionRunTool(mock_client)
+    token = encode_resume_token("run-other", "IN_PROGRESS", 2)
+
+    with pytest.raises(PortError):
+        await tool.track_action_run(tool.validate_input({"run_id": "run-789", "resume_token": token}))
+
+
+@pytest.mark.parametrize("state", ["not base64!", "[1, 2]", "42", '"run-789"'])
+def test_decode_resume_token_rejects_tokens_without_state(state):
+    """Test that tokens that don't decode to a JSON object are reported as invalid."""
+    token = state if state == "not base64!" else base64.urlsafe_b64encode(state.encode()).decode()
+
+    with pytest.raises(PortError, match="Invalid resume token"):
+        decode_resume_token(token)
+
+
+@pytest.mark.asyncio
+async def test_track_action_run_tool_reports_status_changes(mock_client):
+    """Test that every status change is sent as a progress notification."""
+    mock_client.get_action_run.side_effect = [make_run("IN_PROGRESS"), make_run("IN_PROGRESS"), make_run("SUCCESS")]
+    tool = TrackActionRunTool(mock_client)
+    session = MagicMock()
+    session.send_notification = AsyncMock()
+    ctx = RequestContext(request_id=1, meta=RequestParams.Meta(progressToken="progress-1"), session=session, lifespan_context=None)
+
+    token = request_ctx.set(ctx)
+    try:
+        await tool.track_action_run(fast_props())
+    finally:
+        request_ctx.reset(token)
+
+    notifications = [call.args[0].root.params for call in session.send_notification.await_args_list]
+    assert [params.progress for params in notifications] == [1, 2]
+    assert all(params.progressToken == "progress-1" for params in notifications)
+    assert "SUCCESS" in notifications[-1].message
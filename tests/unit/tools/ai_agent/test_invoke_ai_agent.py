@@ -2,8 +2,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.models.agent import PortAgentResponse, PortAgentStreamChunk
 from src.models.agent.port_agent_response import PortAgentInvocation, PortAgentTriggerResponse
-from src.tools.ai_agent import InvokeAIAGentTool
+from src.tools.ai_agent import GetAIAgentInvocationTool, InvokeAIAGentTool
 from src.utils.errors import PortError
 
 
@@ -78,13 +79,14 @@ async def test_invoke_ai_agent_tool_timeout(mock_client_for_timeout):
     # Mock the asyncio.sleep to avoid actual delay in tests
     with patch("asyncio.sleep", AsyncMock()):
         # Test function execution with a prompt
-        schema = {"prompt": "Test prompt that will timeout"}
+        schema = {"prompt": "Test prompt that will timeout", "timeout": 0}
         result = await tool.invoke_ai_agent(tool.validate_input(schema))
 
         # Verify the result indicates a timeout
         assert result["invocation_id"] == "test-invocation-id"
         assert result["invocation_status"] == "timed_out"
         assert "timed out" in result["message"]
+        assert "test-invocation-id" in result["message"]
 
 
 @pytest.fixture
@@ -106,4 +108,107 @@ async def test_invoke_ai_agent_tool_error_handling(mock_client_for_error):
     with pytest.raises(PortError) as excinfo:
         await tool.invoke_ai_agent(tool.validate_input(schema))
     
-    assert "invocation identifier" in str(excinfo.value)
\ No newline at end of file
+    assert "invocation identifier" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_invoke_ai_agent_tool_async_mode(mock_client_for_ai_agent):
+    """Test that async mode returns the invocation id without polling."""
+    tool = InvokeAIAGentTool(mock_client_for_ai_agent)
+
+    result = await tool.invoke_ai_agent(tool.validate_input({"prompt": "Test prompt", "mode": "async"}))
+
+    assert result["invocation_id"] == "test-invocation-id"
+    assert result["invocation_status"] == "in_progress"
+    assert "get_ai_agent_invocation" in result["message"]
+    mock_client_for_ai_agent.get_invocation_status.assert_not_awaited()
+
+
+def make_status(status: str, output: str) -> MagicMock:
+    status_obj = MagicMock()
+    status_obj.status = status
+    status_obj.output = output
+    status_obj.selected_agent = "test-agent"
+    return status_obj
+
+
+@pytest.mark.asyncio
+async def test_invoke_ai_agent_tool_backs_off_between_polls(mock_client_for_ai_agent):
+    """Test that polling starts fast and backs off while the agent is working."""
+    mock_client_for_ai_agent.get_invocation_status.side_effect = [
+        make_status("in_progress", ""),
+        make_status("in_progress", ""),
+        make_status("in_progress", ""),
+        make_status("completed", "Done"),
+    ]
+    tool = InvokeAIAGentTool(mock_client_for_ai_agent)
+    sleep = AsyncMock()
+
+    with patch("src.tools.ai_agent.invocation.asyncio.sleep", sleep):
+        result = await tool.invoke_ai_agent(tool.validate_input({"prompt": "Test prompt"}))
+
+    assert result["message"] == "Done"
+    assert [call.args[0] for call in sleep.await_args_list] == [0.5, 0.75, 1.125]
+
+
+@pytest.mark.asyncio
+async def test_invoke_ai_agent_tool_stream_mode_relays_streamed_output(mock_client_for_ai_agent):
+    """Test that stream mode relays every chunk of the stream as a progress notification."""
+
+    async def stream_agent(prompt, on_chunk):
+        await on_chunk(PortAgentStreamChunk(identifier="test-invocation-id"))
+        await on_chunk(PortAgentStreamChunk(identifier="test-invocation-id", text="Looking"))
+        await on_chunk(PortAgentStreamChunk(identifier="test-invocation-id", text=" up services"))
+        return PortAgentResponse(identifier="test-invocation-id", status="completed", output="Looking up services")
+
+    mock_client_for_ai_agent.stream_agent = AsyncMock(side_effect=stream_agent)
+    tool = InvokeAIAGentTool(mock_client_for_ai_agent)
+
+    with patch("src.tools.ai_agent.invocation.report_progress", AsyncMock()) as report_progress:
+        result = await tool.invoke_ai_agent(tool.validate_input({"prompt": "Test prompt", "mode": "stream"}))
+
+    mock_client_for_ai_agent.trigger_agent.assert_not_awaited()
+    mock_client_for_ai_agent.get_invocation_status.assert_not_awaited()
+    assert result["invocation_id"] == "test-invocation-id"
+    assert result["message"] == "Looking up services"
+    assert [call.kwargs["message"] for call in report_progress.await_args_list] == ["Looking", " up services"]
+
+
+@pytest.mark.asyncio
+async def test_invoke_ai_agent_tool_stream_mode_polls_when_not_streamed(mock_client_for_ai_agent):
+    """Test that stream mode falls back to relaying the new output of every poll."""
+    mock_client_for_ai_agent.stream_agent = AsyncMock(
+        return_value=mock_client_for_ai_agent.trigger_agent.return_value
+    )
+    mock_client_for_ai_agent.get_invocation_status.side_effect = [
+        make_status("in_progress", "Looking"),
+        make_status("in_progress", "Looking up services"),
+        make_status("completed", "Looking up services. Found 3"),
+    ]
+    tool = InvokeAIAGentTool(mock_client_for_ai_agent)
+
+    with (
+        patch("src.tools.ai_agent.invocation.asyncio.sleep", AsyncMock()),
+        patch("src.tools.ai_agent.invocation.report_progress", AsyncMock()) as report_progress,
+    ):
+        result = await tool.invoke_ai_agent(tool.validate_input({"prompt": "Test prompt", "mode": "stream"}))
+
+    assert result["message"] == "Looking up services. Found 3"
+    assert [call.kwargs["message"] for call in report_progress.await_args_list] == [
+        "Looking",
+        " up services",
+        ". Found 3",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_ai_agent_invocation_tool(mock_client_for_timeout):
+    """Test that the status tool returns the current status without waiting by default."""
+    tool = GetAIAgentInvocationTool(mock_client_for_timeout)
+
+    assert tool.name == "get_ai_agent_invocation"
+    result = await tool.get_ai_agent_invocation(tool.validate_input({"invocation_id": "test-invocation-id"}))
+
+    mock_client_for_timeout.get_invocation_status.assert_awaited_once_with("test-invocation-id")
+    assert result["invocation_status"] == "in_progress"
+    assert result["message"] == "Still processing..."
@@ -0,0 +1,120 @@
+import anyio
+import pytest
+from pydantic import Field
+
+from src.models.common.annotations import Annotations
+from src.models.common.base_pydantic import BaseModel
+from src.models.tools import ToolMap
+from src.models.tools.tool import Tool
+from src.tools.batch import BatchTool
+
+
+class EchoSchema(BaseModel):
+    value: int = Field(..., description="The value to echo")
+
+
+class EchoResponse(BaseModel):
+    value: int = Field(..., description="The echoed value")
+
+
+def make_tool(name: str, function) -> Tool:
+    return Tool(
+        name=name,
+        description=f"The {name} tool",
+        function=function,
+        input_schema=EchoSchema,
+        output_schema=EchoResponse,
+        annotations=Annotations(
+            title=name, readOnlyHint=True, destructiveHint=False, idempotentHint=True, openWorldHint=False
+        ),
+    )
+
+
+@pytest.fixture
+def tools():
+    running = {"now": 0, "max": 0}
+
+    async def echo(props: EchoSchema) -> dict:
+        running["now"] += 1
+        running["max"] = max(running["max"], running["now"])
+        await anyio.sleep(0.01)
+        running["now"] -= 1
+        return {"value": props.value}
+
+    async def fail(props: EchoSchema) -> dict:
+        raise RuntimeError(f"Failed for {props.value}")
+
+    return {"echo": make_tool("echo", echo), "fail": make_tool("fail", fail)}, running
+
+
+def get_tool_from(tools: dict[str, Tool]):
+    def get_tool(name: str) -> Tool:
+        if name not in tools:
+            raise ValueError(f"Tool not found: {name}")
+        return tools[name]
+
+    return get_tool
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_calls_concurrently_up_to_the_limit(tools):
+    tools, running = tools
+    batch = BatchTool(get_tool_from(tools), max_concurrency=3)
+
+    calls = [{"tool_name": "echo", "arguments": {"value": i}} for i in range(10)]
+    result = await batch.batch(batch.validate_input({"calls": calls}))
+
+    assert [call["result"] for call in result["results"]] == [{"value": i} for i in range(10)]
+    assert all(call["ok"] for call in result["results"])
+    assert running["max"] == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_errors_per_call(tools):
+    tools, _ = tools
+    batch = BatchTool(get_tool_from(tools))
+
+    calls = [
+        {"tool_name": "echo", "arguments": {"value": 1}},
+        {"tool_name": "echo", "arguments": {"value": "not a number"}},
+        {"tool_name": "missing", "arguments": {}},
+        {"tool_name": "fail", "arguments": {"value": 4}},
+        {"tool_name": "batch", "arguments": {"calls": []}},
+    ]
+    result = await batch.batch(batch.validate_input({"calls": calls}))
+
+    outcomes = result["results"]
+    assert outcomes[0] == {"tool_name": "echo", "ok": True, "result": {"value": 1}}
+    assert not outcomes[1]["ok"] and "Invalid input" in outcomes[1]["error"]
+    assert outcomes[2] == {"tool_name": "missing", "ok": False, "error": "Tool not found: missing"}
+    assert not outcomes[3]["ok"] and "Failed for 4" in outcomes[3]["error"]
+    assert outcomes[4] == {"tool_name": "batch", "ok": False, "error": "Batches can't be nested"}
+
+
+def test_tool_map_registers_batch_tool(mock_client):
+    tool_map = ToolMap(port_client=mock_client, batch_max_concurrency=7)
+
+    batch = tool_map.get_tool("batch")
+
+    assert isinstance(batch, BatchTool)
+    assert batch.max_concurrency == 7
+    assert batch.get_tool("get_entity") is tool_map.tools["get_entity"]
+
+
+@pytest.mark.asyncio
+async def test_batch_shares_the_response_budget_between_calls():
+    async def many(props: EchoSchema) -> dict:
+        return {"values": list(range(props.value))}
+
+    batch = BatchTool(get_tool_from({"many": make_tool("many", many)}), max_response_bytes=2_000)
+
+    result = await batch.batch(
+        batch.validate_input(
+            {"calls": [{"tool_name": "many", "arguments": {"value": 1000}}, {"tool_name": "many", "arguments": {"value": 3}}]}
+        )
+    )
+
+    large, small = result["results"]
+    assert len(large["result"]["values"]) < 1000
+    assert large["result"]["_truncated"]["lists"][0]["total"] == 1000
+    assert small["result"] == {"values": [0, 1, 2]}
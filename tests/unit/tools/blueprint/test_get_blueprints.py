@@ -1,6 +1,7 @@
 import pytest
 
 from src.models import Blueprint
+from src.models.blueprints import BlueprintSummary
 from src.tools.blueprint import GetBlueprintsTool
 
 
@@ -34,3 +35,19 @@ async def test_get_blueprints_tool(mock_client_with_blueprints):
     result = await tool.get_blueprints(tool.validate_input(schema))
     mock_client_with_blueprints.get_blueprints.assert_awaited_once()
     assert "blueprints" in result
+
+
+@pytest.mark.asyncio
+async def test_get_blueprints_tool_summary(mock_client_with_blueprints):
+    """Test that detailed=False returns the summaries instead of the full blueprints."""
+    mock_client_with_blueprints.get_blueprint_summaries.return_value = [
+        BlueprintSummary(identifier="service", title="Service", properties=["language"], relations=["domain"])
+    ]
+    tool = GetBlueprintsTool(mock_client_with_blueprints)
+
+    result = await tool.get_blueprints(tool.validate_input({"detailed": False}))
+
+    mock_client_with_blueprints.get_blueprints.assert_not_awaited()
+    assert result == {
+        "blueprints": [{"identifier": "service", "title": "Service", "properties": ["language"], "relations": ["domain"]}]
+    }
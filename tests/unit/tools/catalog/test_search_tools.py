@@ -0,0 +1,67 @@
+import pytest
+
+from src.models.actions import Action
+from src.models.tools.tool_index import ToolIndex, tokenize
+from src.tools.action.dynamic_actions import DynamicActionToolsManager
+from src.tools.catalog import SearchToolsTool
+
+
+def make_action(identifier: str, title: str, description: str | None = None, blueprint: str | None = None) -> Action:
+    return Action.model_validate(
+        {
+            "identifier": identifier,
+            "title": title,
+            "description": description,
+            "trigger": {"type": "self-service", "operation": "DAY-2", "blueprintIdentifier": blueprint},
+            "invocationMethod": {"type": "KAFKA"},
+        }
+    )
+
+
+ACTIONS = [
+    make_action("createJiraIssue", "Create Jira Issue", "Opens a ticket for the team"),
+    make_action("deployService", "Deploy", "Deploys a new version", blueprint="service"),
+    make_action("scaleDeployment", "Scale", "Changes the number of replicas", blueprint="k8s_workload"),
+    make_action("rollbackService", "Rollback", "Deploys the previous version", blueprint="service"),
+]
+
+
+@pytest.fixture
+def index() -> ToolIndex:
+    return ToolIndex({DynamicActionToolsManager.get_tool_name(action): action for action in ACTIONS})
+
+
+def test_tokenize_splits_identifiers():
+    assert tokenize("createJiraIssue") == ["create", "jira", "issue"]
+    assert tokenize("k8s_workload, Deploy-Service!") == ["k8s", "workload", "deploy", "service"]
+
+
+def test_search_ranks_identifier_and_title_matches_first(index):
+    # Matching the identifier or title counts more than matching the description
+    assert index.search("deploy") == ["run_deploy_service", "run_scale_deployment", "run_rollback_service"]
+    # Tools matching more of the query's words come first
+    assert index.search("service version")[:2] == ["run_deploy_service", "run_rollback_service"]
+    assert index.search("workload") == ["run_scale_deployment"]
+    assert index.search("kubernetes") == []
+    assert index.search("deploy", limit=1) == ["run_deploy_service"]
+    assert len(index) == 4
+
+
+@pytest.mark.asyncio
+async def test_search_tools_tool_returns_found_tools_with_schemas(mock_client):
+    tools = DynamicActionToolsManager(mock_client).create_dynamic_action_tools(ACTIONS)
+    queries = []
+
+    async def search(query: str, limit: int):
+        queries.append((query, limit))
+        return tools[:1]
+
+    tool = SearchToolsTool(search)
+    result = await tool.search_tools(tool.validate_input({"query": "jira"}))
+
+    assert tool.name == "search_tools"
+    assert queries == [("jira", 10)]
+    assert result["tools"][0]["name"] == "run_create_jira_issue"
+    assert result["tools"][0]["input_schema"] == tools[0].input_schema_json
+    with pytest.raises(ValueError):
+        tool.validate_input({"query": ""})
@@ -18,9 +18,16 @@ def mock_client():
     client.get_entity = AsyncMock()
     client.get_entities = AsyncMock()
     client.search_entities = AsyncMock()
+    client.get_entities_by_ids = AsyncMock()
+    client.aggregate_entities = AsyncMock()
+    client.get_blueprint_summaries = AsyncMock()
+    client.get_action_summaries = AsyncMock()
     client.create_entity = AsyncMock()
     client.update_entity = AsyncMock()
     client.delete_entity = AsyncMock()
+    client.bulk_upsert_entities = AsyncMock()
+    client.find_entity_identifiers = AsyncMock()
+    client.bulk_delete_entities = AsyncMock()
 
     client.get_scorecard = AsyncMock()
     client.get_scorecards = AsyncMock()
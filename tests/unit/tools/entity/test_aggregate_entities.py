@@ -0,0 +1,50 @@
+import pytest
+
+from src.models.entities import EntityAggregation, EntityGroup, MetricStats
+from src.tools.entity import AggregateEntitiesTool
+
+
+@pytest.fixture
+def mock_client_for_aggregate_entities(mock_client):
+    """Add specific return values for this test"""
+    mock_client.aggregate_entities.return_value = EntityAggregation(
+        total=3,
+        metrics={"latency": MetricStats(count=3, min=10, max=30, avg=20)},
+        groups=[EntityGroup(value="gold", count=2), EntityGroup(value=None, count=1)],
+    )
+    return mock_client
+
+
+@pytest.mark.asyncio
+async def test_aggregate_entities_tool(mock_client_for_aggregate_entities):
+    """Test that the tool defaults to all entities of the blueprint and returns only the summary."""
+    tool = AggregateEntitiesTool(mock_client_for_aggregate_entities)
+
+    assert tool.name == "aggregate_entities"
+
+    schema = {"blueprint_identifier": "service", "group_by": "tier", "metrics": ["latency"]}
+    result = await tool.aggregate_entities(tool.validate_input(schema))
+
+    mock_client_for_aggregate_entities.aggregate_entities.assert_awaited_once_with(
+        "service",
+        {"combinator": "and", "rules": [{"property": "$blueprint", "operator": "=", "value": "service"}]},
+        "tier",
+        ["latency"],
+        50,
+    )
+    assert result["total"] == 3
+    assert result["metrics"]["latency"]["avg"] == 20
+    assert result["groups"] == [{"value": "gold", "count": 2}, {"count": 1}]
+
+
+@pytest.mark.asyncio
+async def test_aggregate_entities_tool_with_query(mock_client_for_aggregate_entities):
+    tool = AggregateEntitiesTool(mock_client_for_aggregate_entities)
+    query = {"combinator": "and", "rules": [{"property": "$team", "operator": "in", "value": ["platform"]}]}
+
+    await tool.aggregate_entities(tool.validate_input({"blueprint_identifier": "service", "query": query}))
+
+    assert mock_client_for_aggregate_entities.aggregate_entities.await_args.args[1] == query
+
+    with pytest.raises(ValueError):
+        tool.validate_input({"blueprint_identifier": "service", "max_groups": 0})
@@ -0,0 +1,76 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.models.entities import BulkEntityResult
+from src.tools.entity import BulkDeleteEntitiesTool
+
+QUERY = {"combinator": "and", "rules": [{"property": "stale", "operator": "=", "value": "true"}]}
+
+
+@pytest.fixture
+def mock_client_for_bulk_delete(mock_client):
+    """Add specific return values for this test"""
+    mock_client.find_entity_identifiers.return_value = [f"service-{i}" for i in range(30)]
+
+    async def bulk_delete_entities(blueprint, identifiers, delete_dependents, on_progress):
+        await on_progress(len(identifiers))
+        return [
+            BulkEntityResult(index=i, identifier=identifier, ok=i != 0, error="Has dependents" if i == 0 else None)
+            for i, identifier in enumerate(identifiers)
+        ]
+
+    mock_client.bulk_delete_entities.side_effect = bulk_delete_entities
+    return mock_client
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_entities_tool_by_query(mock_client_for_bulk_delete):
+    """Test that the tool resolves the query, deletes the matches and reports the failures."""
+    tool = BulkDeleteEntitiesTool(mock_client_for_bulk_delete)
+
+    assert tool.name == "bulk_delete_entities"
+    assert tool.annotations.destructive_hint is True
+
+    with patch("src.tools.entity.bulk_delete_entities.report_progress", AsyncMock()) as report_progress:
+        result = await tool.bulk_delete_entities(tool.validate_input({"blueprint_identifier": "service", "query": QUERY}))
+
+    mock_client_for_bulk_delete.find_entity_identifiers.assert_awaited_once_with("service", QUERY)
+    report_progress.assert_awaited_once_with(30, total=30, message="Deleted 30/30 entities")
+    assert result["matched"] == 30
+    assert result["deleted"] == 29
+    assert result["failures"] == [{"index": 0, "identifier": "service-0", "ok": False, "error": "Has dependents"}]
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_entities_tool_dry_run(mock_client_for_bulk_delete):
+    """Test that a dry run only counts the matching entities."""
+    tool = BulkDeleteEntitiesTool(mock_client_for_bulk_delete)
+
+    result = await tool.bulk_delete_entities(
+        tool.validate_input({"blueprint_identifier": "service", "query": QUERY, "dry_run": True})
+    )
+
+    mock_client_for_bulk_delete.bulk_delete_entities.assert_not_awaited()
+    assert result["matched"] == 30
+    assert len(result["sample"]) == 20
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_entities_tool_dedupes_identifiers(mock_client_for_bulk_delete):
+    tool = BulkDeleteEntitiesTool(mock_client_for_bulk_delete)
+
+    await tool.bulk_delete_entities(
+        tool.validate_input({"blueprint_identifier": "service", "entity_identifiers": ["a", "b", "a"]})
+    )
+
+    assert mock_client_for_bulk_delete.bulk_delete_entities.await_args.args[1] == ["a", "b"]
+    mock_client_for_bulk_delete.find_entity_identifiers.assert_not_awaited()
+
+
+@pytest.mark.parametrize("target", [{}, {"entity_identifiers": ["a"], "query": QUERY}])
+def test_bulk_delete_entities_tool_requires_one_target(mock_client, target):
+    tool = BulkDeleteEntitiesTool(mock_client)
+
+    with pytest.raises(ValueError, match="Provide either entity_identifiers or query"):
+        tool.validate_input({"blueprint_identifier": "service", **target})
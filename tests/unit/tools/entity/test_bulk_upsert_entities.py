@@ -0,0 +1,39 @@
+import pytest
+
+from src.models.entities import BulkEntityResult
+from src.tools.entity import BulkUpsertEntitiesTool
+
+
+@pytest.fixture
+def mock_client_for_bulk_upsert(mock_client):
+    """Add specific return values for this test"""
+    mock_client.bulk_upsert_entities.return_value = [
+        BulkEntityResult(index=0, identifier="service-a", ok=True),
+        BulkEntityResult(index=1, identifier="service-b", ok=False, error="Invalid property"),
+    ]
+    return mock_client
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_entities_tool(mock_client_for_bulk_upsert):
+    """Test the BulkUpsertEntitiesTool's metadata and function execution."""
+    tool = BulkUpsertEntitiesTool(mock_client_for_bulk_upsert)
+
+    assert tool.name == "bulk_upsert_entities"
+
+    schema = {
+        "blueprint_identifier": "service",
+        "entities": [{"identifier": "service-a", "title": "A"}, {"identifier": "service-b"}],
+    }
+    result = await tool.bulk_upsert_entities(tool.validate_input(schema))
+
+    blueprint, entities, query = mock_client_for_bulk_upsert.bulk_upsert_entities.await_args.args
+    assert blueprint == "service"
+    assert entities == [{"identifier": "service-a", "title": "A"}, {"identifier": "service-b"}]
+    # Upserting and merging is the point of the tool, so they're on unless turned off
+    assert query["upsert"] is True
+    assert query["merge"] is True
+    assert result["succeeded"] == 1
+    assert result["failed"] == 1
+    # Only the failed entities are listed, like bulk_delete_entities does
+    assert result["failures"] == [{"index": 1, "identifier": "service-b", "ok": False, "error": "Invalid property"}]
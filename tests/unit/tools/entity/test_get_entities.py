@@ -1,6 +1,7 @@
 import pytest
 
 from src.models import EntityResult
+from src.models.entities import EntitySort
 from src.tools.entity import GetEntitiesTool
 
 
@@ -96,3 +97,121 @@ async def test_get_entities_tool_default_detailed(mock_client_with_entities):
     assert result is not None
     assert "entities" in result
     assert result["entities"][0]["blueprint"] == "test-blueprint"
+
+
+@pytest.mark.asyncio
+async def test_get_entities_tool_filters_at_the_api(mock_client_with_entities):
+    """Test that search rules, the include projection, sort and limit are passed on to the search."""
+    tool = GetEntitiesTool(mock_client_with_entities)
+
+    schema = {
+        "blueprint_identifier": "test-blueprint",
+        "include": ["$identifier", "properties.tier"],
+        "query": {
+            "combinator": "and",
+            "rules": [
+                {"property": "tier", "operator": "!=", "value": "bronze"},
+                {"property": "owner", "operator": "isNotEmpty"},
+                {"operator": "relatedTo", "blueprint": "domain", "value": "payments", "direction": "upstream"},
+            ],
+        },
+        "sort": {"property": "$updatedAt", "order": "desc"},
+        "limit": 10,
+    }
+    await tool.get_entities(tool.validate_input(schema))
+
+    mock_client_with_entities.search_entities.assert_awaited_once_with(
+        blueprint_identifier="test-blueprint",
+        query={
+            "combinator": "and",
+            "rules": [
+                {"property": "$blueprint", "operator": "=", "value": "test-blueprint"},
+                {"property": "tier", "operator": "!=", "value": "bronze"},
+                {"property": "owner", "operator": "isNotEmpty"},
+                {"operator": "relatedTo", "blueprint": "domain", "value": "payments", "direction": "upstream"},
+            ],
+        },
+        include=["$identifier", "properties.tier"],
+        limit=10,
+        sort=EntitySort(property="$updatedAt", order="desc"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_entities_tool_nests_or_queries(mock_client_with_entities):
+    tool = GetEntitiesTool(mock_client_with_entities)
+    filters = {
+        "combinator": "or",
+        "rules": [
+            {"property": "tier", "operator": "in", "value": ["gold", "silver"]},
+            {"combinator": "and", "rules": [{"property": "latency", "operator": "<", "value": 100}]},
+        ],
+    }
+
+    await tool.get_entities(tool.validate_input({"blueprint_identifier": "test-blueprint", "query": filters}))
+
+    query = mock_client_with_entities.search_entities.await_args.kwargs["query"]
+    assert query["rules"][1] == filters
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        {"property": "tier", "operator": "like", "value": "gold"},
+        {"property": "tier", "operator": "="},
+        {"operator": "relatedTo", "value": "payments"},
+    ],
+)
+def test_get_entities_tool_rejects_invalid_rules(mock_client_with_entities, rule):
+    tool = GetEntitiesTool(mock_client_with_entities)
+
+    with pytest.raises(ValueError):
+        tool.validate_input(
+            {"blueprint_identifier": "test-blueprint", "query": {"combinator": "and", "rules": [rule]}}
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_entities_tool_table_format(mock_client):
+    """Test that the table format lists the columns once and a row of values per entity."""
+    mock_client.search_entities.return_value = [
+        EntityResult(
+            identifier="payments",
+            title="Payments",
+            blueprint="service",
+            properties={"tier": "gold", "score": 90},
+            relations={"domain": "billing", "dependencies": ["ledger", "auth"]},
+        ),
+        EntityResult(
+            identifier="ledger",
+            title="Ledger",
+            blueprint="service",
+            team=["platform"],
+            properties={"language": "go"},
+            relations={"domain": None},
+        ),
+    ]
+    tool = GetEntitiesTool(mock_client)
+
+    result = await tool.get_entities(
+        tool.validate_input({"blueprint_identifier": "service", "detailed": True, "format": "table"})
+    )
+
+    assert "entities" not in result
+    assert result["table"] == {
+        "blueprint": "service",
+        "columns": [
+            "identifier",
+            "title",
+            "team",
+            "properties.tier",
+            "properties.score",
+            "properties.language",
+            "relations.domain",
+            "relations.dependencies",
+        ],
+        "rows": [
+            ["payments", "Payments", None, "gold", 90, None, ["billing"], ["ledger", "auth"]],
+            ["ledger", "Ledger", ["platform"], None, None, "go", [], []],
+        ],
+    }
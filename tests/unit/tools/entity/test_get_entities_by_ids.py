@@ -0,0 +1,43 @@
+import pytest
+
+from src.models.entities import EntityResult
+from src.tools.entity import GetEntitiesByIdsTool
+
+
+@pytest.fixture
+def mock_client_for_get_entities_by_ids(mock_client):
+    """Add specific return values for this test"""
+    mock_client.get_entities_by_ids.return_value = {
+        "service-a": EntityResult(identifier="service-a", title="A", blueprint="service"),
+        "service-c": EntityResult(identifier="service-c", title="C", blueprint="service"),
+    }
+    return mock_client
+
+
+@pytest.mark.asyncio
+async def test_get_entities_by_ids_tool(mock_client_for_get_entities_by_ids):
+    """Test that the tool returns the entities keyed by identifier and lists the misses."""
+    tool = GetEntitiesByIdsTool(mock_client_for_get_entities_by_ids)
+
+    assert tool.name == "get_entities_by_ids"
+
+    schema = {"blueprint_identifier": "service", "entity_identifiers": ["service-a", "service-b", "service-c", "service-a"]}
+    result = await tool.get_entities_by_ids(tool.validate_input(schema))
+
+    mock_client_for_get_entities_by_ids.get_entities_by_ids.assert_awaited_once_with(
+        "service", ["service-a", "service-b", "service-c"], None
+    )
+    assert list(result["entities"]) == ["service-a", "service-c"]
+    assert result["entities"]["service-a"]["title"] == "A"
+    assert result["missing"] == ["service-b"]
+
+
+@pytest.mark.asyncio
+async def test_get_entities_by_ids_tool_summary(mock_client_for_get_entities_by_ids):
+    tool = GetEntitiesByIdsTool(mock_client_for_get_entities_by_ids)
+
+    await tool.get_entities_by_ids(
+        tool.validate_input({"blueprint_identifier": "service", "entity_identifiers": ["service-a"], "detailed": False})
+    )
+
+    assert mock_client_for_get_entities_by_ids.get_entities_by_ids.await_args.args[2] == ["$identifier", "$title"]
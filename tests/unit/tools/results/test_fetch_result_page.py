@@ -0,0 +1,43 @@
+import pytest
+
+from src.models.tools import ToolMap
+from src.tools.results import FetchResultPageTool
+from src.utils.errors import PortError
+from src.utils.result_store import ResultStore
+
+
+@pytest.mark.asyncio
+async def test_fetch_result_page_tool():
+    """Test that the tool serves pages from the store with the offset of the next one."""
+    store = ResultStore()
+    handle = store.put([{"identifier": f"service-{i}"} for i in range(150)], 5000)
+    tool = FetchResultPageTool(store)
+
+    assert tool.name == "fetch_result_page"
+
+    first = await tool.fetch_result_page(tool.validate_input({"handle": handle, "offset": 40}))
+    last = await tool.fetch_result_page(tool.validate_input({"handle": handle, "offset": first["next_offset"]}))
+
+    assert first["items"][0] == {"identifier": "service-40"}
+    assert (first["offset"], first["total"], first["next_offset"]) == (40, 150, 140)
+    assert len(last["items"]) == 10
+    assert "next_offset" not in last
+
+
+@pytest.mark.asyncio
+async def test_fetch_result_page_tool_unknown_handle():
+    tool = FetchResultPageTool(ResultStore())
+
+    with pytest.raises(PortError, match="Call the original tool again"):
+        await tool.fetch_result_page(tool.validate_input({"handle": "expired"}))
+
+
+def test_tool_map_registers_fetch_result_page_tool(mock_client):
+    tool_map = ToolMap(port_client=mock_client)
+
+    tool = tool_map.get_tool("fetch_result_page")
+
+    assert isinstance(tool, FetchResultPageTool)
+    # Truncated batch results are paged from the same store
+    assert tool.result_store is tool_map.result_store
+    assert tool_map.get_tool("batch").result_store is tool_map.result_store